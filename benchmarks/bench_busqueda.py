@@ -0,0 +1,59 @@
+"""
+Benchmark de buscar_muebles_por_nombre: índice de trigramas frente a la
+búsqueda lineal original.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_busqueda.py [tamaño ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from models.concretos.silla import Silla  # noqa: E402
+from services.indices import IndiceTrigramas  # noqa: E402
+
+PALABRAS = ["Silla", "Clásica", "Oficina", "Moderna", "Rústica", "Sofá", "Roble",
+            "Nórdica", "Ejecutiva", "Vintage", "Plegable", "Jardín"]
+CONSULTAS = ["sofa", "oficina", "nordica eje", "roble", "xyz"]
+
+
+def busqueda_lineal(muebles, nombre):
+    """Implementación original: recorre todos los muebles en cada consulta."""
+    nombre_lower = nombre.lower().strip()
+    return [m for m in muebles if nombre_lower in m.nombre.lower()]
+
+
+def medir(funcion, repeticiones=5):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        for consulta in CONSULTAS:
+            funcion(consulta)
+    return (time.perf_counter() - inicio) / (repeticiones * len(CONSULTAS))
+
+
+def main(tamaños):
+    rnd = random.Random(42)
+    for n in tamaños:
+        muebles = [
+            Silla(" ".join(rnd.sample(PALABRAS, 3)) + f" {i}", "Madera", "Café", 100.0)
+            for i in range(n)
+        ]
+        inicio = time.perf_counter()
+        indice = IndiceTrigramas()
+        for clave, mueble in enumerate(muebles):
+            indice.agregar(clave, mueble.nombre, mueble)
+        construccion = time.perf_counter() - inicio
+        lineal = medir(lambda c: busqueda_lineal(muebles, c))
+        indexada = medir(indice.buscar)
+        print(
+            f"n={n:>9,}  construcción={construccion:8.2f}s  "
+            f"lineal={lineal * 1000:9.2f}ms  índice={indexada * 1000:9.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,70 @@
+"""
+Benchmark de memoria de varias tiendas en un mismo proceso, con y sin un
+Catalogo compartido.
+
+Cada tienda recibe los mismos productos, construidos de nuevo para cada una
+(como al cargar el mismo archivo de catálogo en todas). Sin catálogo cada
+tienda guarda sus propios muebles; con catálogo todas guardan referencias a
+las mismas definiciones.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_catalogo.py [tiendas] [productos]
+"""
+
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.catalogo import Catalogo  # noqa: E402
+from services.precios import KERNELS  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+from bench_memoria import argumentos_validos  # noqa: E402
+
+
+def medir(tiendas, plantillas, catalogo):
+    """Bytes asignados al crear las tiendas y cargar en cada una los productos."""
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    creadas = []
+    for t in range(tiendas):
+        tienda = TiendaMuebles(f"Tienda {t}", catalogo=catalogo)
+        tienda.agregar_muebles(clase(**argumentos) for clase, argumentos in plantillas)
+        creadas.append(tienda)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return despues - antes, creadas
+
+
+def main(tiendas, productos):
+    rnd = random.Random(7)
+    clases = list(KERNELS)
+    plantillas = []
+    for i in range(productos):
+        clase = clases[i % len(clases)]
+        argumentos = argumentos_validos(rnd, clase)
+        argumentos["nombre"] = f"{clase.__name__} {i}"
+        plantillas.append((clase, argumentos))
+
+    sin_catalogo, creadas = medir(tiendas, plantillas, None)
+    estadisticas = [tienda.obtener_estadisticas() for tienda in creadas]
+    del creadas
+    catalogo = Catalogo()
+    con_catalogo, creadas = medir(tiendas, plantillas, catalogo)
+    assert estadisticas == [tienda.obtener_estadisticas() for tienda in creadas]
+
+    print(f"{tiendas} tiendas x {productos:,} productos ({len(catalogo):,} en el catálogo)")
+    print(f"  sin catálogo: {sin_catalogo / 1e6:8.1f} MB")
+    print(f"  con catálogo: {con_catalogo / 1e6:8.1f} MB ({sin_catalogo / con_catalogo:.1f}x)")
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(
+        argumentos[0] if argumentos else 24,
+        argumentos[1] if len(argumentos) > 1 else 20_000,
+    )
@@ -0,0 +1,75 @@
+"""
+Benchmark de memoria: bytes por mueble de cada clase concreta y de un
+inventario mixto, medidos con tracemalloc.
+
+Todas las instancias de una clase comparten los valores de sus argumentos,
+de modo que se mide el costo del objeto (su layout) y no el de sus textos.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_memoria.py [tamaño]
+"""
+
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.catalogo import parametros_constructor  # noqa: E402
+from services.precios import KERNELS  # noqa: E402
+from verificar_precios import valor_aleatorio  # noqa: E402
+
+
+def argumentos_validos(rnd, clase):
+    """Argumentos de constructor con los que la clase calcula su precio."""
+    while True:
+        argumentos = {
+            parametro.name: valor_aleatorio(rnd, parametro)
+            for parametro in parametros_constructor(clase)
+        }
+        try:
+            clase(**argumentos).calcular_precio()
+            return argumentos
+        except ValueError:
+            continue
+
+
+def medir(fabrica, n):
+    """Bytes asignados por elemento al construir n objetos con fabrica(i)."""
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    objetos = [None] * n
+    lista = tracemalloc.get_traced_memory()[0]
+    for i in range(n):
+        objetos[i] = fabrica(i)
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objetos
+    return (despues - lista) / n, (despues - antes) / n
+
+
+def main(n):
+    rnd = random.Random(7)
+    plantillas = [(clase, argumentos_validos(rnd, clase)) for clase in KERNELS]
+
+    print(f"{'clase':<11} {'bytes/objeto':>12}")
+    for clase, argumentos in plantillas:
+        por_objeto, _ = medir(lambda i: clase(**argumentos), min(n, 100_000))
+        print(f"{clase.__name__:<11} {por_objeto:12.1f}")
+
+    def mixto(i):
+        clase, argumentos = plantillas[i % len(plantillas)]
+        return clase(**argumentos)
+
+    por_objeto, con_lista = medir(mixto, n)
+    print(
+        f"mixto n={n:,}: {por_objeto:.1f} bytes/objeto, "
+        f"{con_lista:.1f} bytes/elemento con la lista, {con_lista * n / 1e6:.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,56 @@
+"""
+Benchmark del simulador de escenarios: evaluación secuencial frente al pool
+de procesos sobre el mismo inventario congelado.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_simulador.py [tamaño] [escenarios]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from bench_snapshot import registro_aleatorio  # noqa: E402
+from services.catalogo import crear_mueble  # noqa: E402
+from services.simulador import Escenario, Simulador  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+
+
+def escenario_aleatorio(rnd, i):
+    escenario = Escenario(f"Escenario {i}")
+    escenario.descuento(rnd.choice(["mesas", "sillas", "sofas", "camas"]), rnd.randint(5, 30))
+    escenario.descuento("muebles", rnd.randint(1, 10), material="cuero")
+    if rnd.random() < 0.5:
+        escenario.ajustar_precio_base("asientos", rnd.uniform(-10, 10))
+    if rnd.random() < 0.5:
+        escenario.descuento("almacenamiento", 10, precio_min=rnd.randint(100, 800))
+    return escenario
+
+
+def main(n, cantidad):
+    rnd = random.Random(7)
+    tienda = TiendaMuebles("Benchmark")
+    tienda.agregar_muebles(crear_mueble(registro_aleatorio(rnd, i)) for i in range(n))
+    escenarios = [escenario_aleatorio(rnd, i) for i in range(cantidad)]
+
+    tiempos = {}
+    for procesos in (1, None):
+        inicio = time.perf_counter()
+        with Simulador(tienda, procesos) as simulador:
+            congelar = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            simulador.evaluar(escenarios)
+            tiempos[procesos] = time.perf_counter() - inicio
+
+    print(
+        f"n={n:>9,}  escenarios={cantidad}  congelar={congelar:6.2f}s  "
+        f"secuencial={tiempos[1]:6.2f}s  pool({os.cpu_count()})={tiempos[None]:6.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    main(argumentos[0] if argumentos else 200_000, argumentos[1] if len(argumentos) > 1 else 24)
@@ -0,0 +1,79 @@
+"""
+Benchmark de arranque: construcción en frío del inventario frente a la carga
+de un snapshot binario. La carga difiere la construcción de los muebles y de
+los índices de búsqueda, por lo que también se mide la primera consulta.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/bench_snapshot.py [tamaño ...]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.catalogo import crear_mueble  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+
+MATERIALES = ["Madera", "Metal", "Vidrio", "Plástico", "Cuero", "Tela"]
+COLORES = ["Negro", "Blanco", "Roble", "Gris", "Azul", "Café"]
+
+
+def registro_aleatorio(rnd, i):
+    base = {
+        "nombre": f"Producto {i}",
+        "material": rnd.choice(MATERIALES),
+        "color": rnd.choice(COLORES),
+        "precio_base": round(rnd.uniform(50, 2000), 2),
+    }
+    tipo = rnd.choice(["silla", "mesa", "sofa", "cama", "sofacama", "armario",
+                       "cajonera", "escritorio", "sillon"])
+    base["tipo"] = tipo
+    if tipo in ("silla", "sofa", "sillon", "sofacama"):
+        base["material_tapizado"] = rnd.choice([None, "tela", "cuero"]) or ""
+    if tipo == "mesa":
+        base["forma"] = rnd.choice(["rectangular", "redonda", "cuadrada"])
+        base["capacidad_personas"] = rnd.randint(2, 10)
+    if tipo == "cama":
+        base["tamaño"] = rnd.choice(["individual", "matrimonial", "queen", "king"])
+    return base
+
+
+def main(tamaños):
+    rnd = random.Random(7)
+    for n in tamaños:
+        registros = [registro_aleatorio(rnd, i) for i in range(n)]
+
+        inicio = time.perf_counter()
+        tienda = TiendaMuebles("Benchmark")
+        for registro in registros:
+            tienda.agregar_mueble(crear_mueble(registro))
+        frio = time.perf_counter() - inicio
+
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "tienda.snap")
+            inicio = time.perf_counter()
+            tienda.guardar_snapshot(ruta)
+            guardado = time.perf_counter() - inicio
+            tamaño_mb = os.path.getsize(ruta) / 1e6
+
+            inicio = time.perf_counter()
+            restaurada = TiendaMuebles.cargar_snapshot(ruta)
+            carga = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            restaurada.buscar_muebles_por_nombre("Producto 1")
+            consulta = time.perf_counter() - inicio
+
+        print(
+            f"n={n:>9,}  frío={frio:7.2f}s  guardar={guardado:6.2f}s  "
+            f"cargar={carga:6.2f}s  primera consulta={consulta:6.2f}s  "
+            f"archivo={tamaño_mb:7.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 500_000])
@@ -0,0 +1,85 @@
+"""
+Benchmark de los kernels de precios.
+
+Genera instancias aleatorias de cada clase concreta y mide la cotización por
+columnas frente al cálculo por objeto. La verificación de que ambos precios
+son idénticos está en tests/unit/services/test_precios.py.
+
+Uso (desde la raíz del repositorio):
+    python benchmarks/verificar_precios.py [filas_columnas]
+"""
+
+import inspect
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.catalogo import parametros_constructor  # noqa: E402
+from services.precios import KERNELS, atributos_kernel, cotizar_columnas  # noqa: E402
+
+VALORES_TEXTO = {
+    "material_tapizado": [None, "", "tela", "Tela", "cuero", " CUERO ", "lino"],
+    "forma": ["rectangular", "Rectangular", "redonda", "cuadrada", "L"],
+    "tamaño": ["individual", "matrimonial", "Queen", "queen", "king", "otro"],
+    "tamaño_cama": ["individual", "matrimonial", "Queen", "queen", "king", "otro"],
+    "mecanismo_conversion": ["plegable", "hidraulico", "electrico", "extensible"],
+}
+
+
+def valor_aleatorio(rnd, parametro):
+    """Genera un valor aleatorio para un argumento del constructor."""
+    nombre = parametro.name
+    if nombre == "precio_base":
+        return rnd.choice([rnd.randint(1, 5000), round(rnd.uniform(1, 5000), 2)])
+    if nombre in VALORES_TEXTO:
+        return rnd.choice(VALORES_TEXTO[nombre])
+    if nombre in ("largo", "ancho", "altura"):
+        return round(rnd.uniform(0.5, 400), rnd.randint(0, 3))
+    if parametro.annotation is bool:
+        return rnd.random() < 0.5
+    if parametro.annotation is int:
+        return rnd.randint(1, 12)
+    if parametro.annotation is float:
+        return round(rnd.uniform(0, 100), 2)
+    return f"{nombre}-{rnd.randint(0, 999)}"
+
+
+def instancia_aleatoria(rnd, clase, i):
+    argumentos = {}
+    for parametro in parametros_constructor(clase):
+        if parametro.name == "nombre":
+            argumentos["nombre"] = f"{clase.__name__} {i}"
+        elif parametro.default is inspect.Parameter.empty or rnd.random() < 0.8:
+            argumentos[parametro.name] = valor_aleatorio(rnd, parametro)
+    return clase(**argumentos)
+
+
+def medir(filas):
+    rnd = random.Random(7)
+    for clase in KERNELS:
+        muestra = [instancia_aleatoria(rnd, clase, i) for i in range(1000)]
+        columnas = {
+            atributo: [getattr(muestra[i % 1000], atributo) for i in range(filas)]
+            for atributo in atributos_kernel(clase)
+        }
+        inicio = time.perf_counter()
+        cotizar_columnas(clase, columnas)
+        kernel = time.perf_counter() - inicio
+
+        objetos = [muestra[i % 1000] for i in range(filas)]
+        inicio = time.perf_counter()
+        for mueble in objetos:
+            type(mueble).calcular_precio.__wrapped__(mueble)
+        referencia = time.perf_counter() - inicio
+        print(
+            f"{clase.__name__:<11} filas={filas:>10,}  kernel={kernel:6.2f}s  "
+            f"por objeto={referencia:6.2f}s  ({referencia / kernel:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    argumentos = [int(a) for a in sys.argv[1:]]
+    medir(argumentos[0] if argumentos else 1_000_000)
@@ -211,6 +211,17 @@ def crear_catalogo_inicial(tienda: "TiendaMuebles") -> None:
         resultado = tienda.agregar_mueble(mueble)
         print(f"  ✓ {resultado}")
 
+    # Unidades idénticas de un mismo producto: un solo SKU con existencias
+    silla_plegable = Silla(
+        nombre="Silla Plegable",
+        material="Metal",
+        color="Gris",
+        precio_base=60.0,
+        tiene_respaldo=True,
+    )
+    resultado = tienda.agregar_mueble(silla_plegable, cantidad=12)
+    print(f"  ✓ {resultado}")
+
     print(f"✅ Catálogo inicial creado con éxito!")
 
 
@@ -16,6 +16,8 @@ class Almacenamiento(Mueble, ABC):
     - Abstracción: Define características comunes de almacenamiento
     """
 
+    __slots__ = ("_num_compartimentos", "_capacidad_litros")
+
     def __init__(
         self,
         nombre: str,
@@ -47,6 +49,7 @@ class Almacenamiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("El número de compartimentos debe ser mayor a 0")
         self._num_compartimentos = value
+        self._invalidar_precio()
 
     @property
     def capacidad_litros(self) -> float:
@@ -59,6 +62,7 @@ class Almacenamiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("La capacidad debe ser mayor a 0")
         self._capacidad_litros = value
+        self._invalidar_precio()
 
     def calcular_factor_almacenamiento(self) -> float:
         """
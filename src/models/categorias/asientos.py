@@ -4,7 +4,30 @@ Esta clase agrupa las características comunes de sillas, sillones y sofás.
 """
 
 from abc import ABC, abstractmethod
+from typing import Dict
+
 from models.mueble import Mueble
+from models.vocabulario import TAPIZADOS
+
+# Extra de comodidad por tapizado, sin distinguir mayúsculas
+_EXTRAS_TAPIZADO = {"cuero": 0.2, "tela": 0.1}
+
+# Código exacto de tapizado -> extra (se completa al cotizar cada código nuevo)
+_extras_por_codigo: Dict[int, float] = {}
+
+
+def _extra_tapizado(codigo: int) -> float:
+    """
+    Retorna el extra de comodidad del tapizado con un código exacto.
+    Se compara el texto en minúsculas, sin quitar espacios, como siempre lo
+    hizo calcular_factor_comodidad: " cuero " no cuenta como cuero.
+    """
+    extra = _extras_por_codigo.get(codigo)
+    if extra is None:
+        tapizado = TAPIZADOS.valor(codigo)
+        extra = _EXTRAS_TAPIZADO.get(tapizado.lower(), 0.0) if tapizado else 0.0
+        _extras_por_codigo[codigo] = extra
+    return extra
 
 
 class Asiento(Mueble, ABC):
@@ -20,6 +43,8 @@ class Asiento(Mueble, ABC):
     - Polimorfismo: Permite diferentes implementaciones del cálculo de comodidad
     """
 
+    __slots__ = ("_capacidad_personas", "_tiene_respaldo", "_material_tapizado")
+
     def __init__(
         self,
         nombre: str,
@@ -43,7 +68,7 @@ class Asiento(Mueble, ABC):
 
         self._capacidad_personas = capacidad_personas
         self._tiene_respaldo = tiene_respaldo
-        self._material_tapizado = material_tapizado
+        self._material_tapizado = TAPIZADOS.codificar(material_tapizado)
 
     @property
     def capacidad_personas(self) -> int:
@@ -56,6 +81,7 @@ class Asiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("La capacidad debe ser mayor a 0")
         self._capacidad_personas = value
+        self._invalidar_precio()
 
     @property
     def tiene_respaldo(self) -> bool:
@@ -66,16 +92,18 @@ class Asiento(Mueble, ABC):
     def tiene_respaldo(self, value: bool) -> None:
         """Setter para respaldo."""
         self._tiene_respaldo = value
+        self._invalidar_precio()
 
     @property
     def material_tapizado(self) -> str:
         """Getter para el material de tapizado."""
-        return self._material_tapizado
+        return TAPIZADOS.valor(self._material_tapizado)
 
     @material_tapizado.setter
     def material_tapizado(self, value: str) -> None:
         """Setter para material de tapizado."""
-        self._material_tapizado = value
+        self._material_tapizado = TAPIZADOS.codificar(value)
+        self._invalidar_precio()
 
     def calcular_factor_comodidad(self) -> float:
         """
@@ -90,11 +118,9 @@ class Asiento(Mueble, ABC):
         if self.tiene_respaldo:
             factor += 0.1
 
-        if self.material_tapizado:
-            if self.material_tapizado.lower() == "cuero":
-                factor += 0.2
-            elif self.material_tapizado.lower() == "tela":
-                factor += 0.1
+        extra = _extra_tapizado(self._material_tapizado)
+        if extra:
+            factor += extra
 
         # Factor adicional por capacidad
         factor += (self.capacidad_personas - 1) * 0.05
@@ -16,6 +16,8 @@ class Superficie(Mueble, ABC):
     - Abstracción: Define características comunes de superficies
     """
 
+    __slots__ = ("_largo", "_ancho", "_altura")
+
     def __init__(
         self,
         nombre: str,
@@ -50,6 +52,7 @@ class Superficie(Mueble, ABC):
         if value <= 0:
             raise ValueError("El largo debe ser mayor a 0")
         self._largo = value
+        self._invalidar_precio()
 
     @property
     def ancho(self) -> float:
@@ -62,6 +65,7 @@ class Superficie(Mueble, ABC):
         if value <= 0:
             raise ValueError("El ancho debe ser mayor a 0")
         self._ancho = value
+        self._invalidar_precio()
 
     @property
     def altura(self) -> float:
@@ -4,11 +4,37 @@ Un comedor está compuesto por una mesa y varias sillas.
 """
 
 # Importar List para anotaciones de tipo
-from typing import List
+from typing import Dict, Iterator, List, Optional, Sequence
+from models.mueble import Mueble
 # from ..concretos.mesa import Mesa
 # from ..concretos.silla import Silla
 
 
+class VistaSillas(Sequence):
+    """
+    Vista de solo lectura de las sillas de un comedor.
+    No copia la lista: refleja los cambios del comedor y no permite
+    modificarlo (para eso están agregar_silla y quitar_silla).
+    """
+
+    __slots__ = ("_sillas",)
+
+    def __init__(self, sillas: List["Silla"]):
+        self._sillas = sillas
+
+    def __getitem__(self, indice):
+        return self._sillas[indice]
+
+    def __len__(self) -> int:
+        return len(self._sillas)
+
+    def __iter__(self) -> Iterator["Silla"]:
+        return iter(self._sillas)
+
+    def __repr__(self) -> str:
+        return f"VistaSillas({self._sillas!r})"
+
+
 class Comedor:
     """
     Clase que implementa composición conteniendo una mesa y sillas.
@@ -22,6 +48,10 @@ class Comedor:
     - Agregación: Los objetos contenidos pueden existir independientemente
     - Encapsulación: Controla el acceso a los componentes internos
     - Abstracción: Simplifica la gestión de múltiples muebles
+
+    El precio total, el resumen y la descripción se calculan una vez y se
+    guardan hasta que cambian las sillas (agregar_silla, quitar_silla) o
+    algún componente avisa un cambio a sus observadores.
     """
 
     def __init__(self, nombre: str, mesa: "Mesa", sillas: List["Silla"] = None):
@@ -34,7 +64,19 @@ class Comedor:
         """
         self._nombre = nombre
         self._mesa = mesa
-        self._sillas = sillas if sillas is not None else []
+        # Copia propia: los cambios deben pasar por agregar_silla/quitar_silla
+        self._sillas = list(sillas) if sillas is not None else []
+        self._vista_sillas = VistaSillas(self._sillas)
+        # Referencias por componente, para suscribirse una vez por objeto
+        self._componentes: Dict[int, int] = {}
+        # Cachés; None significa que hay que recalcular
+        self._precio_sillas: Optional[float] = None
+        self._precio_total: Optional[float] = None
+        self._resumen: Optional[dict] = None
+        self._descripcion: Optional[str] = None
+        self._observar(mesa)
+        for silla in self._sillas:
+            self._observar(silla)
 
     @property
     def nombre(self) -> str:
@@ -45,8 +87,40 @@ class Comedor:
         return self._mesa
 
     @property
-    def sillas(self) -> List["Silla"]:
-        return self._sillas.copy()
+    def sillas(self) -> VistaSillas:
+        """Vista de solo lectura de las sillas, sin copiar la lista."""
+        return self._vista_sillas
+
+    def _observar(self, componente) -> None:
+        """
+        Se suscribe a los cambios de un componente la primera vez que entra.
+        Método privado auxiliar.
+        """
+        referencias = self._componentes.get(id(componente), 0)
+        self._componentes[id(componente)] = referencias + 1
+        if referencias == 0 and isinstance(componente, Mueble):
+            componente._suscribir(self._invalidar)
+
+    def _dejar_de_observar(self, componente) -> None:
+        """
+        Cancela la suscripción cuando sale la última referencia a un componente.
+        Método privado auxiliar.
+        """
+        referencias = self._componentes.pop(id(componente)) - 1
+        if referencias:
+            self._componentes[id(componente)] = referencias
+        elif isinstance(componente, Mueble):
+            componente._desuscribir(self._invalidar)
+
+    def _invalidar(self, componente=None) -> None:
+        """
+        Descarta los valores calculados; también es el observador de la mesa
+        y las sillas.
+        """
+        self._precio_sillas = None
+        self._precio_total = None
+        self._resumen = None
+        self._descripcion = None
 
     def agregar_silla(self, silla: "Silla") -> str:
         """
@@ -68,6 +142,8 @@ class Comedor:
                 f"No se pueden agregar más sillas. Capacidad máxima: {capacidad_maxima}"
             )
         self._sillas.append(silla)
+        self._observar(silla)
+        self._invalidar()
         return f"Silla {getattr(silla, 'nombre', str(silla))} agregada exitosamente al comedor"
 
     def quitar_silla(self, indice: int = -1) -> str:
@@ -84,31 +160,47 @@ class Comedor:
             return "No hay sillas para quitar"
         try:
             silla_removida = self._sillas.pop(indice)
+            self._dejar_de_observar(silla_removida)
+            self._invalidar()
             return f"Silla {getattr(silla_removida, 'nombre', str(silla_removida))} removida del comedor"
         except IndexError:
             return "Índice de silla inválido"
 
+    def _calcular_precio_sillas(self) -> float:
+        """
+        Suma (con caché) los precios de las sillas.
+        Método privado auxiliar.
+        """
+        if self._precio_sillas is None:
+            self._precio_sillas = sum(silla.calcular_precio() for silla in self._sillas)
+        return self._precio_sillas
+
     def calcular_precio_total(self) -> float:
         """
-        Calcula el precio total del comedor sumando todos sus componentes.
+        Calcula el precio total del comedor: la mesa más la suma de las sillas
+        (la misma que guarda _calcular_precio_sillas). El resultado se guarda
+        hasta que cambien las sillas o un componente.
 
         Returns:
             float: Precio total del set de comedor
         """
-        precio_total = self._mesa.calcular_precio()
-        for silla in self._sillas:
-            precio_total += silla.calcular_precio()
-        if len(self._sillas) >= 4:
-            precio_total *= 0.95  # 5% de descuento
-        return round(precio_total, 2)
+        if self._precio_total is None:
+            precio_total = self._mesa.calcular_precio() + self._calcular_precio_sillas()
+            if len(self._sillas) >= 4:
+                precio_total *= 0.95  # 5% de descuento
+            self._precio_total = round(precio_total, 2)
+        return self._precio_total
 
     def obtener_descripcion_completa(self) -> str:
         """
         Obtiene una descripción completa del comedor y todos sus componentes.
+        La descripción se guarda hasta que cambien las sillas o un componente.
 
         Returns:
             str: Descripción detallada del comedor
         """
+        if self._descripcion is not None:
+            return self._descripcion
         descripcion = f"=== COMEDOR {self.nombre.upper()} ===\n\n"
         descripcion += "MESA:\n"
         descripcion += self._mesa.obtener_descripcion() + "\n\n"
@@ -121,24 +213,30 @@ class Comedor:
         descripcion += f"\n--- PRECIO TOTAL: ${self.calcular_precio_total():.2f} ---"
         if len(self._sillas) >= 4:
             descripcion += "\n(Incluye 5% de descuento por set completo)"
+        self._descripcion = descripcion
         return descripcion
 
     def obtener_resumen(self) -> dict:
         """
         Obtiene un resumen estadístico del comedor.
+        Se calcula una vez y luego se entrega desde la caché en O(1).
 
         Returns:
-            dict: Diccionario con información resumida
-        """
-        resumen = {
-            "nombre": self.nombre,
-            "total_muebles": 1 + len(self._sillas),  # mesa + sillas
-            "precio_mesa": self._mesa.calcular_precio(),
-            "precio_sillas": sum(silla.calcular_precio() for silla in self._sillas),
-            "precio_total": self.calcular_precio_total(),
-            "capacidad_personas": len(self._sillas),
-            "materiales_utilizados": self._obtener_materiales_unicos(),
-        }
+            dict: Diccionario con información resumida (una copia, para que
+                modificarlo no altere la caché)
+        """
+        if self._resumen is None:
+            self._resumen = {
+                "nombre": self.nombre,
+                "total_muebles": 1 + len(self._sillas),  # mesa + sillas
+                "precio_mesa": self._mesa.calcular_precio(),
+                "precio_sillas": self._calcular_precio_sillas(),
+                "precio_total": self.calcular_precio_total(),
+                "capacidad_personas": len(self._sillas),
+                "materiales_utilizados": self._obtener_materiales_unicos(),
+            }
+        resumen = dict(self._resumen)
+        resumen["materiales_utilizados"] = list(resumen["materiales_utilizados"])
         return resumen
 
     def _obtener_materiales_unicos(self) -> list:
@@ -3,14 +3,16 @@ Clase concreta Armario.
 Representa un armario genérico.
 """
 
-# from ..mueble import Mueble
+from ..mueble import Mueble, precio_memoizado
 
 
-class Armario:
+class Armario(Mueble):
     """
     Clase concreta que representa un armario.
     """
 
+    __slots__ = ("_num_puertas", "_num_cajones", "_tiene_espejos")
+
     def __init__(
         self,
         nombre: str,
@@ -21,14 +23,54 @@ class Armario:
         num_cajones: int = 0,
         tiene_espejos: bool = False,
     ):
-        self.nombre = nombre
-        self.material = material
-        self.color = color
-        self.precio_base = int(precio_base) if precio_base is not None else 0
-        self.num_puertas = num_puertas
-        self.num_cajones = num_cajones
-        self.tiene_espejos = tiene_espejos
+        super().__init__(
+            nombre,
+            material,
+            color,
+            int(precio_base) if precio_base is not None else 0,
+        )
+        self._num_puertas = num_puertas
+        self._num_cajones = num_cajones
+        self._tiene_espejos = tiene_espejos
+
+    @property
+    def num_puertas(self) -> int:
+        """Getter para número de puertas."""
+        return self._num_puertas
+
+    @num_puertas.setter
+    def num_puertas(self, value: int) -> None:
+        """Setter para número de puertas con validación."""
+        if value < 0:
+            raise ValueError("El número de puertas no puede ser negativo")
+        self._num_puertas = value
+        self._invalidar_precio()
+
+    @property
+    def num_cajones(self) -> int:
+        """Getter para número de cajones."""
+        return self._num_cajones
+
+    @num_cajones.setter
+    def num_cajones(self, value: int) -> None:
+        """Setter para número de cajones con validación."""
+        if value < 0:
+            raise ValueError("El número de cajones no puede ser negativo")
+        self._num_cajones = value
+        self._invalidar_precio()
+
+    @property
+    def tiene_espejos(self) -> bool:
+        """Getter para espejos."""
+        return self._tiene_espejos
+
+    @tiene_espejos.setter
+    def tiene_espejos(self, value: bool) -> None:
+        """Setter para espejos."""
+        self._tiene_espejos = value
+        self._invalidar_precio()
 
+    @precio_memoizado
     def calcular_precio(self) -> int:
         """Calcula el precio final del armario."""
         precio = self.precio_base
@@ -3,14 +3,16 @@ Clase concreta Cajonera.
 Representa una cajonera genérica.
 """
 
-# from ..mueble import Mueble
+from ..mueble import Mueble, precio_memoizado
 
 
-class Cajonera:
+class Cajonera(Mueble):
     """
     Clase concreta que representa una cajonera.
     """
 
+    __slots__ = ("_num_cajones", "_tiene_ruedas")
+
     def __init__(
         self,
         nombre: str,
@@ -20,13 +22,40 @@ class Cajonera:
         num_cajones: int = 3,
         tiene_ruedas: bool = False,
     ):
-        self.nombre = nombre
-        self.material = material
-        self.color = color
-        self.precio_base = int(precio_base) if precio_base is not None else 0
-        self.num_cajones = num_cajones
-        self.tiene_ruedas = tiene_ruedas
+        super().__init__(
+            nombre,
+            material,
+            color,
+            int(precio_base) if precio_base is not None else 0,
+        )
+        self._num_cajones = num_cajones
+        self._tiene_ruedas = tiene_ruedas
+
+    @property
+    def num_cajones(self) -> int:
+        """Getter para número de cajones."""
+        return self._num_cajones
+
+    @num_cajones.setter
+    def num_cajones(self, value: int) -> None:
+        """Setter para número de cajones con validación."""
+        if value < 0:
+            raise ValueError("El número de cajones no puede ser negativo")
+        self._num_cajones = value
+        self._invalidar_precio()
+
+    @property
+    def tiene_ruedas(self) -> bool:
+        """Getter para ruedas."""
+        return self._tiene_ruedas
+
+    @tiene_ruedas.setter
+    def tiene_ruedas(self, value: bool) -> None:
+        """Setter para ruedas."""
+        self._tiene_ruedas = value
+        self._invalidar_precio()
 
+    @precio_memoizado
     def calcular_precio(self) -> int:
         """Calcula el precio final de la cajonera."""
         precio = self.precio_base
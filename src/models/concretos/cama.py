@@ -3,12 +3,22 @@ Clase concreta Cama.
 Representa una cama genérica.
 """
 
-from ..mueble import Mueble
+from ..mueble import Mueble, precio_memoizado
+from ..vocabulario import TAMAÑOS
+
+_MATRIMONIAL = TAMAÑOS.codificar("matrimonial")
+_QUEEN = TAMAÑOS.codificar("queen")
+_KING = TAMAÑOS.codificar("king")
 
 
 class Cama(Mueble):
     """
     Clase concreta que representa una cama.
+
+    Es la única clase de la jerarquía sin __slots__: SofaCama hereda de Sofa y
+    de Cama, y Python no admite dos bases que agreguen slots propios. Las
+    camas guardan sus atributos específicos en __dict__; SofaCama los declara
+    como slots y su __dict__ queda vacío.
     """
 
     def __init__(
@@ -22,14 +32,14 @@ class Cama(Mueble):
         tiene_cabecera: bool = False,
     ):
         super().__init__(nombre, material, color, precio_base)
-        self._tamaño = tamaño
+        self._tamaño = TAMAÑOS.codificar(tamaño)
         self._incluye_colchon = incluye_colchon
         self._tiene_cabecera = tiene_cabecera
 
     @property
     def tamaño(self) -> str:
         """Getter para tamaño."""
-        return self._tamaño
+        return TAMAÑOS.valor(self._tamaño)
 
     @tamaño.setter
     def tamaño(self, value: str) -> None:
@@ -37,7 +47,8 @@ class Cama(Mueble):
         tamaños_validos = ["individual", "matrimonial", "queen", "king"]
         if value not in tamaños_validos:
             raise ValueError(f"Tamaño debe ser uno de: {tamaños_validos}")
-        self._tamaño = value
+        self._tamaño = TAMAÑOS.codificar(value)
+        self._invalidar_precio()
 
     @property
     def incluye_colchon(self) -> bool:
@@ -49,16 +60,17 @@ class Cama(Mueble):
         """Getter para cabecera."""
         return self._tiene_cabecera
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """Calcula el precio final de la cama."""
         precio = self.precio_base
 
         # Ajuste por tamaño
-        if self.tamaño == "matrimonial":
+        if self._tamaño == _MATRIMONIAL:
             precio += 200
-        elif self.tamaño == "queen":
+        elif self._tamaño == _QUEEN:
             precio += 400
-        elif self.tamaño == "king":
+        elif self._tamaño == _KING:
             precio += 600
 
         # Extras
@@ -3,14 +3,25 @@ Clase concreta Escritorio.
 Representa un escritorio genérico.
 """
 
-# from ..mueble import Mueble
+from ..mueble import Mueble, precio_memoizado
+from ..vocabulario import FORMAS
 
+_RECTANGULAR = FORMAS.codificar("rectangular")
 
-class Escritorio:
+
+class Escritorio(Mueble):
     """
     Clase concreta que representa un escritorio.
     """
 
+    __slots__ = (
+        "_forma",
+        "_tiene_cajones",
+        "_num_cajones",
+        "_largo",
+        "_tiene_iluminacion",
+    )
+
     def __init__(
         self,
         nombre: str,
@@ -23,16 +34,80 @@ class Escritorio:
         largo: float = 1.2,
         tiene_iluminacion: bool = False,
     ):
-        self.nombre = nombre
-        self.material = material
-        self.color = color
-        self.precio_base = int(precio_base) if precio_base is not None else 0
-        self.forma = forma
-        self.tiene_cajones = tiene_cajones
-        self.num_cajones = num_cajones
-        self.largo = largo
-        self.tiene_iluminacion = tiene_iluminacion
+        super().__init__(
+            nombre,
+            material,
+            color,
+            int(precio_base) if precio_base is not None else 0,
+        )
+        self._forma = FORMAS.codificar(forma)
+        self._tiene_cajones = tiene_cajones
+        self._num_cajones = num_cajones
+        self._largo = largo
+        self._tiene_iluminacion = tiene_iluminacion
+
+    @property
+    def forma(self) -> str:
+        """Getter para forma."""
+        return FORMAS.valor(self._forma)
+
+    @forma.setter
+    def forma(self, value: str) -> None:
+        """Setter para forma con validación."""
+        if not value or not value.strip():
+            raise ValueError("La forma no puede estar vacía")
+        self._forma = FORMAS.codificar(value.strip())
+        self._invalidar_precio()
+
+    @property
+    def tiene_cajones(self) -> bool:
+        """Getter para cajones."""
+        return self._tiene_cajones
+
+    @tiene_cajones.setter
+    def tiene_cajones(self, value: bool) -> None:
+        """Setter para cajones."""
+        self._tiene_cajones = value
+        self._invalidar_precio()
+
+    @property
+    def num_cajones(self) -> int:
+        """Getter para número de cajones."""
+        return self._num_cajones
+
+    @num_cajones.setter
+    def num_cajones(self, value: int) -> None:
+        """Setter para número de cajones con validación."""
+        if value < 0:
+            raise ValueError("El número de cajones no puede ser negativo")
+        self._num_cajones = value
+        self._invalidar_precio()
+
+    @property
+    def largo(self) -> float:
+        """Getter para largo en metros."""
+        return self._largo
+
+    @largo.setter
+    def largo(self, value: float) -> None:
+        """Setter para largo con validación."""
+        if value <= 0:
+            raise ValueError("El largo debe ser mayor a 0")
+        self._largo = value
+        self._invalidar_precio()
+
+    @property
+    def tiene_iluminacion(self) -> bool:
+        """Getter para iluminación."""
+        return self._tiene_iluminacion
+
+    @tiene_iluminacion.setter
+    def tiene_iluminacion(self, value: bool) -> None:
+        """Setter para iluminación."""
+        self._tiene_iluminacion = value
+        self._invalidar_precio()
 
+    @precio_memoizado
     def calcular_precio(self) -> int:
         """Calcula el precio final del escritorio."""
         precio = self.precio_base
@@ -42,7 +117,7 @@ class Escritorio:
             precio += 50
         if self.tiene_iluminacion:
             precio += 40
-        if self.forma != "rectangular":
+        if self._forma != _RECTANGULAR:
             precio += 30
         return int(round(precio))
 
@@ -4,6 +4,10 @@ Representa una mesa genérica.
 """
 
 from ..categorias.superficies import Superficie
+from ..mueble import precio_memoizado
+from ..vocabulario import FORMAS
+
+_RECTANGULAR = FORMAS.codificar("rectangular")
 
 
 class Mesa(Superficie):
@@ -11,6 +15,8 @@ class Mesa(Superficie):
     Clase concreta que representa una mesa.
     """
 
+    __slots__ = ("_forma", "_capacidad_personas")
+
     def __init__(
         self,
         nombre: str,
@@ -24,13 +30,13 @@ class Mesa(Superficie):
         capacidad_personas: int = 4,
     ):
         super().__init__(nombre, material, color, precio_base, largo, ancho, altura)
-        self._forma = forma
+        self._forma = FORMAS.codificar(forma)
         self._capacidad_personas = capacidad_personas
 
     @property
     def forma(self) -> str:
         """Getter para forma."""
-        return self._forma
+        return FORMAS.valor(self._forma)
 
     @forma.setter
     def forma(self, value: str) -> None:
@@ -38,7 +44,8 @@ class Mesa(Superficie):
         formas_validas = ["rectangular", "redonda", "cuadrada", "ovalada"]
         if value not in formas_validas:
             raise ValueError(f"Forma debe ser una de: {formas_validas}")
-        self._forma = value
+        self._forma = FORMAS.codificar(value)
+        self._invalidar_precio()
 
     @property
     def capacidad_personas(self) -> int:
@@ -51,7 +58,9 @@ class Mesa(Superficie):
         if value <= 0:
             raise ValueError("La capacidad debe ser mayor a 0")
         self._capacidad_personas = value
+        self._invalidar_precio()
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """Calcula el precio final de la mesa."""
         precio = self.precio_base
@@ -61,7 +70,7 @@ class Mesa(Superficie):
         precio *= factor_tamaño
 
         # Ajuste por forma
-        if self.forma != "rectangular":
+        if self._forma != _RECTANGULAR:
             precio += 50
 
         # Ajuste por capacidad de personas
@@ -4,6 +4,7 @@ Implementa un mueble de asiento específico para una persona.
 """
 
 from ..categorias.asientos import Asiento
+from ..mueble import precio_memoizado
 
 
 class Silla(Asiento):
@@ -19,6 +20,8 @@ class Silla(Asiento):
     - Encapsulación: Protege atributos específicos de la silla
     """
 
+    __slots__ = ("_altura_regulable", "_tiene_ruedas")
+
     def __init__(
         self,
         nombre: str,
@@ -46,6 +49,7 @@ class Silla(Asiento):
     def altura_regulable(self, value: bool) -> None:
         """Setter para altura regulable."""
         self._altura_regulable = value
+        self._invalidar_precio()
 
     @property
     def tiene_ruedas(self) -> bool:
@@ -56,7 +60,9 @@ class Silla(Asiento):
     def tiene_ruedas(self, value: bool) -> None:
         """Setter para ruedas."""
         self._tiene_ruedas = value
+        self._invalidar_precio()
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """
         Implementa el cálculo de precio específico para sillas.
@@ -3,15 +3,18 @@ Clase concreta Sillón.
 Implementa un mueble de asiento para más de una persona, con brazos y respaldo.
 """
 
-# from ..categorias.asientos import Asiento
+from ..categorias.asientos import Asiento
+from ..mueble import precio_memoizado
 
 
-class Sillon:
+class Sillon(Asiento):
     """
     Clase concreta que representa un sillón.
     Hereda de Asiento y añade características específicas.
     """
 
+    __slots__ = ("_tiene_brazos", "_es_reclinable", "_tiene_reposapiés")
+
     def __init__(
         self,
         nombre: str,
@@ -25,17 +28,53 @@ class Sillon:
         es_reclinable: bool = False,
         tiene_reposapiés: bool = False,
     ):
-        self.nombre = nombre
-        self.material = material
-        self.color = color
-        self.precio_base = int(precio_base) if precio_base is not None else 0
-        self.capacidad_personas = capacidad_personas
-        self.tiene_respaldo = tiene_respaldo
-        self.material_tapizado = material_tapizado
-        self.tiene_brazos = tiene_brazos
-        self.es_reclinable = es_reclinable
-        self.tiene_reposapiés = tiene_reposapiés
+        super().__init__(
+            nombre,
+            material,
+            color,
+            int(precio_base) if precio_base is not None else 0,
+            capacidad_personas,
+            tiene_respaldo,
+            material_tapizado,
+        )
+        self._tiene_brazos = tiene_brazos
+        self._es_reclinable = es_reclinable
+        self._tiene_reposapiés = tiene_reposapiés
+
+    @property
+    def tiene_brazos(self) -> bool:
+        """Getter para brazos."""
+        return self._tiene_brazos
+
+    @tiene_brazos.setter
+    def tiene_brazos(self, value: bool) -> None:
+        """Setter para brazos."""
+        self._tiene_brazos = value
+        self._invalidar_precio()
+
+    @property
+    def es_reclinable(self) -> bool:
+        """Getter para reclinable."""
+        return self._es_reclinable
+
+    @es_reclinable.setter
+    def es_reclinable(self, value: bool) -> None:
+        """Setter para reclinable."""
+        self._es_reclinable = value
+        self._invalidar_precio()
+
+    @property
+    def tiene_reposapiés(self) -> bool:
+        """Getter para reposapiés."""
+        return self._tiene_reposapiés
+
+    @tiene_reposapiés.setter
+    def tiene_reposapiés(self, value: bool) -> None:
+        """Setter para reposapiés."""
+        self._tiene_reposapiés = value
+        self._invalidar_precio()
 
+    @precio_memoizado
     def calcular_precio(self) -> int:
         """Calcula el precio final del sillón."""
         precio = self.precio_base
@@ -5,6 +5,14 @@ Esta clase hereda tanto de Sofa como de Cama.
 
 from .sofa import Sofa
 from .cama import Cama
+from ..mueble import precio_memoizado
+from ..vocabulario import MECANISMOS, TAMAÑOS
+
+_MATRIMONIAL = TAMAÑOS.codificar("matrimonial")
+_QUEEN = TAMAÑOS.codificar("queen")
+_KING = TAMAÑOS.codificar("king")
+_HIDRAULICO = MECANISMOS.codificar("hidraulico")
+_ELECTRICO = MECANISMOS.codificar("electrico")
 
 
 class SofaCama(Sofa, Cama):
@@ -21,6 +29,18 @@ class SofaCama(Sofa, Cama):
     - Super(): Usa super() para resolver conflictos de herencia
     """
 
+    # Atributos de Cama (que no declara slots) más los propios
+    __slots__ = (
+        "_tamaño",
+        "_incluye_colchon",
+        "_tiene_cabecera",
+        "_mecanismo_conversion",
+        "_modo_actual",
+    )
+
+    # El modo cambia con convertir_a_cama/convertir_a_sofa
+    atributos_estado = ("modo_actual",)
+
     def __init__(
         self,
         nombre: str,
@@ -52,12 +72,13 @@ class SofaCama(Sofa, Cama):
             material_tapizado,
         )
         # Inicializar atributos específicos de cama
-        self._tamaño = tamaño_cama
+        self._tamaño = TAMAÑOS.codificar(tamaño_cama)
         self._incluye_colchon = incluye_colchon
         # Atributos específicos del sofá-cama
-        self._mecanismo_conversion = mecanismo_conversion
+        self._mecanismo_conversion = MECANISMOS.codificar(mecanismo_conversion)
         self._modo_actual = "sofa"
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """
         Calcula el precio final del sofá cama.
@@ -67,20 +88,20 @@ class SofaCama(Sofa, Cama):
         precio_sofa = super().calcular_precio()
 
         # Agregar costos específicos de cama
-        if self._tamaño == "matrimonial":
+        if self._tamaño == _MATRIMONIAL:
             precio_sofa += 300
-        elif self._tamaño == "queen":
+        elif self._tamaño == _QUEEN:
             precio_sofa += 500
-        elif self._tamaño == "king":
+        elif self._tamaño == _KING:
             precio_sofa += 700
 
         if self.incluye_colchon:
             precio_sofa += 250
 
         # Costo del mecanismo de conversión
-        if self._mecanismo_conversion == "hidraulico":
+        if self._mecanismo_conversion == _HIDRAULICO:
             precio_sofa += 150
-        elif self._mecanismo_conversion == "electrico":
+        elif self._mecanismo_conversion == _ELECTRICO:
             precio_sofa += 300
 
         return round(precio_sofa, 2)
@@ -88,23 +109,31 @@ class SofaCama(Sofa, Cama):
     @property
     def mecanismo_conversion(self) -> str:
         """Getter para el mecanismo de conversión."""
-        return self._mecanismo_conversion
+        return MECANISMOS.valor(self._mecanismo_conversion)
 
     @property
     def modo_actual(self) -> str:
         """Getter para el modo actual (sofa o cama)."""
         return self._modo_actual
 
+    @modo_actual.setter
+    def modo_actual(self, value: str) -> None:
+        """Setter para el modo actual con validación."""
+        if value not in ("sofa", "cama"):
+            raise ValueError("El modo debe ser 'sofa' o 'cama'")
+        self._modo_actual = value
+        self._notificar_cambio()
+
     # Redefinir tamaño para compatibilidad con ambas clases
     @property
     def tamaño(self) -> str:
         """Getter para tamaño (compatible con clase Cama)."""
-        return self._tamaño
+        return TAMAÑOS.valor(self._tamaño)
 
     @property
     def tamaño_cama(self) -> str:
         """Alias para tamaño específico de cama."""
-        return self._tamaño
+        return TAMAÑOS.valor(self._tamaño)
 
     def convertir_a_cama(self) -> str:
         """
@@ -117,7 +146,7 @@ class SofaCama(Sofa, Cama):
         if self._modo_actual == "cama":
             return "El sofá-cama ya está en modo cama"
 
-        self._modo_actual = "cama"
+        self.modo_actual = "cama"
         return f"Sofá convertido a cama usando mecanismo {self.mecanismo_conversion}"
 
     def convertir_a_sofa(self) -> str:
@@ -131,7 +160,7 @@ class SofaCama(Sofa, Cama):
         if self._modo_actual == "sofa":
             return "El sofá-cama ya está en modo sofá"
 
-        self._modo_actual = "sofa"
+        self.modo_actual = "sofa"
         return f"Cama convertida a sofá usando mecanismo {self.mecanismo_conversion}"
         pass
 
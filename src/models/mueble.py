@@ -4,6 +4,57 @@ Este es el punto de partida de nuestra jerarquía de clases.
 """
 
 from abc import ABC, abstractmethod
+from functools import wraps
+
+from models.vocabulario import COLORES, MATERIALES, VACIO, VOCABULARIOS
+
+
+def precio_memoizado(calcular_precio):
+    """
+    Decorador que guarda en la instancia el resultado de calcular_precio.
+
+    La caché se vacía con Mueble._invalidar_precio(), que llaman los setters
+    de los atributos que afectan el precio. Solo la implementación más
+    derivada usa la caché: cuando una subclase invoca super().calcular_precio()
+    (como SofaCama con Sofa), el cálculo del padre se ejecuta sin leer ni
+    escribir la caché de la instancia.
+
+    Args:
+        calcular_precio: Implementación concreta del cálculo de precio
+
+    Returns:
+        Función envoltorio con memoización por instancia
+    """
+
+    @wraps(calcular_precio)
+    def envoltorio(self) -> float:
+        if type(self).calcular_precio is not envoltorio:
+            return calcular_precio(self)
+        if self._precio_cache is None:
+            self._precio_cache = calcular_precio(self)
+        return self._precio_cache
+
+    envoltorio.memoizado = True
+    return envoltorio
+
+
+def memoizar_precio(mueble, precio: float) -> None:
+    """
+    Guarda en la caché de precio_memoizado un precio calculado fuera de
+    calcular_precio (por ejemplo, por un kernel de services.precios o al
+    cargar un snapshot). Si la clase del mueble no memoiza su precio, no
+    se guarda nada.
+
+    Args:
+        mueble: Mueble cuyo precio se calculó
+        precio: Precio idéntico al que retornaría calcular_precio
+    """
+    if getattr(type(mueble).calcular_precio, "memoizado", False):
+        mueble._precio_cache = precio
+
+
+# Atributos que no se copian ni se serializan (ver Mueble.__getstate__)
+_SIN_ESTADO = frozenset(("_precio_cache", "_observadores"))
 
 
 class Mueble(ABC):
@@ -16,8 +67,28 @@ class Mueble(ABC):
     Conceptos OOP aplicados:
     - Abstracción: Define una interfaz común sin implementación específica
     - Encapsulación: Usa atributos privados con getters/setters
+
+    Las clases de la jerarquía declaran sus atributos en __slots__, de modo
+    que las instancias no llevan un __dict__ propio (ver Cama para la
+    excepción que permite la herencia múltiple de SofaCama).
+
+    atributos_estado nombra las propiedades con setter que cambian después
+    de la construcción sin ser argumentos del constructor (como el modo de
+    SofaCama); el catálogo, los snapshots y la bitácora las guardan junto
+    con los argumentos.
     """
 
+    atributos_estado: tuple = ()
+
+    __slots__ = (
+        "_precio_cache",
+        "_observadores",
+        "_nombre",
+        "_material",
+        "_color",
+        "_precio_base",
+    )
+
     def __init__(self, nombre: str, material: str, color: str, precio_base: float):
         """
         Constructor de la clase Mueble.
@@ -28,9 +99,11 @@ class Mueble(ABC):
             color: Color del mueble
             precio_base: Precio base antes de aplicar modificadores
         """
+        self._precio_cache = None
+        self._observadores = None
         self._nombre = nombre
-        self._material = material
-        self._color = color
+        self._material = MATERIALES.codificar(material)
+        self._color = COLORES.codificar(color)
         self._precio_base = precio_base
 
     @property
@@ -44,30 +117,33 @@ class Mueble(ABC):
         if not value or not value.strip():
             raise ValueError("El nombre no puede estar vacío")
         self._nombre = value.strip()
+        self._notificar_cambio()
 
     @property
     def material(self) -> str:
         """Getter para el material del mueble."""
-        return self._material
+        return MATERIALES.valor(self._material)
 
     @material.setter
     def material(self, value: str) -> None:
         """Setter para el material con validación."""
         if not value or not value.strip():
             raise ValueError("El material no puede estar vacío")
-        self._material = value.strip()
+        self._material = MATERIALES.codificar(value.strip())
+        self._notificar_cambio()
 
     @property
     def color(self) -> str:
         """Getter para el color del mueble."""
-        return self._color
+        return COLORES.valor(self._color)
 
     @color.setter
     def color(self, value: str) -> None:
         """Setter para el color con validación."""
         if not value or not value.strip():
             raise ValueError("El color no puede estar vacío")
-        self._color = value.strip()
+        self._color = COLORES.codificar(value.strip())
+        self._notificar_cambio()
 
     @property
     def precio_base(self) -> float:
@@ -80,6 +156,83 @@ class Mueble(ABC):
         if value < 0:
             raise ValueError("El precio base no puede ser negativo")
         self._precio_base = value
+        self._invalidar_precio()
+
+    def clave(self, atributo: str) -> int:
+        """
+        Retorna el código canónico de un atributo de texto internado, para
+        comparar y filtrar sin normalizar cadenas.
+
+        Args:
+            atributo: Nombre del atributo (ej: "material", "color", "forma")
+        Returns:
+            int: Código canónico, o VACIO si el mueble no tiene el atributo
+        """
+        codigo = getattr(self, "_" + atributo, None)
+        if codigo is None:
+            return VACIO
+        return VOCABULARIOS[atributo].canonicos[codigo]
+
+    def __getstate__(self) -> dict:
+        """
+        Estado para pickle y copy: los atributos internados se guardan como
+        texto, ya que sus códigos solo valen dentro de este proceso. Los
+        observadores (inventarios, comedores, catálogos) y el precio
+        memoizado no forman parte del estado: la copia empieza sin ellos.
+        """
+        estado = dict(getattr(self, "__dict__", {}))
+        for clase in type(self).__mro__:
+            for atributo in getattr(clase, "__slots__", ()):
+                if atributo not in _SIN_ESTADO and hasattr(self, atributo):
+                    estado[atributo] = getattr(self, atributo)
+        for atributo, valor in estado.items():
+            vocabulario = VOCABULARIOS.get(atributo[1:])
+            if vocabulario is not None:
+                estado[atributo] = vocabulario.valor(valor)
+        return estado
+
+    def __setstate__(self, estado: dict) -> None:
+        """Restaura el estado de __getstate__ volviendo a internar los textos."""
+        object.__setattr__(self, "_precio_cache", None)
+        object.__setattr__(self, "_observadores", None)
+        for atributo, valor in estado.items():
+            if atributo in _SIN_ESTADO:
+                continue
+            vocabulario = VOCABULARIOS.get(atributo[1:])
+            if vocabulario is not None:
+                valor = vocabulario.codificar(valor)
+            object.__setattr__(self, atributo, valor)
+
+    def _invalidar_precio(self) -> None:
+        """
+        Descarta el precio memoizado y avisa a los observadores.
+        Los setters de atributos que afectan el precio deben llamarlo.
+        """
+        self._precio_cache = None
+        self._notificar_cambio()
+
+    def _suscribir(self, observador) -> None:
+        """
+        Registra una función que se llamará con el mueble tras cada cambio.
+        Lo usan los contenedores (como el inventario) que mantienen índices.
+
+        Args:
+            observador: Función que recibe el mueble modificado
+        """
+        if self._observadores is None:
+            self._observadores = []
+        self._observadores.append(observador)
+
+    def _desuscribir(self, observador) -> None:
+        """Elimina un observador registrado con _suscribir."""
+        if self._observadores and observador in self._observadores:
+            self._observadores.remove(observador)
+
+    def _notificar_cambio(self) -> None:
+        """Avisa a los observadores que el mueble cambió."""
+        if self._observadores:
+            for observador in tuple(self._observadores):
+                observador(self)
 
     @abstractmethod
     def calcular_precio(self) -> float:
@@ -0,0 +1,103 @@
+"""
+Vocabularios internados de los atributos de texto de los muebles.
+
+Material, color, tapizado, forma, tamaño y mecanismo de conversión se
+repiten en miles de muebles con pocos valores distintos. Cada mueble guarda
+un código entero por atributo en lugar de la cadena, y el texto original se
+recupera del vocabulario solo al leer la propiedad.
+
+Cada texto exacto tiene su propio código, de modo que la propiedad devuelve
+el texto tal como se asignó. Además, cada código apunta a un código canónico
+compartido por todas las variantes con el mismo valor normalizado (minúsculas,
+sin espacios sobrantes): los precios y los filtros comparan esos enteros en
+lugar de normalizar cadenas en cada llamada.
+
+Los códigos son válidos solo dentro del proceso; al serializar un mueble se
+guardan los textos (ver Mueble.__getstate__).
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+# Código canónico de los valores vacíos (None, "" o solo espacios)
+VACIO = 0
+
+
+def normalizar(valor: Optional[str]) -> str:
+    """Normaliza un valor para compararlo: minúsculas, sin espacios sobrantes."""
+    return valor.lower().strip() if valor else ""
+
+
+class Vocabulario:
+    """Internado de textos con un código exacto y uno canónico por valor."""
+
+    __slots__ = ("nombre", "_codigos", "_valores", "_claves", "_normalizados", "canonicos")
+
+    def __init__(self, nombre: str, textos: Sequence[Optional[str]] = (None,)):
+        """
+        Args:
+            nombre: Nombre del atributo, para mensajes y depuración
+            textos: Textos a internar en orden, de modo que el código de cada
+                uno sea su posición; por omisión solo None, con código VACIO
+        """
+        self.nombre = nombre
+        self._codigos: Dict[Optional[str], int] = {}  # texto exacto -> código
+        self._valores: List[Optional[str]] = []  # código -> texto exacto
+        self._claves: Dict[str, int] = {}  # texto normalizado -> código canónico
+        self._normalizados: List[str] = []  # código -> texto normalizado
+        self.canonicos: List[int] = []  # código -> código canónico
+        for texto in textos:
+            self.codificar(texto)
+
+    def codificar(self, valor: Optional[str]) -> int:
+        """Retorna el código del texto exacto, internándolo si es nuevo."""
+        codigo = self._codigos.get(valor)
+        if codigo is None:
+            codigo = len(self._valores)
+            normalizado = normalizar(valor)
+            self._codigos[valor] = codigo
+            self._valores.append(valor)
+            self._normalizados.append(normalizado)
+            self.canonicos.append(self._claves.setdefault(normalizado, codigo))
+        return codigo
+
+    def valor(self, codigo: int) -> Optional[str]:
+        """Retorna el texto exacto de un código."""
+        return self._valores[codigo]
+
+    def clave(self, valor: Optional[str]) -> int:
+        """Retorna el código canónico de un texto, internándolo si es nuevo."""
+        return self.canonicos[self.codificar(valor)]
+
+    def buscar(self, valor: Optional[str]) -> Optional[int]:
+        """
+        Retorna el código canónico de un texto sin internarlo.
+
+        Returns:
+            Optional[int]: Código canónico, o None si ningún mueble tiene ese valor
+        """
+        return self._claves.get(normalizar(valor))
+
+    def textos(self) -> List[Optional[str]]:
+        """Retorna el texto exacto de cada código, indexado por código."""
+        return list(self._valores)
+
+    def normalizados(self) -> List[str]:
+        """Retorna el texto normalizado de cada código, indexado por código."""
+        return list(self._normalizados)
+
+    def __len__(self) -> int:
+        return len(self._valores)
+
+
+MATERIALES = Vocabulario("material")
+COLORES = Vocabulario("color")
+TAPIZADOS = Vocabulario("material_tapizado")
+FORMAS = Vocabulario("forma")
+TAMAÑOS = Vocabulario("tamaño")
+MECANISMOS = Vocabulario("mecanismo_conversion")
+
+# Atributo público -> vocabulario; el código se guarda en "_" + atributo
+VOCABULARIOS: Dict[str, Vocabulario] = {
+    vocabulario.nombre: vocabulario
+    for vocabulario in (MATERIALES, COLORES, TAPIZADOS, FORMAS, TAMAÑOS, MECANISMOS)
+}
@@ -1,2 +1,366 @@
-# Catalogo
+"""
+Catálogo de productos y carga masiva desde archivos CSV o JSONL.
 
+Los archivos se leen en streaming: cada fila se convierte en el mueble
+concreto que indica su columna "tipo" y se agrega a la tienda por lotes, de
+modo que la memoria adicional no crece con el tamaño del archivo.
+
+Un Catalogo guarda una sola definición por producto (con su precio y su
+descripción en caché) para compartirla entre varias tiendas del mismo
+proceso, junto con el índice de nombres; cada tienda conserva solo la
+referencia, sus existencias y sus descuentos.
+"""
+
+import csv
+import inspect
+import json
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models.mueble import Mueble
+from services.indices import IndiceTrigramas, normalizar_texto
+from models.concretos.armario import Armario
+from models.concretos.cajonera import Cajonera
+from models.concretos.cama import Cama
+from models.concretos.escritorio import Escritorio
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sillon import Sillon
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+
+# Registro de tipos: valor de la columna "tipo" -> clase concreta
+TIPOS_MUEBLE: Dict[str, type] = {
+    "silla": Silla,
+    "sillon": Sillon,
+    "sofa": Sofa,
+    "mesa": Mesa,
+    "cama": Cama,
+    "sofacama": SofaCama,
+    "armario": Armario,
+    "cajonera": Cajonera,
+    "escritorio": Escritorio,
+}
+
+_VERDADEROS = {"1", "true", "si", "sí", "s", "yes", "y", "verdadero"}
+
+_parametros_cache: Dict[type, List[inspect.Parameter]] = {}
+
+
+def registrar_tipo(nombre: str, clase: type) -> None:
+    """
+    Registra una clase concreta para que el cargador pueda construirla.
+
+    Args:
+        nombre: Valor de la columna "tipo" (se normaliza a minúsculas)
+        clase: Subclase concreta de Mueble
+    """
+    TIPOS_MUEBLE[nombre.lower().strip()] = clase
+
+
+def parametros_constructor(clase: type) -> List[inspect.Parameter]:
+    """Retorna (con caché) los parámetros del constructor de una clase."""
+    parametros = _parametros_cache.get(clase)
+    if parametros is None:
+        firma = inspect.signature(clase.__init__)
+        parametros = [p for p in firma.parameters.values() if p.name != "self"]
+        _parametros_cache[clase] = parametros
+    return parametros
+
+
+def _convertir(valor, anotacion):
+    """Convierte un valor leído del archivo al tipo anotado del parámetro."""
+    if isinstance(valor, str):
+        valor = valor.strip()
+        if anotacion is bool:
+            return valor.lower() in _VERDADEROS
+        if anotacion is int:
+            return int(float(valor))
+        if anotacion is float:
+            return float(valor)
+    return valor
+
+
+def nombre_tipo(mueble: "Mueble") -> str:
+    """Retorna la clave de registro del tipo de un mueble."""
+    for nombre, clase in TIPOS_MUEBLE.items():
+        if type(mueble) is clase:
+            return nombre
+    raise ValueError(f"Tipo no registrado: {type(mueble).__name__}")
+
+
+def crear_mueble(registro: Dict) -> "Mueble":
+    """
+    Construye el mueble concreto descrito por un registro.
+
+    Args:
+        registro: Diccionario con la clave "tipo", los argumentos del
+            constructor y, opcionalmente, los atributos de estado de la clase
+            (Mueble.atributos_estado); los valores vacíos o ausentes toman su
+            valor por defecto
+
+    Returns:
+        Mueble: Instancia de la clase registrada para el tipo
+
+    Raises:
+        ValueError: Si el tipo no está registrado o falta un argumento obligatorio
+    """
+    tipo = str(registro.get("tipo", "")).lower().strip()
+    clase = TIPOS_MUEBLE.get(tipo)
+    if clase is None:
+        raise ValueError(f"Tipo de mueble desconocido: '{tipo}'")
+    argumentos = {}
+    for parametro in parametros_constructor(clase):
+        valor = registro.get(parametro.name)
+        if valor is None or valor == "":
+            if parametro.default is inspect.Parameter.empty:
+                raise ValueError(f"Falta el campo obligatorio '{parametro.name}'")
+            continue
+        argumentos[parametro.name] = _convertir(valor, parametro.annotation)
+    mueble = clase(**argumentos)
+    for atributo in clase.atributos_estado:
+        valor = registro.get(atributo)
+        if valor is not None and valor != "":
+            setattr(mueble, atributo, valor)
+    return mueble
+
+
+def a_registro(mueble: "Mueble") -> Dict:
+    """
+    Convierte un mueble en el registro que crear_mueble sabe reconstruir.
+
+    Args:
+        mueble: Mueble de un tipo registrado
+
+    Returns:
+        Dict: Registro con "tipo", los argumentos del constructor y los
+            atributos de estado
+    """
+    registro = {"tipo": nombre_tipo(mueble)}
+    for parametro in parametros_constructor(type(mueble)):
+        registro[parametro.name] = getattr(mueble, parametro.name)
+    for atributo in type(mueble).atributos_estado:
+        registro[atributo] = getattr(mueble, atributo)
+    return registro
+
+
+class Catalogo:
+    """
+    Definiciones de producto compartidas entre tiendas.
+
+    Dos muebles son el mismo producto si son de la misma clase y tienen los
+    mismos argumentos de constructor. registrar devuelve la definición ya
+    existente en lugar del mueble recibido, de modo que todas las tiendas que
+    usan el catálogo guardan referencias al mismo objeto y la memoria crece
+    con los productos distintos, no con tiendas × productos.
+
+    El catálogo mantiene además el índice de trigramas de los nombres,
+    indexado por el código de cada definición, que las tiendas consultan en
+    lugar de construir uno propio. Los cambios sobre una definición se ven en
+    todas las tiendas que la usan.
+    """
+
+    def __init__(self):
+        self._productos: Dict[tuple, "Mueble"] = {}  # clave -> definición
+        self._claves: Dict[int, tuple] = {}  # id(definición) -> clave
+        self._definiciones: Dict[int, "Mueble"] = {}  # id(definición) -> definición
+        self._codigos: Dict[int, int] = {}  # id(definición) -> código
+        self._descripciones: Dict[int, str] = {}  # id(definición) -> descripción
+        self._indice_nombres = IndiceTrigramas()
+
+    @property
+    def indice_nombres(self) -> IndiceTrigramas:
+        """Índice de nombres de todas las definiciones, por código."""
+        return self._indice_nombres
+
+    @staticmethod
+    def _clave(mueble: "Mueble") -> tuple:
+        """
+        Identidad de un producto: su clase, sus argumentos de constructor y
+        sus atributos de estado.
+        """
+        clase = type(mueble)
+        return (
+            (clase,)
+            + tuple(
+                getattr(mueble, parametro.name)
+                for parametro in parametros_constructor(clase)
+            )
+            + tuple(getattr(mueble, atributo) for atributo in clase.atributos_estado)
+        )
+
+    def registrar(self, mueble: "Mueble", compartir: bool = True) -> "Mueble":
+        """
+        Retorna la definición compartida de un producto, registrando el
+        mueble recibido si es la primera vez que aparece.
+
+        Args:
+            mueble: Mueble que describe el producto
+            compartir: Con False el mueble se registra como definición propia
+                aunque ya exista una igual (la compartida no cambia)
+        Returns:
+            Mueble: Definición compartida (el mismo mueble si es nuevo)
+        """
+        if id(mueble) in self._definiciones:
+            return mueble
+        clave = self._clave(mueble)
+        definicion = self._productos.get(clave) if compartir else None
+        if definicion is None:
+            definicion = self._productos.setdefault(clave, mueble)
+            codigo = len(self._codigos)
+            self._claves[id(mueble)] = clave
+            self._definiciones[id(mueble)] = mueble
+            self._codigos[id(mueble)] = codigo
+            self._indice_nombres.agregar(codigo, mueble.nombre, mueble)
+            mueble._suscribir(self._al_cambiar)
+            return mueble
+        return definicion
+
+    def registrar_lote(self, muebles: Iterable["Mueble"]) -> List["Mueble"]:
+        """Aplica registrar a cada mueble, conservando el orden."""
+        return [self.registrar(mueble) for mueble in muebles]
+
+    def _al_cambiar(self, mueble: "Mueble") -> None:
+        """
+        Observador de las definiciones: descarta la descripción en caché y
+        vuelve a indexar el producto con sus nuevos atributos.
+        Método privado auxiliar.
+        """
+        self._descripciones.pop(id(mueble), None)
+        codigo = self._codigos[id(mueble)]
+        if self._indice_nombres.texto(codigo) != normalizar_texto(mueble.nombre):
+            self._indice_nombres.quitar(codigo)
+            self._indice_nombres.agregar(codigo, mueble.nombre, mueble)
+        anterior = self._claves[id(mueble)]
+        if self._productos.get(anterior) is mueble:
+            del self._productos[anterior]
+        clave = self._clave(mueble)
+        self._claves[id(mueble)] = clave
+        # Si ya existe otra definición igual, esa sigue siendo la compartida
+        self._productos.setdefault(clave, mueble)
+
+    def descripcion(self, mueble: "Mueble") -> str:
+        """
+        Retorna la descripción de un producto, calculándola una sola vez por
+        definición hasta que la definición cambie.
+
+        Args:
+            mueble: Definición del catálogo (otros muebles no se guardan en caché)
+        Returns:
+            str: Descripción completa del mueble
+        """
+        if id(mueble) not in self._definiciones:
+            return mueble.obtener_descripcion()
+        descripcion = self._descripciones.get(id(mueble))
+        if descripcion is None:
+            descripcion = self._descripciones[id(mueble)] = mueble.obtener_descripcion()
+        return descripcion
+
+    def __contains__(self, mueble: "Mueble") -> bool:
+        return id(mueble) in self._definiciones
+
+    def __len__(self) -> int:
+        return len(self._definiciones)
+
+    def __iter__(self) -> Iterator["Mueble"]:
+        return iter(self._definiciones.values())
+
+
+def _construir(
+    filas: Iterable[Tuple[int, Dict]], errores: Optional[list]
+) -> Iterator["Mueble"]:
+    """
+    Construye muebles a partir de filas numeradas.
+    Si se proporciona la lista errores, las filas inválidas se registran en
+    ella como (línea, mensaje) y se omiten; si no, se propaga el ValueError.
+    """
+    for linea, registro in filas:
+        try:
+            yield crear_mueble(registro)
+        except (ValueError, TypeError) as e:
+            if errores is None:
+                raise ValueError(f"Línea {linea}: {e}") from e
+            errores.append((linea, str(e)))
+
+
+def leer_csv(ruta: str, errores: Optional[list] = None) -> Iterator["Mueble"]:
+    """
+    Lee un catálogo CSV en streaming.
+    La primera fila es la cabecera: "tipo" más los nombres de los argumentos
+    del constructor.
+
+    Args:
+        ruta: Ruta del archivo CSV
+        errores: Lista opcional donde registrar filas inválidas
+
+    Returns:
+        Iterator[Mueble]: Muebles construidos, uno por fila
+    """
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        lector = csv.DictReader(archivo)
+        yield from _construir(enumerate(lector, 2), errores)
+
+
+def leer_jsonl(ruta: str, errores: Optional[list] = None) -> Iterator["Mueble"]:
+    """
+    Lee un catálogo JSONL (un objeto JSON por línea) en streaming.
+
+    Args:
+        ruta: Ruta del archivo JSONL
+        errores: Lista opcional donde registrar líneas inválidas
+
+    Returns:
+        Iterator[Mueble]: Muebles construidos, uno por línea
+    """
+
+    def filas():
+        with open(ruta, encoding="utf-8") as archivo:
+            for linea, texto in enumerate(archivo, 1):
+                if not texto.strip():
+                    continue
+                try:
+                    yield linea, json.loads(texto)
+                except json.JSONDecodeError as e:
+                    if errores is None:
+                        raise ValueError(f"Línea {linea}: JSON inválido: {e}") from e
+                    errores.append((linea, f"JSON inválido: {e}"))
+
+    yield from _construir(filas(), errores)
+
+
+def cargar_catalogo(
+    tienda,
+    ruta: str,
+    formato: Optional[str] = None,
+    tam_lote: int = 10_000,
+    errores: Optional[list] = None,
+) -> Dict[str, int]:
+    """
+    Carga un catálogo completo en la tienda usando el alta masiva por lotes.
+
+    Args:
+        tienda: Instancia de TiendaMuebles destino
+        ruta: Ruta del archivo
+        formato: "csv" o "jsonl"; si se omite se deduce de la extensión
+        tam_lote: Número de muebles que se agregan por llamada a agregar_muebles
+        errores: Lista opcional donde registrar filas inválidas
+
+    Returns:
+        Dict[str, int]: Totales de muebles agregados y rechazados
+    """
+    formato = (formato or ruta.rsplit(".", 1)[-1]).lower()
+    if formato == "csv":
+        muebles = leer_csv(ruta, errores)
+    elif formato in ("jsonl", "ndjson"):
+        muebles = leer_jsonl(ruta, errores)
+    else:
+        raise ValueError(f"Formato de catálogo no soportado: '{formato}'")
+    totales = {"agregados": 0, "rechazados": 0}
+    while True:
+        lote = list(islice(muebles, tam_lote))
+        if not lote:
+            break
+        resultado = tienda.agregar_muebles(lote)
+        totales["agregados"] += resultado["agregados"]
+        totales["rechazados"] += resultado["rechazados"]
+    return totales
@@ -0,0 +1,377 @@
+"""
+Motor de descuentos jerárquico.
+
+Cada regla aplica un porcentaje a una clase de mueble (concreta o de
+categoría, ej: Asiento) y, opcionalmente, solo a un material o a una banda de
+precios. Las reglas de una clase alcanzan a todas sus subclases siguiendo el
+MRO: un descuento en Sofa o en Asiento llega también a SofaCama.
+
+Las reglas se compilan en una tabla por clase concreta con las reglas que le
+aplican, ordenadas de la más específica a la más general. Si ninguna tiene
+condiciones, la tabla guarda directamente el descuento resultante, de modo
+que consultar el descuento de un mueble cuesta O(1).
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from models.categorias.almacenamiento import Almacenamiento
+from models.categorias.asientos import Asiento
+from models.categorias.superficies import Superficie
+from models.mueble import Mueble
+from services.catalogo import TIPOS_MUEBLE
+from services.indices import normalizar_texto
+
+# Políticas para combinar varias reglas que aplican a un mismo mueble
+MAS_ESPECIFICO = "mas_especifico"  # gana la regla de la clase más cercana
+MAXIMO = "maximo"  # gana el mayor descuento
+ACUMULATIVO = "acumulativo"  # los descuentos se encadenan: 1 - Π(1 - d)
+POLITICAS = (MAS_ESPECIFICO, MAXIMO, ACUMULATIVO)
+
+# Nombres de categoría reconocidos además de los tipos del catálogo
+_CATEGORIAS: Dict[str, type] = {
+    "asiento": Asiento,
+    "superficie": Superficie,
+    "almacenamiento": Almacenamiento,
+    "mueble": Mueble,
+    "todo": Mueble,
+}
+
+
+_VOCALES = "aeiou"
+
+
+def _singulares(clave: str) -> List[str]:
+    """
+    Retorna la clave y sus posibles singulares según las reglas del plural
+    en español: "-s" tras vocal (sillas, sofás) y "-es" tras consonante
+    (sillones, con la tilde ya quitada por normalizar_texto).
+    """
+    candidatas = [clave]
+    if len(clave) > 2 and clave.endswith("es") and clave[-3] not in _VOCALES:
+        candidatas.append(clave[:-2])
+    if len(clave) > 1 and clave.endswith("s") and clave[-2] in _VOCALES:
+        candidatas.append(clave[:-1])
+    return candidatas
+
+
+def resolver_categoria(nombre: str) -> Optional[type]:
+    """
+    Convierte un nombre de categoría en su clase, aceptando plurales,
+    mayúsculas y tildes (ej: "sillas", "Sofás", "asientos", "Sillones").
+    Solo se quitan terminaciones de plural reales: "sillax" o "mesazz" no se
+    reconocen.
+
+    Args:
+        nombre: Nombre de la categoría o de la clase
+
+    Returns:
+        Optional[type]: Clase correspondiente, o None si no se reconoce
+    """
+    for candidata in _singulares(normalizar_texto(nombre).replace(" ", "")):
+        clase = TIPOS_MUEBLE.get(candidata) or _CATEGORIAS.get(candidata)
+        if clase is not None:
+            return clase
+    return None
+
+
+class ReglaDescuento:
+    """
+    Regla de descuento sobre una clase, con condiciones opcionales de
+    material y de banda de precios (precio_min <= precio <= precio_max).
+    """
+
+    __slots__ = ("clase", "porcentaje", "material", "precio_min", "precio_max")
+
+    def __init__(
+        self,
+        clase: type,
+        porcentaje: float,
+        material: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+    ):
+        """
+        Args:
+            clase: Clase a la que aplica la regla (y sus subclases)
+            porcentaje: Descuento como fracción (0.1 = 10%)
+            material: Material requerido, o None para cualquiera
+            precio_min: Precio mínimo (inclusivo), o None
+            precio_max: Precio máximo (inclusivo), o None
+        """
+        if not 0 < porcentaje <= 1:
+            raise ValueError("El descuento debe estar entre 0 y 1")
+        self.clase = clase
+        self.porcentaje = porcentaje
+        self.material = material.lower().strip() if material else None
+        self.precio_min = precio_min
+        self.precio_max = precio_max
+
+    @property
+    def clave(self) -> Tuple:
+        """Identifica la regla: una regla nueva con la misma clave la reemplaza."""
+        return (self.clase, self.material, self.precio_min, self.precio_max)
+
+    @property
+    def condicional(self) -> bool:
+        """True si la regla depende del material o del precio del mueble."""
+        return (
+            self.material is not None
+            or self.precio_min is not None
+            or self.precio_max is not None
+        )
+
+    def aplica(self, mueble: "Mueble", precio: float) -> bool:
+        """Evalúa las condiciones de la regla para un mueble y su precio."""
+        return self.cumple(getattr(mueble, "material", None), precio)
+
+    def cumple(self, material: Optional[str], precio: float) -> bool:
+        """Evalúa las condiciones de la regla para un material y un precio."""
+        if self.material is not None and (
+            (material or "").lower().strip() != self.material
+        ):
+            return False
+        if self.precio_min is not None and precio < self.precio_min:
+            return False
+        if self.precio_max is not None and precio > self.precio_max:
+            return False
+        return True
+
+    def etiqueta(self) -> str:
+        """Describe la regla para mostrarla (ej: "Asiento [madera, $100-$500]")."""
+        condiciones = []
+        if self.material is not None:
+            condiciones.append(self.material)
+        if self.precio_min is not None or self.precio_max is not None:
+            minimo = f"${self.precio_min:g}" if self.precio_min is not None else ""
+            maximo = f"${self.precio_max:g}" if self.precio_max is not None else ""
+            condiciones.append(f"{minimo}-{maximo}")
+        if not condiciones:
+            return self.clase.__name__
+        return f"{self.clase.__name__} [{', '.join(condiciones)}]"
+
+    def a_registro(self) -> Dict:
+        """Convierte la regla en un diccionario serializable."""
+        return {
+            "categoria": self.clase.__name__,
+            "valor": self.porcentaje,
+            "material": self.material,
+            "precio_min": self.precio_min,
+            "precio_max": self.precio_max,
+        }
+
+
+class MotorDescuentos:
+    """
+    Conjunto de reglas de descuento con una política para combinarlas.
+
+    La tabla compilada se construye por clase concreta la primera vez que se
+    consulta y se descarta completa cuando cambian las reglas o la política.
+    Cada entrada es (descuento fijo o None, reglas por especificidad): el
+    descuento fijo existe cuando ninguna regla de la clase tiene condiciones.
+    """
+
+    def __init__(self, politica: str = MAS_ESPECIFICO):
+        """
+        Args:
+            politica: MAS_ESPECIFICO, MAXIMO o ACUMULATIVO
+        """
+        self._reglas: Dict[Tuple, ReglaDescuento] = {}
+        self._tabla: Dict[type, Tuple[Optional[float], List[Tuple[int, ReglaDescuento]]]] = {}
+        self._version = 0
+        self.politica = politica
+
+    @property
+    def politica(self) -> str:
+        """Getter para la política de combinación."""
+        return self._politica
+
+    @politica.setter
+    def politica(self, value: str) -> None:
+        """Setter para la política; invalida la tabla compilada."""
+        if value not in POLITICAS:
+            raise ValueError(f"Política de descuentos desconocida: '{value}'")
+        self._politica = value
+        self._invalidar()
+
+    @property
+    def version(self) -> int:
+        """Contador que cambia con cada modificación de reglas o política."""
+        return self._version
+
+    @property
+    def condicional(self) -> bool:
+        """True si alguna regla depende del material o del precio."""
+        return any(regla.condicional for regla in self._reglas.values())
+
+    def _invalidar(self) -> None:
+        self._tabla.clear()
+        self._version += 1
+
+    def agregar_regla(self, regla: ReglaDescuento) -> None:
+        """Agrega una regla, reemplazando la que tenga la misma clave."""
+        self._reglas[regla.clave] = regla
+        self._invalidar()
+
+    def quitar_regla(self, clave: Tuple) -> bool:
+        """
+        Quita la regla con la clave dada.
+
+        Returns:
+            bool: True si la regla existía
+        """
+        if self._reglas.pop(clave, None) is None:
+            return False
+        self._invalidar()
+        return True
+
+    def copiar(self) -> "MotorDescuentos":
+        """Retorna un motor independiente con la misma política y reglas."""
+        copia = MotorDescuentos(self._politica)
+        copia._reglas = dict(self._reglas)
+        return copia
+
+    def reglas(self) -> List[ReglaDescuento]:
+        """Retorna las reglas activas en el orden en que se agregaron."""
+        return list(self._reglas.values())
+
+    def _combinar(self, descuentos: Sequence[Tuple[int, float]]) -> float:
+        """
+        Combina los descuentos (distancia en el MRO, porcentaje) que aplican a
+        un mueble según la política.
+        """
+        if not descuentos:
+            return 0.0
+        if self._politica == MAXIMO:
+            return max(porcentaje for _, porcentaje in descuentos)
+        if self._politica == ACUMULATIVO:
+            restante = 1.0
+            for _, porcentaje in descuentos:
+                restante *= 1 - porcentaje
+            return 1 - restante
+        distancia = descuentos[0][0]
+        return max(porcentaje for d, porcentaje in descuentos if d == distancia)
+
+    def _compilar(self, clase: type):
+        """Construye la entrada de la tabla para una clase concreta."""
+        distancias = {c: d for d, c in enumerate(clase.__mro__)}
+        reglas = sorted(
+            (
+                (distancias[regla.clase], regla)
+                for regla in self._reglas.values()
+                if regla.clase in distancias
+            ),
+            key=lambda par: par[0],
+        )
+        fijo = None
+        if not any(regla.condicional for _, regla in reglas):
+            fijo = self._combinar([(d, regla.porcentaje) for d, regla in reglas])
+        entrada = (fijo, reglas)
+        self._tabla[clase] = entrada
+        return entrada
+
+    def descuento(self, mueble: "Mueble", precio: float) -> float:
+        """
+        Retorna el descuento (fracción) que corresponde a un mueble.
+
+        Args:
+            mueble: Mueble a evaluar
+            precio: Precio del mueble, para las reglas por banda de precios
+        """
+        return self.descuento_atributos(
+            type(mueble), getattr(mueble, "material", None), precio
+        )
+
+    def descuento_atributos(
+        self, clase: type, material: Optional[str], precio: float
+    ) -> float:
+        """
+        Retorna el descuento (fracción) de un mueble descrito por su clase,
+        su material y su precio, sin necesitar el objeto.
+        """
+        entrada = self._tabla.get(clase) or self._compilar(clase)
+        fijo, reglas = entrada
+        if fijo is not None:
+            return fijo
+        return self._combinar(
+            [(d, regla.porcentaje) for d, regla in reglas if regla.cumple(material, precio)]
+        )
+
+    def descuento_clase(self, clase: type) -> Optional[float]:
+        """
+        Retorna el descuento fijo de una clase, o None si depende del material
+        o del precio de cada mueble.
+        """
+        entrada = self._tabla.get(clase) or self._compilar(clase)
+        return entrada[0]
+
+    def aplicar(
+        self, muebles: Iterable["Mueble"], precios: Iterable[float]
+    ) -> List[float]:
+        """
+        Calcula los precios con descuento de un conjunto de muebles.
+        Las clases sin reglas condicionales se resuelven con una sola consulta
+        a la tabla por clase.
+
+        Args:
+            muebles: Muebles a evaluar
+            precios: Precio de cada mueble, en el mismo orden
+        Returns:
+            List[float]: Precio final de cada mueble, redondeado a centavos
+        """
+        tabla = self._tabla
+        resultado = []
+        for mueble, precio in zip(muebles, precios):
+            clase = type(mueble)
+            entrada = tabla.get(clase) or self._compilar(clase)
+            descuento = entrada[0]
+            if descuento is None:
+                descuento = self.descuento(mueble, precio)
+            resultado.append(round(precio * (1 - descuento), 2))
+        return resultado
+
+    def resumen(self) -> Dict[str, float]:
+        """Retorna {etiqueta de la regla: porcentaje} de las reglas activas."""
+        return {regla.etiqueta(): regla.porcentaje for regla in self._reglas.values()}
+
+    def a_registro(self) -> Dict:
+        """Convierte política y reglas en un diccionario serializable."""
+        return {
+            "politica": self._politica,
+            "reglas": [regla.a_registro() for regla in self._reglas.values()],
+        }
+
+    @classmethod
+    def desde_registro(cls, registro) -> "MotorDescuentos":
+        """
+        Reconstruye un motor desde a_registro o desde el formato anterior
+        {NombreClase: porcentaje}.
+        """
+        if "reglas" not in registro:
+            registro = {
+                "politica": MAS_ESPECIFICO,
+                # Antes se aceptaba cualquier nombre; los que no corresponden a
+                # una clase nunca aplicaban, así que se omiten
+                "reglas": [
+                    {"categoria": nombre, "valor": valor}
+                    for nombre, valor in registro.items()
+                    if resolver_categoria(nombre) is not None
+                ],
+            }
+        motor = cls(registro.get("politica", MAS_ESPECIFICO))
+        for datos in registro["reglas"]:
+            motor.agregar_regla(regla_desde_registro(datos))
+        return motor
+
+
+def regla_desde_registro(datos: Dict) -> ReglaDescuento:
+    """Reconstruye una regla desde ReglaDescuento.a_registro."""
+    clase = resolver_categoria(datos["categoria"])
+    if clase is None:
+        raise ValueError(f"Categoría desconocida: '{datos['categoria']}'")
+    return ReglaDescuento(
+        clase,
+        datos["valor"],
+        datos.get("material"),
+        datos.get("precio_min"),
+        datos.get("precio_max"),
+    )
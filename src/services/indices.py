@@ -0,0 +1,364 @@
+"""
+Índices secundarios del inventario.
+Cada índice se mantiene al agregar, vender o modificar un mueble, de modo que
+las consultas no necesiten recorrer todo el inventario.
+"""
+
+import sys
+import unicodedata
+from abc import ABC
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from models.mueble import Mueble
+from models.vocabulario import VACIO, VOCABULARIOS
+
+
+def clave_atributo(mueble: "Mueble", atributo: str) -> int:
+    """
+    Retorna el código canónico de un atributo internado de un mueble
+    (ver models.vocabulario), o VACIO si no lo tiene.
+    """
+    if isinstance(mueble, Mueble):
+        return mueble.clave(atributo)
+    return VOCABULARIOS[atributo].clave(getattr(mueble, atributo, None))
+
+
+class IndicePrecios:
+    """
+    Índice ordenado por precio.
+
+    Guarda pares (precio, clave) ordenados y, en paralelo, los muebles
+    correspondientes. La clave desempata muebles con el mismo precio y permite
+    localizar una entrada exacta con búsqueda binaria.
+
+    Las consultas por rango cuestan O(log n + k). Insertar o quitar usa
+    búsqueda binaria más un desplazamiento de memoria de la lista.
+    """
+
+    def __init__(self):
+        """Crea un índice vacío."""
+        self._claves: List[Tuple[float, int]] = []
+        self._muebles: List[Mueble] = []
+
+    def agregar(self, precio: float, clave: int, mueble: "Mueble") -> None:
+        """
+        Inserta un mueble en su posición ordenada.
+
+        Args:
+            precio: Precio del mueble
+            clave: Identificador único del mueble dentro del inventario
+            mueble: Mueble a indexar
+        """
+        entrada = (precio, clave)
+        posicion = bisect_right(self._claves, entrada)
+        self._claves.insert(posicion, entrada)
+        self._muebles.insert(posicion, mueble)
+
+    def agregar_lote(self, entradas: Iterable[Tuple[float, int, "Mueble"]]) -> None:
+        """
+        Inserta muchas entradas (precio, clave, mueble) de una vez.
+        Si el lote es grande respecto al índice, lo reconstruye con un único
+        ordenamiento en lugar de hacer una inserción por entrada.
+        """
+        entradas = list(entradas)
+        if len(entradas) * 8 < len(self._claves):
+            for precio, clave, mueble in entradas:
+                self.agregar(precio, clave, mueble)
+            return
+        combinadas = list(zip(self._claves, self._muebles))
+        combinadas.extend(((precio, clave), mueble) for precio, clave, mueble in entradas)
+        combinadas.sort(key=itemgetter(0))
+        self._claves = [entrada for entrada, _ in combinadas]
+        self._muebles = [mueble for _, mueble in combinadas]
+
+    def quitar(self, precio: float, clave: int) -> bool:
+        """
+        Quita la entrada (precio, clave) del índice.
+
+        Returns:
+            bool: True si la entrada existía
+        """
+        entrada = (precio, clave)
+        posicion = bisect_left(self._claves, entrada)
+        if posicion < len(self._claves) and self._claves[posicion] == entrada:
+            del self._claves[posicion]
+            del self._muebles[posicion]
+            return True
+        return False
+
+    def rango(self, precio_min: float, precio_max: float) -> List["Mueble"]:
+        """
+        Retorna los muebles con precio_min <= precio <= precio_max,
+        ordenados de menor a mayor precio.
+        """
+        inicio = bisect_left(self._claves, (precio_min,))
+        fin = bisect_right(self._claves, (precio_max, float("inf")))
+        return self._muebles[inicio:fin]
+
+    def ascendente(self) -> Iterator["Mueble"]:
+        """Itera los muebles de menor a mayor precio."""
+        return iter(self._muebles)
+
+    def descendente(self) -> Iterator["Mueble"]:
+        """Itera los muebles de mayor a menor precio."""
+        return reversed(self._muebles)
+
+    def minimo(self) -> Optional["Mueble"]:
+        """Retorna el mueble más económico, o None si el índice está vacío."""
+        return self._muebles[0] if self._muebles else None
+
+    def maximo(self) -> Optional["Mueble"]:
+        """Retorna el mueble más costoso, o None si el índice está vacío."""
+        return self._muebles[-1] if self._muebles else None
+
+    def __len__(self) -> int:
+        return len(self._claves)
+
+
+def normalizar_texto(texto: str) -> str:
+    """
+    Normaliza un texto para búsquedas: quita tildes y diacríticos y aplica
+    case folding, de modo que "Sofá" y "SOFA" producen "sofa".
+
+    Args:
+        texto: Texto original
+
+    Returns:
+        str: Texto normalizado (vacío si texto es None o vacío)
+    """
+    if not texto:
+        return ""
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    sin_tildes = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return sin_tildes.casefold().strip()
+
+
+class IndiceTrigramas:
+    """
+    Índice invertido de n-gramas (trigramas por defecto) sobre nombres.
+
+    Cada n-grama del nombre normalizado apunta al conjunto de claves de los
+    muebles que lo contienen. Una búsqueda por subcadena intersecta los
+    conjuntos de los n-gramas de la consulta, empezando por el más pequeño, y
+    solo verifica la subcadena sobre esos candidatos. Las consultas más cortas
+    que un n-grama recorren los nombres normalizados ya guardados.
+    """
+
+    def __init__(self, n: int = 3):
+        """
+        Crea un índice vacío.
+
+        Args:
+            n: Longitud de los n-gramas
+        """
+        self._n = n
+        self._publicaciones: Dict[str, Set[int]] = {}
+        self._textos: Dict[int, str] = {}
+        self._muebles: Dict[int, Mueble] = {}
+
+    def _ngramas(self, texto: str) -> Set[str]:
+        """Retorna el conjunto de n-gramas de un texto normalizado."""
+        return {texto[i : i + self._n] for i in range(len(texto) - self._n + 1)}
+
+    def agregar(self, clave: int, texto: str, mueble: "Mueble") -> None:
+        """
+        Indexa el texto de un mueble.
+
+        Args:
+            clave: Identificador único del mueble dentro del inventario
+            texto: Texto original (se normaliza)
+            mueble: Mueble a indexar
+        """
+        normalizado = normalizar_texto(texto)
+        self._textos[clave] = normalizado
+        self._muebles[clave] = mueble
+        for ngrama in self._ngramas(normalizado):
+            self._publicaciones.setdefault(ngrama, set()).add(clave)
+
+    def quitar(self, clave: int) -> bool:
+        """
+        Quita un mueble del índice.
+
+        Returns:
+            bool: True si la clave estaba indexada
+        """
+        normalizado = self._textos.pop(clave, None)
+        if normalizado is None:
+            return False
+        del self._muebles[clave]
+        for ngrama in self._ngramas(normalizado):
+            claves = self._publicaciones[ngrama]
+            claves.discard(clave)
+            if not claves:
+                del self._publicaciones[ngrama]
+        return True
+
+    def texto(self, clave: int) -> Optional[str]:
+        """Retorna el texto normalizado guardado para una clave."""
+        return self._textos.get(clave)
+
+    def buscar(self, consulta: str) -> List["Mueble"]:
+        """
+        Busca muebles cuyo texto normalizado contenga la consulta.
+
+        Args:
+            consulta: Subcadena a buscar (se normaliza)
+
+        Returns:
+            List[Mueble]: Muebles que coinciden, ordenados por clave
+        """
+        consulta = normalizar_texto(consulta)
+        if not consulta:
+            return []
+        if len(consulta) < self._n:
+            candidatos = self._textos.keys()
+        else:
+            publicaciones = []
+            for ngrama in self._ngramas(consulta):
+                claves = self._publicaciones.get(ngrama)
+                if not claves:
+                    return []
+                publicaciones.append(claves)
+            publicaciones.sort(key=len)
+            candidatos = publicaciones[0].intersection(*publicaciones[1:])
+        return [
+            self._muebles[clave]
+            for clave in sorted(candidatos)
+            if consulta in self._textos[clave]
+        ]
+
+    def __len__(self) -> int:
+        return len(self._textos)
+
+
+class IndiceAtributo:
+    """
+    Índice hash sobre un atributo de texto (material, color, tapizado...).
+
+    Cada valor normalizado (minúsculas, sin espacios sobrantes) apunta a un
+    cubo {clave: mueble}; un filtro devuelve el cubo directamente y quitar un
+    mueble cuesta O(1). Los valores se identifican por su código canónico en
+    el vocabulario del atributo, así que mantener el índice compara enteros.
+    """
+
+    def __init__(self, atributo: str):
+        """
+        Crea un índice vacío.
+
+        Args:
+            atributo: Nombre del atributo indexado (ej: "material")
+        """
+        self._atributo = atributo
+        self._vocabulario = VOCABULARIOS[atributo]
+        self._cubos: Dict[int, Dict[int, Mueble]] = {}
+        self._valores: Dict[int, int] = {}
+
+    def agregar(self, clave: int, mueble: "Mueble") -> None:
+        """Indexa un mueble por el valor actual de su atributo."""
+        valor = clave_atributo(mueble, self._atributo)
+        if valor == VACIO:
+            return
+        self._valores[clave] = valor
+        self._cubos.setdefault(valor, {})[clave] = mueble
+
+    def quitar(self, clave: int) -> bool:
+        """
+        Quita un mueble del índice.
+
+        Returns:
+            bool: True si la clave estaba indexada
+        """
+        valor = self._valores.pop(clave, None)
+        if valor is None:
+            return False
+        cubo = self._cubos[valor]
+        del cubo[clave]
+        if not cubo:
+            del self._cubos[valor]
+        return True
+
+    def actualizar(self, clave: int, mueble: "Mueble") -> None:
+        """Reubica un mueble si el valor de su atributo cambió."""
+        valor = clave_atributo(mueble, self._atributo)
+        if self._valores.get(clave, VACIO) != valor:
+            self.quitar(clave)
+            self.agregar(clave, mueble)
+
+    def buscar(self, valor: str) -> List["Mueble"]:
+        """
+        Retorna los muebles cuyo atributo coincide con el valor dado.
+
+        Args:
+            valor: Valor a buscar (se normaliza)
+        """
+        cubo = self._cubos.get(self._vocabulario.buscar(valor))
+        return list(cubo.values()) if cubo else []
+
+    def estadisticas(self) -> dict:
+        """
+        Describe el estado del índice.
+
+        Returns:
+            dict: Atributo, número de cubos, tamaño de cada cubo y memoria
+            aproximada en bytes de las estructuras del índice
+        """
+        memoria = sys.getsizeof(self._cubos) + sys.getsizeof(self._valores)
+        memoria += sum(sys.getsizeof(cubo) for cubo in self._cubos.values())
+        normalizados = self._vocabulario.normalizados()
+        return {
+            "atributo": self._atributo,
+            "cubos": len(self._cubos),
+            "tamaños": {
+                normalizados[valor]: len(cubo) for valor, cubo in self._cubos.items()
+            },
+            "memoria_bytes": memoria,
+        }
+
+    def __len__(self) -> int:
+        return len(self._valores)
+
+
+class IndiceTipos:
+    """
+    Índice de muebles por clase, poblado a lo largo del MRO.
+
+    Al insertar, el mueble se agrega al cubo de cada clase de su MRO (salvo
+    object y ABC), así el cubo de Asiento contiene sillas, sofás y sofá-camas,
+    y un SofaCama aparece tanto bajo Sofa como bajo Cama. Consultar un tipo
+    cuesta O(k) en el tamaño del resultado.
+    """
+
+    _EXCLUIDAS = (object, ABC)
+
+    def __init__(self):
+        """Crea un índice vacío."""
+        self._cubos: Dict[type, Dict[int, Mueble]] = {}
+
+    def agregar(self, clave: int, mueble: "Mueble") -> None:
+        """Agrega un mueble al cubo de cada clase de su MRO."""
+        for clase in type(mueble).__mro__:
+            if clase not in self._EXCLUIDAS:
+                self._cubos.setdefault(clase, {})[clave] = mueble
+
+    def quitar(self, clave: int, mueble: "Mueble") -> None:
+        """Quita un mueble de todos los cubos de su MRO."""
+        for clase in type(mueble).__mro__:
+            cubo = self._cubos.get(clase)
+            if cubo is not None and cubo.pop(clave, None) is not None and not cubo:
+                del self._cubos[clase]
+
+    def buscar(self, tipo: type) -> List["Mueble"]:
+        """
+        Retorna los muebles que son instancia de tipo.
+
+        Args:
+            tipo: Clase concreta o abstracta (ej: Silla, Asiento, Cama)
+        """
+        cubo = self._cubos.get(tipo)
+        return list(cubo.values()) if cubo else []
+
+    def contar(self, tipo: type) -> int:
+        """Retorna cuántos muebles son instancia de tipo."""
+        return len(self._cubos.get(tipo, ()))
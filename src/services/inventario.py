@@ -0,0 +1,642 @@
+"""
+Almacén columnar del inventario.
+Guarda el precio, las existencias, el tipo y el material de cada mueble en
+arreglos tipados paralelos, para que las estadísticas y el simulador de
+escenarios recorran números en lugar de objetos Python. Los filtros usan los
+índices de services.indices.
+"""
+
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from models.mueble import Mueble
+from models.vocabulario import MATERIALES, VACIO
+from services.indices import (
+    IndiceAtributo,
+    IndicePrecios,
+    IndiceTipos,
+    IndiceTrigramas,
+    clave_atributo,
+    normalizar_texto,
+)
+
+
+class InventarioColumnar:
+    """
+    Inventario organizado como estructura de arreglos (columnas).
+
+    La posición i de cada columna describe al mueble self._muebles[i], que
+    actúa como tabla lateral de objetos. El tipo y el material se guardan como
+    códigos enteros (ver columnas_codificadas).
+
+    Cada mueble recibe al entrar un SKU entero estable, que identifica su fila
+    y es la clave en todos los índices. Las eliminaciones usan swap-remove: el
+    último mueble ocupa el hueco, por lo que vender o quitar cuesta O(1) a
+    cambio de no conservar el orden de inserción dentro de las columnas.
+
+    Un SKU representa un producto con sus unidades en existencia: las unidades
+    idénticas comparten la fila y el objeto, y los agregados (valor, conteo
+    por tipo) cuentan precio × unidades.
+
+    El índice de nombres puede ser compartido (el de un Catalogo): en ese caso
+    lo mantiene su dueño, indexado por definición y no por SKU, y las
+    búsquedas lo filtran por los muebles de este inventario.
+
+    Las filas cargadas con cargar_diferido (al restaurar un snapshot) guardan
+    SKU, precio y existencias pero no su mueble: el objeto se construye la
+    primera vez que se accede a esa fila, y los índices secundarios se
+    reconstruyen en una sola pasada con la primera consulta que los necesita.
+
+    Conceptos aplicados:
+    - Encapsulación: Oculta la organización en columnas detrás de una interfaz
+      de secuencia (len, iteración, índices y pertenencia)
+    """
+
+    def __init__(self, indice_nombres: Optional[IndiceTrigramas] = None):
+        """
+        Crea un inventario vacío con todas sus columnas.
+
+        Args:
+            indice_nombres: Índice de nombres compartido que contiene a todos
+                los muebles que se agreguen; None crea uno propio por SKU
+        """
+        self._muebles: List[Mueble] = []
+        self._posiciones: Dict[int, int] = {}  # sku -> posición
+        self._skus_por_objeto: Dict[int, int] = {}  # id(mueble) -> sku
+        self._siguiente_sku = 1
+        # Se incrementa con cada cambio; permite invalidar cachés derivadas
+        self._version = 0
+        self._skus = array("q")
+        self._precios = array("d")
+        self._tipos = array("i")
+        # Códigos canónicos de models.vocabulario
+        self._materiales = array("i")
+        # Unidades en existencia de cada SKU: las unidades idénticas de un
+        # producto comparten una sola fila y un solo objeto
+        self._existencias = array("q")
+        self._codigos_tipo: Dict[str, int] = {}
+        # Agregados incrementales; los valores se guardan en centavos enteros
+        # para que sumar y restar precios no acumule error de redondeo.
+        self._valor_centavos = 0
+        self._conteo_tipo: Dict[str, int] = {}
+        self._clases_tipo: Dict[str, type] = {}
+        self._valor_tipo_centavos: Dict[str, int] = {}
+        self._indice_precios = IndicePrecios()
+        self._nombres_propios = indice_nombres is None
+        self._indice_nombres = IndiceTrigramas() if indice_nombres is None else indice_nombres
+        self._indice_tipos = IndiceTipos()
+        self._indices_atributo: Dict[str, IndiceAtributo] = {
+            atributo: IndiceAtributo(atributo)
+            for atributo in ("material", "color", "material_tapizado")
+        }
+        # Filas diferidas: _muebles guarda None hasta construir el mueble
+        self._fabrica: Optional[Callable[[int], "Mueble"]] = None
+        self._diferidas = 0
+        self._indices_pendientes = False
+        # Función (sku, mueble) que se llama tras actualizar un mueble
+        # modificado; la tienda la usa para registrar el cambio en su bitácora
+        self.al_modificar: Optional[Callable[[int, "Mueble"], None]] = None
+
+    @staticmethod
+    def _codificar(codigos: Dict[str, int], clave: str) -> int:
+        """Retorna el código entero de una clave, registrándola si es nueva."""
+        codigo = codigos.get(clave)
+        if codigo is None:
+            codigo = codigos[clave] = len(codigos)
+        return codigo
+
+    def _acumular(self, clase: type, precio: float, unidades: int) -> None:
+        """
+        Suma (unidades > 0) o resta (unidades < 0) unidades de un mueble de
+        la clase dada a los agregados: el valor crece en precio × unidades.
+        """
+        tipo = clase.__name__
+        centavos = round(precio * 100) * unidades
+        self._valor_centavos += centavos
+        self._valor_tipo_centavos[tipo] = self._valor_tipo_centavos.get(tipo, 0) + centavos
+        conteo = self._conteo_tipo.get(tipo, 0) + unidades
+        if conteo:
+            self._conteo_tipo[tipo] = conteo
+            self._clases_tipo[tipo] = clase
+        else:
+            del self._conteo_tipo[tipo]
+            del self._valor_tipo_centavos[tipo]
+            del self._clases_tipo[tipo]
+
+    def _fila(self, mueble: "Mueble") -> tuple:
+        """Calcula los valores de columna (salvo el precio) de un mueble."""
+        return (
+            self._codificar(self._codigos_tipo, type(mueble).__name__),
+            clave_atributo(mueble, "material"),
+        )
+
+    def _columnas(self) -> tuple:
+        """Retorna las columnas en el mismo orden que _fila, más la de objetos."""
+        return (
+            self._tipos,
+            self._materiales,
+            self._precios,
+            self._skus,
+            self._muebles,
+            self._existencias,
+        )
+
+    def agregar(
+        self,
+        mueble: "Mueble",
+        precio: float,
+        sku: Optional[int] = None,
+        cantidad: int = 1,
+    ) -> int:
+        """
+        Agrega un mueble al final de las columnas y a los índices.
+        El inventario se suscribe a los cambios del mueble para mantener
+        columnas e índices al día.
+
+        Args:
+            mueble: Mueble a agregar
+            precio: Precio ya calculado del mueble
+            sku: SKU a conservar (al restaurar un snapshot); si se omite se
+                asigna el siguiente
+            cantidad: Unidades idénticas en existencia
+
+        Returns:
+            int: SKU asignado al mueble
+        """
+        sku = self._agregar_fila(mueble, precio, sku, cantidad)
+        if not self._indices_pendientes:
+            self._indice_precios.agregar(precio, sku, mueble)
+        return sku
+
+    def agregar_lote(
+        self, entradas: Iterable[Tuple["Mueble", float, Optional[int], int]]
+    ) -> List[int]:
+        """
+        Agrega muchos muebles de una vez; el índice de precios se actualiza
+        con un solo ordenamiento al final en lugar de una inserción por mueble.
+
+        Args:
+            entradas: Tuplas (mueble, precio, sku o None, cantidad)
+
+        Returns:
+            List[int]: SKUs asignados, en el orden de las entradas
+        """
+        nuevas = []
+        for mueble, precio, sku, cantidad in entradas:
+            nuevas.append(
+                (precio, self._agregar_fila(mueble, precio, sku, cantidad), mueble)
+            )
+        if not self._indices_pendientes:
+            self._indice_precios.agregar_lote(nuevas)
+        return [sku for _, sku, _ in nuevas]
+
+    def _agregar_fila(
+        self, mueble: "Mueble", precio: float, sku: Optional[int], cantidad: int
+    ) -> int:
+        """
+        Agrega el mueble a columnas, agregados e índices, salvo el de precios.
+        Método privado auxiliar de agregar y agregar_lote.
+        """
+        if cantidad < 1:
+            raise ValueError("La cantidad debe ser al menos 1")
+        if sku is None:
+            sku = self._siguiente_sku
+        self._siguiente_sku = max(self._siguiente_sku, sku + 1)
+        self._version += 1
+        self._posiciones[sku] = len(self._muebles)
+        self._skus_por_objeto[id(mueble)] = sku
+        for columna, valor in zip(
+            self._columnas(), self._fila(mueble) + (precio, sku, mueble, cantidad)
+        ):
+            columna.append(valor)
+        self._acumular(type(mueble), precio, cantidad)
+        if not self._indices_pendientes:
+            self._indexar(sku, mueble)
+        if isinstance(mueble, Mueble):
+            mueble._suscribir(self._actualizar)
+        return sku
+
+    def _indexar(self, sku: int, mueble: "Mueble") -> None:
+        """Agrega un mueble a los índices secundarios, salvo el de precios."""
+        if self._nombres_propios:
+            self._indice_nombres.agregar(sku, getattr(mueble, "nombre", ""), mueble)
+        self._indice_tipos.agregar(sku, mueble)
+        for indice in self._indices_atributo.values():
+            indice.agregar(sku, mueble)
+
+    def cargar_diferido(
+        self,
+        clases: List[type],
+        precios: array,
+        skus: array,
+        existencias: array,
+        fabrica: Callable[[int], "Mueble"],
+    ) -> None:
+        """
+        Carga columnas completas sin construir sus muebles. Precios,
+        existencias, SKUs y agregados quedan al día de inmediato; cada mueble
+        se construye con fabrica(sku) al primer acceso a su fila, y los
+        índices secundarios se reconstruyen con la primera consulta.
+
+        Args:
+            clases: Clase del mueble de cada fila
+            precios: Columna de precios
+            skus: Columna de SKUs
+            existencias: Columna de unidades en existencia
+            fabrica: Función que construye el mueble de un SKU
+
+        Raises:
+            ValueError: Si el inventario no está vacío
+        """
+        if self._muebles:
+            raise ValueError(
+                "Solo se pueden cargar filas diferidas en un inventario vacío"
+            )
+        n = len(skus)
+        self._version += 1
+        self._fabrica = fabrica
+        self._diferidas = n
+        self._indices_pendientes = True
+        self._muebles = [None] * n
+        self._posiciones = dict(zip(skus, range(n)))
+        self._siguiente_sku = max(self._siguiente_sku, max(skus, default=0) + 1)
+        self._skus.extend(skus)
+        self._precios.extend(precios)
+        self._existencias.extend(existencias)
+        self._tipos = array("i", [0]) * n
+        self._materiales = array("i", [VACIO]) * n
+        valor: Dict[type, int] = {}
+        conteo: Dict[type, int] = {}
+        for clase, precio, cantidad in zip(clases, precios, existencias):
+            valor[clase] = valor.get(clase, 0) + round(precio * 100) * cantidad
+            conteo[clase] = conteo.get(clase, 0) + cantidad
+        for clase, unidades in conteo.items():
+            tipo = clase.__name__
+            self._valor_centavos += valor[clase]
+            self._valor_tipo_centavos[tipo] = valor[clase]
+            self._conteo_tipo[tipo] = unidades
+            self._clases_tipo[tipo] = clase
+
+    def _mueble(self, posicion: int) -> "Mueble":
+        """
+        Retorna el mueble de una posición, construyéndolo si la fila es
+        diferida. Método privado auxiliar.
+        """
+        mueble = self._muebles[posicion]
+        if mueble is None:
+            sku = self._skus[posicion]
+            mueble = self._fabrica(sku)
+            self._muebles[posicion] = mueble
+            self._skus_por_objeto[id(mueble)] = sku
+            for columna, valor in zip(self._columnas(), self._fila(mueble)):
+                columna[posicion] = valor
+            self._diferidas -= 1
+            if not self._diferidas:
+                self._fabrica = None
+            if isinstance(mueble, Mueble):
+                mueble._suscribir(self._actualizar)
+        return mueble
+
+    def _materializar(self) -> None:
+        """Construye los muebles de todas las filas diferidas."""
+        if self._diferidas:
+            for posicion in range(len(self._muebles)):
+                self._mueble(posicion)
+
+    def _preparar_indices(self) -> None:
+        """Reconstruye en una pasada los índices pendientes tras cargar_diferido."""
+        if not self._indices_pendientes:
+            return
+        self._materializar()
+        self._indices_pendientes = False
+        for sku, mueble in zip(self._skus, self._muebles):
+            self._indexar(sku, mueble)
+        self._indice_precios.agregar_lote(zip(self._precios, self._skus, self._muebles))
+
+    def quitar(self, mueble: "Mueble") -> bool:
+        """
+        Quita un mueble en O(1) moviendo el último a su posición.
+
+        Args:
+            mueble: Mueble a quitar
+
+        Returns:
+            bool: True si el mueble estaba en el inventario
+        """
+        sku = self._skus_por_objeto.get(id(mueble))
+        return sku is not None and self.quitar_sku(sku) is not None
+
+    def quitar_sku(self, sku: int) -> Optional["Mueble"]:
+        """
+        Quita en O(1) el mueble con el SKU dado.
+
+        Args:
+            sku: SKU del mueble
+
+        Returns:
+            Optional[Mueble]: El mueble quitado, o None si el SKU no existe
+        """
+        posicion = self._posiciones.pop(sku, None)
+        if posicion is None:
+            return None
+        mueble = self._mueble(posicion)
+        self._version += 1
+        del self._skus_por_objeto[id(mueble)]
+        self._acumular(
+            type(mueble), self._precios[posicion], -self._existencias[posicion]
+        )
+        if not self._indices_pendientes:
+            self._indice_precios.quitar(self._precios[posicion], sku)
+            if self._nombres_propios:
+                self._indice_nombres.quitar(sku)
+            self._indice_tipos.quitar(sku, mueble)
+            for indice in self._indices_atributo.values():
+                indice.quitar(sku)
+        if isinstance(mueble, Mueble):
+            mueble._desuscribir(self._actualizar)
+        ultima = len(self._muebles) - 1
+        columnas = self._columnas()
+        if posicion != ultima:
+            for columna in columnas:
+                columna[posicion] = columna[ultima]
+            self._posiciones[self._skus[posicion]] = posicion
+        for columna in columnas:
+            columna.pop()
+        return mueble
+
+    def _actualizar(self, mueble: "Mueble") -> None:
+        """
+        Observador de cambios: vuelve a leer los atributos del mueble,
+        reubica sus entradas en los índices si los valores cambiaron y avisa
+        a al_modificar.
+        """
+        sku = self._skus_por_objeto.get(id(mueble))
+        if sku is None:
+            return
+        self._version += 1
+        posicion = self._posiciones[sku]
+        precio_anterior = self._precios[posicion]
+        precio = mueble.calcular_precio()
+        existencias = self._existencias[posicion]
+        for columna, valor in zip(
+            self._columnas(), self._fila(mueble) + (precio, sku, mueble, existencias)
+        ):
+            columna[posicion] = valor
+        if precio != precio_anterior:
+            self._acumular(type(mueble), precio_anterior, -existencias)
+            self._acumular(type(mueble), precio, existencias)
+        if not self._indices_pendientes:
+            if precio != precio_anterior:
+                self._indice_precios.quitar(precio_anterior, sku)
+                self._indice_precios.agregar(precio, sku, mueble)
+            nombre = getattr(mueble, "nombre", "")
+            if self._nombres_propios and self._indice_nombres.texto(
+                sku
+            ) != normalizar_texto(nombre):
+                self._indice_nombres.quitar(sku)
+                self._indice_nombres.agregar(sku, nombre, mueble)
+            for indice in self._indices_atributo.values():
+                indice.actualizar(sku, mueble)
+        if self.al_modificar is not None:
+            self.al_modificar(sku, mueble)
+
+    @property
+    def version(self) -> int:
+        """Contador que cambia con cada alta, baja o modificación."""
+        return self._version
+
+    @property
+    def siguiente_sku(self) -> int:
+        """SKU que recibirá el próximo mueble agregado."""
+        return self._siguiente_sku
+
+    @siguiente_sku.setter
+    def siguiente_sku(self, value: int) -> None:
+        """Setter para restaurar el contador de SKUs; nunca lo hace retroceder."""
+        self._siguiente_sku = max(self._siguiente_sku, value)
+
+    def entradas(self) -> Iterator[Tuple[int, "Mueble", float, int]]:
+        """
+        Itera las tuplas (sku, mueble, precio, existencias) en el orden de las
+        columnas.
+        """
+        self._materializar()
+        return zip(self._skus, self._muebles, self._precios, self._existencias)
+
+    def existencias(self, sku: int) -> int:
+        """Retorna las unidades en existencia de un SKU (0 si no existe)."""
+        posicion = self._posiciones.get(sku)
+        return self._existencias[posicion] if posicion is not None else 0
+
+    def reponer(self, sku: int, cantidad: int) -> bool:
+        """
+        Suma unidades a un SKU existente.
+
+        Returns:
+            bool: True si el SKU existe
+        """
+        if cantidad < 1:
+            raise ValueError("La cantidad debe ser al menos 1")
+        posicion = self._posiciones.get(sku)
+        if posicion is None:
+            return False
+        self._cambiar_existencias(posicion, cantidad)
+        return True
+
+    def retirar(self, sku: int, cantidad: int = 1) -> Optional["Mueble"]:
+        """
+        Descuenta unidades de un SKU; al llegar a cero quita el SKU en O(1).
+
+        Returns:
+            Optional[Mueble]: El mueble del SKU, o None si el SKU no existe
+
+        Raises:
+            ValueError: Si no hay suficientes unidades
+        """
+        posicion = self._posiciones.get(sku)
+        if posicion is None:
+            return None
+        existencias = self._existencias[posicion]
+        if not 1 <= cantidad <= existencias:
+            raise ValueError(
+                f"No se pueden retirar {cantidad} unidades de {existencias} en existencia"
+            )
+        if cantidad == existencias:
+            return self.quitar_sku(sku)
+        self._cambiar_existencias(posicion, -cantidad)
+        return self._mueble(posicion)
+
+    def _cambiar_existencias(self, posicion: int, unidades: int) -> None:
+        """Ajusta las existencias de una fila y los agregados."""
+        self._version += 1
+        self._existencias[posicion] += unidades
+        self._acumular(
+            type(self._mueble(posicion)), self._precios[posicion], unidades
+        )
+
+    def unidades(self) -> int:
+        """Retorna el total de unidades en existencia en O(tipos)."""
+        return sum(self._conteo_tipo.values())
+
+    def cantidades(self) -> Iterator[int]:
+        """Itera la columna de existencias en el orden de las columnas."""
+        return iter(self._existencias)
+
+    def obtener(self, sku: int) -> Optional["Mueble"]:
+        """Retorna en O(1) el mueble con el SKU dado, o None."""
+        posicion = self._posiciones.get(sku)
+        return self._mueble(posicion) if posicion is not None else None
+
+    def sku_de(self, mueble: "Mueble") -> Optional[int]:
+        """Retorna el SKU de un mueble del inventario, o None."""
+        return self._skus_por_objeto.get(id(mueble))
+
+    def precio(self, mueble: "Mueble") -> float:
+        """Retorna el precio registrado para un mueble del inventario."""
+        return self._precios[self._posiciones[self._skus_por_objeto[id(mueble)]]]
+
+    def filtrar_por_precio(self, precio_min: float, precio_max: float) -> List["Mueble"]:
+        """
+        Consulta el índice de precios en O(log n + k).
+
+        Args:
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+
+        Returns:
+            List[Mueble]: Muebles dentro del rango, de menor a mayor precio
+        """
+        self._preparar_indices()
+        return self._indice_precios.rango(precio_min, precio_max)
+
+    @property
+    def indice_precios(self) -> "IndicePrecios":
+        """Índice ordenado por precio del inventario."""
+        self._preparar_indices()
+        return self._indice_precios
+
+    def buscar_por_nombre(self, nombre: str) -> List["Mueble"]:
+        """
+        Busca por subcadena del nombre usando el índice de trigramas.
+        Ignora mayúsculas y tildes ("sofa" encuentra "Sofá").
+        """
+        self._preparar_indices()
+        if self._nombres_propios:
+            return self._indice_nombres.buscar(nombre)
+        return [
+            mueble
+            for mueble in self._indice_nombres.buscar(nombre)
+            if id(mueble) in self._skus_por_objeto
+        ]
+
+    def filtrar_por_atributo(self, atributo: str, valor: str) -> List["Mueble"]:
+        """
+        Retorna el cubo del índice hash del atributo para el valor dado.
+
+        Args:
+            atributo: "material", "color" o "material_tapizado"
+            valor: Valor a buscar (se normaliza)
+
+        Returns:
+            List[Mueble]: Muebles con ese valor del atributo
+        """
+        self._preparar_indices()
+        return self._indices_atributo[atributo].buscar(valor)
+
+    def filtrar_por_tipo(self, tipo: type) -> List["Mueble"]:
+        """
+        Retorna los muebles que son instancia de tipo usando el índice de
+        clases, sin recorrer el inventario.
+        """
+        self._preparar_indices()
+        return self._indice_tipos.buscar(tipo)
+
+    def estadisticas_indices(self) -> Dict[str, dict]:
+        """
+        Retorna tamaños de cubo y memoria aproximada de los índices hash.
+
+        Returns:
+            Dict[str, dict]: Estadísticas por atributo indexado
+        """
+        self._preparar_indices()
+        return {
+            atributo: indice.estadisticas()
+            for atributo, indice in self._indices_atributo.items()
+        }
+
+    def valor_total(self) -> float:
+        """Retorna el valor del inventario en O(1) desde el agregado."""
+        return self._valor_centavos / 100
+
+    def conteo_por_tipo(self) -> Dict[str, int]:
+        """
+        Retorna una copia del conteo incremental de unidades por tipo.
+
+        Returns:
+            Dict[str, int]: Conteo por nombre de clase
+        """
+        return self._conteo_tipo.copy()
+
+    def clases_por_tipo(self) -> Dict[str, type]:
+        """
+        Retorna la clase de cada nombre de tipo presente en el inventario.
+
+        Returns:
+            Dict[str, type]: Clase por nombre de clase
+        """
+        return self._clases_tipo.copy()
+
+    def precios(self) -> Iterator[float]:
+        """Itera la columna de precios en el orden de las columnas."""
+        return iter(self._precios)
+
+    def columnas_codificadas(self) -> Tuple[array, array, List[str], List[str]]:
+        """
+        Retorna copias de las columnas de tipo y material con sus vocabularios.
+
+        Returns:
+            Tuple: (códigos de tipo, códigos de material, nombre de tipo por
+                código, material normalizado por código)
+        """
+        self._materializar()
+        return (
+            array("i", self._tipos),
+            array("i", self._materiales),
+            list(self._codigos_tipo),
+            MATERIALES.normalizados(),
+        )
+
+    def valor_por_tipo(self) -> Dict[str, float]:
+        """
+        Retorna el valor incremental del inventario por tipo.
+
+        Returns:
+            Dict[str, float]: Valor por nombre de clase
+        """
+        return {
+            tipo: centavos / 100 for tipo, centavos in self._valor_tipo_centavos.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._muebles)
+
+    def __iter__(self) -> Iterator["Mueble"]:
+        self._materializar()
+        return iter(self._muebles)
+
+    def __getitem__(self, indice: Union[int, slice]):
+        """
+        Retorna el mueble de una posición o la lista de un rango; solo se
+        construyen las filas diferidas pedidas (por ejemplo, las de una
+        página del menú).
+        """
+        if isinstance(indice, slice):
+            return [self._mueble(i) for i in range(*indice.indices(len(self._muebles)))]
+        if indice < 0:
+            indice += len(self._muebles)
+        if not 0 <= indice < len(self._muebles):
+            raise IndexError("Posición fuera del inventario")
+        return self._mueble(indice)
+
+    def __contains__(self, mueble: object) -> bool:
+        return id(mueble) in self._skus_por_objeto
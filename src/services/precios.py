@@ -0,0 +1,358 @@
+"""
+Cotización masiva de precios por columnas.
+
+Cada clase concreta tiene un kernel que reproduce su calcular_precio sobre
+columnas de atributos (una lista por atributo) en lugar de objeto por objeto.
+Los factores de comodidad y de tamaño se calculan una sola vez por
+combinación distinta de sus entradas, y las sumas se hacen en el mismo orden
+que el método de referencia, por lo que los resultados son idénticos a los
+de calcular_precio (ver tests/unit/services/test_precios.py).
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from models.concretos.armario import Armario
+from models.concretos.cajonera import Cajonera
+from models.concretos.cama import Cama
+from models.concretos.escritorio import Escritorio
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sillon import Sillon
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+from models.mueble import Mueble, memoizar_precio
+
+Columnas = Dict[str, Sequence]
+
+_EXTRA_TAMAÑO_CAMA = {"matrimonial": 200, "queen": 400, "king": 600}
+_EXTRA_TAMAÑO_SOFACAMA = {"matrimonial": 300, "queen": 500, "king": 700}
+_EXTRA_MECANISMO = {"hidraulico": 150, "electrico": 300}
+
+
+def _factores_comodidad(
+    respaldos: Sequence[bool], tapizados: Sequence[Optional[str]], capacidades: Sequence[int]
+) -> List[float]:
+    """Columna de Asiento.calcular_factor_comodidad, memoizada por combinación."""
+    memo: Dict[Tuple, float] = {}
+    factores = []
+    for clave in zip(respaldos, tapizados, capacidades):
+        factor = memo.get(clave)
+        if factor is None:
+            respaldo, tapizado, capacidad = clave
+            factor = 1.0
+            if respaldo:
+                factor += 0.1
+            if tapizado:
+                if tapizado.lower() == "cuero":
+                    factor += 0.2
+                elif tapizado.lower() == "tela":
+                    factor += 0.1
+            factor += (capacidad - 1) * 0.05
+            memo[clave] = factor
+        factores.append(factor)
+    return factores
+
+
+def _factores_tamaño(largos: Sequence[float], anchos: Sequence[float]) -> List[float]:
+    """Columna de Superficie.calcular_factor_tamaño."""
+    return [1.0 + (largo * ancho / 10000) * 0.05 for largo, ancho in zip(largos, anchos)]
+
+
+def _precios_sofa(c: Columnas) -> List[float]:
+    """Sofa.calcular_precio por columnas."""
+    factores = _factores_comodidad(
+        c["tiene_respaldo"], c["material_tapizado"], c["capacidad_personas"]
+    )
+    precios = []
+    for base, factor, brazos, modular, cojines in zip(
+        c["precio_base"], factores, c["tiene_brazos"], c["es_modular"], c["incluye_cojines"]
+    ):
+        precio = base * factor
+        if brazos:
+            precio += 150
+        if modular:
+            precio += 200
+        if cojines:
+            precio += 50
+        precios.append(round(precio, 2))
+    return precios
+
+
+def _precios_silla(c: Columnas) -> List[float]:
+    """Silla.calcular_precio por columnas."""
+    factores = _factores_comodidad(
+        c["tiene_respaldo"], c["material_tapizado"], c["capacidad_personas"]
+    )
+    precios = []
+    for base, factor, regulable, ruedas in zip(
+        c["precio_base"], factores, c["altura_regulable"], c["tiene_ruedas"]
+    ):
+        precio = base * factor
+        if regulable:
+            precio += 30
+        if ruedas:
+            precio += 20
+        precios.append(round(precio, 2))
+    return precios
+
+
+def _precios_sillon(c: Columnas) -> List[int]:
+    """Sillon.calcular_precio por columnas."""
+    precios = []
+    for base, tapizado, brazos, reclinable, reposapies in zip(
+        c["precio_base"],
+        c["material_tapizado"],
+        c["tiene_brazos"],
+        c["es_reclinable"],
+        c["tiene_reposapiés"],
+    ):
+        precio = base
+        if tapizado:
+            precio += 200
+        if brazos:
+            precio += 100
+        if reclinable:
+            precio += 250
+        if reposapies:
+            precio += 80
+        precios.append(int(round(precio)))
+    return precios
+
+
+def _precios_mesa(c: Columnas) -> List[float]:
+    """Mesa.calcular_precio por columnas."""
+    factores = _factores_tamaño(c["largo"], c["ancho"])
+    precios = []
+    for base, factor, forma, capacidad in zip(
+        c["precio_base"], factores, c["forma"], c["capacidad_personas"]
+    ):
+        precio = base * factor
+        if forma != "rectangular":
+            precio += 50
+        if capacidad > 6:
+            precio += 100
+        elif capacidad > 4:
+            precio += 50
+        precios.append(round(precio, 2))
+    return precios
+
+
+def _precios_cama(c: Columnas) -> List[float]:
+    """Cama.calcular_precio por columnas."""
+    precios = []
+    for base, tamaño, colchon, cabecera in zip(
+        c["precio_base"], c["tamaño"], c["incluye_colchon"], c["tiene_cabecera"]
+    ):
+        precio = base
+        extra = _EXTRA_TAMAÑO_CAMA.get(tamaño)
+        if extra is not None:
+            precio += extra
+        if colchon:
+            precio += 300
+        if cabecera:
+            precio += 100
+        precios.append(round(precio, 2))
+    return precios
+
+
+def _precios_sofacama(c: Columnas) -> List[float]:
+    """SofaCama.calcular_precio por columnas: precio de sofá más extras de cama."""
+    precios = []
+    for precio, tamaño, colchon, mecanismo in zip(
+        _precios_sofa(c), c["tamaño"], c["incluye_colchon"], c["mecanismo_conversion"]
+    ):
+        extra = _EXTRA_TAMAÑO_SOFACAMA.get(tamaño)
+        if extra is not None:
+            precio += extra
+        if colchon:
+            precio += 250
+        extra = _EXTRA_MECANISMO.get(mecanismo)
+        if extra is not None:
+            precio += extra
+        precios.append(round(precio, 2))
+    return precios
+
+
+def _precios_armario(c: Columnas) -> List[int]:
+    """Armario.calcular_precio por columnas."""
+    precios = []
+    for base, puertas, cajones, espejos in zip(
+        c["precio_base"], c["num_puertas"], c["num_cajones"], c["tiene_espejos"]
+    ):
+        precio = base
+        precio += puertas * 50
+        precio += cajones * 30
+        if espejos:
+            precio += 100
+        precios.append(int(round(precio)))
+    return precios
+
+
+def _precios_cajonera(c: Columnas) -> List[int]:
+    """Cajonera.calcular_precio por columnas."""
+    precios = []
+    for base, cajones, ruedas in zip(c["precio_base"], c["num_cajones"], c["tiene_ruedas"]):
+        precio = base
+        precio += cajones * 20
+        if ruedas:
+            precio += 30
+        precios.append(int(round(precio)))
+    return precios
+
+
+def _precios_escritorio(c: Columnas) -> List[int]:
+    """Escritorio.calcular_precio por columnas."""
+    precios = []
+    for base, con_cajones, cajones, largo, iluminacion, forma in zip(
+        c["precio_base"],
+        c["tiene_cajones"],
+        c["num_cajones"],
+        c["largo"],
+        c["tiene_iluminacion"],
+        c["forma"],
+    ):
+        precio = base
+        if con_cajones:
+            precio += cajones * 25
+        if largo > 1.5:
+            precio += 50
+        if iluminacion:
+            precio += 40
+        if forma != "rectangular":
+            precio += 30
+        precios.append(int(round(precio)))
+    return precios
+
+
+_ASIENTO = ("precio_base", "tiene_respaldo", "material_tapizado", "capacidad_personas")
+
+# Clase concreta -> (atributos que lee el kernel, kernel)
+KERNELS: Dict[type, Tuple[Tuple[str, ...], Callable[[Columnas], list]]] = {
+    Silla: (_ASIENTO + ("altura_regulable", "tiene_ruedas"), _precios_silla),
+    Sofa: (_ASIENTO + ("tiene_brazos", "es_modular", "incluye_cojines"), _precios_sofa),
+    Sillon: (
+        ("precio_base", "material_tapizado", "tiene_brazos", "es_reclinable", "tiene_reposapiés"),
+        _precios_sillon,
+    ),
+    Mesa: (
+        ("precio_base", "largo", "ancho", "forma", "capacidad_personas"),
+        _precios_mesa,
+    ),
+    Cama: (
+        ("precio_base", "tamaño", "incluye_colchon", "tiene_cabecera"),
+        _precios_cama,
+    ),
+    SofaCama: (
+        _ASIENTO
+        + ("tiene_brazos", "es_modular", "incluye_cojines")
+        + ("tamaño", "incluye_colchon", "mecanismo_conversion"),
+        _precios_sofacama,
+    ),
+    Armario: (
+        ("precio_base", "num_puertas", "num_cajones", "tiene_espejos"),
+        _precios_armario,
+    ),
+    Cajonera: (("precio_base", "num_cajones", "tiene_ruedas"), _precios_cajonera),
+    Escritorio: (
+        ("precio_base", "tiene_cajones", "num_cajones", "largo", "tiene_iluminacion", "forma"),
+        _precios_escritorio,
+    ),
+}
+
+
+def atributos_kernel(clase: type) -> Tuple[str, ...]:
+    """
+    Retorna los atributos que necesita el kernel de una clase.
+
+    Raises:
+        KeyError: Si la clase no tiene kernel
+    """
+    return KERNELS[clase][0]
+
+
+def cotizar_columnas(clase: type, columnas: Columnas) -> list:
+    """
+    Calcula los precios de muchos muebles de una clase a partir de sus
+    columnas de atributos, sin construir los objetos.
+
+    Args:
+        clase: Clase concreta con kernel (ver KERNELS)
+        columnas: Una secuencia por atributo de atributos_kernel(clase), todas
+            del mismo largo
+
+    Returns:
+        list: Precio de cada fila, idéntico al de calcular_precio
+    """
+    return KERNELS[clase][1](columnas)
+
+
+def cotizar(muebles: Sequence["Mueble"], memoizar: bool = False) -> list:
+    """
+    Calcula los precios de una secuencia de muebles agrupándolos por clase y
+    aplicando el kernel de cada grupo. Las clases sin kernel (por ejemplo,
+    subclases definidas por el usuario) usan su propio calcular_precio.
+
+    Args:
+        muebles: Muebles a cotizar
+        memoizar: Si guardar el precio en la caché de precio de cada mueble
+
+    Returns:
+        list: Precio de cada mueble, en el mismo orden
+    """
+    grupos: Dict[type, List[int]] = {}
+    for posicion, mueble in enumerate(muebles):
+        grupos.setdefault(type(mueble), []).append(posicion)
+    precios: list = [None] * len(muebles)
+    for clase, posiciones in grupos.items():
+        kernel = KERNELS.get(clase)
+        if kernel is None:
+            for posicion in posiciones:
+                precios[posicion] = muebles[posicion].calcular_precio()
+            continue
+        atributos, funcion = kernel
+        columnas = {
+            atributo: [getattr(muebles[p], atributo) for p in posiciones]
+            for atributo in atributos
+        }
+        for posicion, precio in zip(posiciones, funcion(columnas)):
+            precios[posicion] = precio
+            if memoizar:
+                memoizar_precio(muebles[posicion], precio)
+    return precios
+
+
+def descomponer(
+    muebles: Sequence["Mueble"], precios: Sequence[float]
+) -> Tuple[List[float], List[float]]:
+    """
+    Separa el precio de cada mueble en una parte proporcional a su precio
+    base y una parte fija (los extras por características), de modo que
+    precio ≈ variable * factor + fijo al escalar el precio base por factor.
+    La parte fija se obtiene aplicando el kernel con precio base 0; las
+    clases sin kernel se consideran completamente proporcionales.
+
+    Args:
+        muebles: Muebles a descomponer
+        precios: Precio actual de cada mueble, en el mismo orden
+
+    Returns:
+        Tuple[List[float], List[float]]: Columnas (variable, fijo)
+    """
+    grupos: Dict[type, List[int]] = {}
+    for posicion, mueble in enumerate(muebles):
+        grupos.setdefault(type(mueble), []).append(posicion)
+    fijos = [0.0] * len(muebles)
+    for clase, posiciones in grupos.items():
+        kernel = KERNELS.get(clase)
+        if kernel is None:
+            continue
+        atributos, funcion = kernel
+        columnas = {
+            atributo: [getattr(muebles[p], atributo) for p in posiciones]
+            for atributo in atributos
+        }
+        columnas["precio_base"] = [0] * len(posiciones)
+        for posicion, fijo in zip(posiciones, funcion(columnas)):
+            fijos[posicion] = float(fijo)
+    variables = [precio - fijo for precio, fijo in zip(precios, fijos)]
+    return variables, fijos
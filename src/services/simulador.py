@@ -0,0 +1,308 @@
+"""
+Simulador de escenarios de precios ("qué pasaría si").
+
+Un Simulador congela el inventario de una tienda en columnas de memoria
+compartida: tipo, material, existencias y el precio de cada SKU descompuesto en una
+parte proporcional al precio base y una parte fija (ver
+services.precios.descomponer). Los escenarios se evalúan en un pool de
+procesos que se adjuntan a ese bloque en lugar de recibir una copia del
+catálogo, y cada uno reporta el valor proyectado del inventario y la
+diferencia por tipo respecto de los precios y descuentos vigentes.
+
+Ejemplo:
+    escenario = (
+        Escenario("Mesas y cuero")
+        .descuento("mesas", 15)
+        .descuento("muebles", 5, material="cuero")
+    )
+    with Simulador(tienda) as simulador:
+        resultado = simulador.evaluar([escenario])
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from services.descuentos import POLITICAS, MotorDescuentos, ReglaDescuento, resolver_categoria
+from services.precios import descomponer
+
+# Columnas del bloque compartido, en orden: (nombre, código de tipo de array)
+_COLUMNAS = (
+    ("variables", "d"),
+    ("fijos", "d"),
+    ("existencias", "q"),
+    ("tipos", "i"),
+    ("materiales", "i"),
+)
+
+# Bloque compartido adjuntado por cada proceso del pool: (bloque, columnas)
+_compartido: Optional[Tuple[shared_memory.SharedMemory, Dict[str, memoryview]]] = None
+
+
+def _resolver(categoria: str) -> type:
+    """Resuelve una categoría o lanza ValueError si no se reconoce."""
+    clase = resolver_categoria(categoria)
+    if clase is None:
+        raise ValueError(f"Categoría desconocida '{categoria}'")
+    return clase
+
+
+class Escenario:
+    """
+    Conjunto de cambios hipotéticos a evaluar: reglas de descuento que se
+    agregan a las vigentes (o las reemplazan) y ajustes porcentuales del
+    precio base por categoría.
+    """
+
+    def __init__(self, nombre: str, politica: Optional[str] = None, reemplazar: bool = False):
+        """
+        Args:
+            nombre: Nombre del escenario en el reporte
+            politica: Política de combinación de descuentos, o None para
+                conservar la vigente
+            reemplazar: Si descartar las reglas vigentes en lugar de sumarles
+                las del escenario
+        """
+        if politica is not None and politica not in POLITICAS:
+            raise ValueError(f"Política de descuentos desconocida: '{politica}'")
+        self.nombre = nombre
+        self.politica = politica
+        self.reemplazar = reemplazar
+        self._reglas: List[ReglaDescuento] = []
+        self._ajustes: Dict[type, float] = {}
+
+    def descuento(
+        self,
+        categoria: str,
+        porcentaje: float,
+        material: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+    ) -> "Escenario":
+        """
+        Agrega una regla de descuento con los mismos argumentos que
+        TiendaMuebles.aplicar_descuento.
+
+        Returns:
+            Escenario: El mismo escenario, para encadenar llamadas
+        Raises:
+            ValueError: Si la categoría o el porcentaje no son válidos
+        """
+        if not 0 < porcentaje <= 100:
+            raise ValueError("El porcentaje debe estar entre 1 y 100")
+        self._reglas.append(
+            ReglaDescuento(_resolver(categoria), porcentaje / 100, material, precio_min, precio_max)
+        )
+        return self
+
+    def ajustar_precio_base(self, categoria: str, porcentaje: float) -> "Escenario":
+        """
+        Cambia el precio base de una categoría y sus subclases en un
+        porcentaje (10 = +10%, -5 = -5%). Si varias categorías alcanzan a un
+        mueble, se usa el ajuste de la más específica.
+
+        Returns:
+            Escenario: El mismo escenario, para encadenar llamadas
+        Raises:
+            ValueError: Si la categoría no existe o el ajuste es <= -100%
+        """
+        if porcentaje <= -100:
+            raise ValueError("El ajuste debe ser mayor que -100%")
+        self._ajustes[_resolver(categoria)] = 1 + porcentaje / 100
+        return self
+
+    def motor(self, vigente: MotorDescuentos) -> MotorDescuentos:
+        """Construye el motor de descuentos del escenario a partir del vigente."""
+        motor = MotorDescuentos(vigente.politica) if self.reemplazar else vigente.copiar()
+        if self.politica is not None:
+            motor.politica = self.politica
+        for regla in self._reglas:
+            motor.agregar_regla(regla)
+        return motor
+
+    def factor(self, clase: type) -> float:
+        """Retorna el factor que el escenario aplica al precio base de una clase."""
+        for candidata in clase.__mro__:
+            if candidata in self._ajustes:
+                return self._ajustes[candidata]
+        return 1.0
+
+
+def _vistas(buffer: memoryview, n: int) -> Dict[str, memoryview]:
+    """Divide el bloque compartido en una vista tipada por columna."""
+    vistas = {}
+    posicion = 0
+    for nombre, codigo in _COLUMNAS:
+        tamaño = n * array(codigo).itemsize
+        vistas[nombre] = buffer[posicion : posicion + tamaño].cast(codigo)
+        posicion += tamaño
+    return vistas
+
+
+def _inicializar_trabajador(nombre: str, n: int) -> None:
+    """Adjunta el bloque compartido en un proceso del pool."""
+    global _compartido
+    bloque = shared_memory.SharedMemory(name=nombre)
+    _compartido = (bloque, _vistas(bloque.buf, n))
+
+
+def _evaluar_en_trabajador(tarea: tuple) -> List[int]:
+    return _evaluar(_compartido[1], *tarea)
+
+
+def _evaluar(
+    columnas: Dict[str, memoryview],
+    clases: Sequence[Optional[type]],
+    materiales: Sequence[str],
+    factores: Sequence[float],
+    motor: MotorDescuentos,
+) -> List[int]:
+    """
+    Evalúa un escenario sobre las columnas congeladas.
+
+    Args:
+        columnas: Vistas de las columnas compartidas
+        clases: Clase de cada código de tipo (None si no quedan muebles)
+        materiales: Material normalizado de cada código de material
+        factores: Factor del precio base de cada código de tipo
+        motor: Motor de descuentos del escenario
+    Returns:
+        List[int]: Valor con descuentos, en centavos, por código de tipo
+    """
+    descuentos_fijos = [
+        motor.descuento_clase(clase) if clase is not None else 0.0 for clase in clases
+    ]
+    centavos = [0] * len(clases)
+    for variable, fijo, existencias, tipo, material in zip(
+        columnas["variables"],
+        columnas["fijos"],
+        columnas["existencias"],
+        columnas["tipos"],
+        columnas["materiales"],
+    ):
+        precio = round(variable * factores[tipo] + fijo, 2)
+        descuento = descuentos_fijos[tipo]
+        if descuento is None:
+            descuento = motor.descuento_atributos(clases[tipo], materiales[material], precio)
+        centavos[tipo] += round(round(precio * (1 - descuento), 2) * 100) * existencias
+    return centavos
+
+
+class Simulador:
+    """
+    Evalúa escenarios sobre una copia congelada del inventario de una tienda.
+    Los cambios posteriores en la tienda no afectan al simulador.
+
+    El bloque de memoria compartida y el pool de procesos se liberan con
+    cerrar() o al salir de un bloque with.
+    """
+
+    def __init__(self, tienda, procesos: Optional[int] = None):
+        """
+        Args:
+            tienda: Tienda cuyo inventario y descuentos se congelan
+            procesos: Procesos del pool (None usa uno por CPU); con 1 los
+                escenarios se evalúan en el proceso actual
+        """
+        inventario = tienda._inventario
+        tipos, materiales, nombres_tipo, self._materiales = inventario.columnas_codificadas()
+        variables, fijos = descomponer(list(inventario), list(inventario.precios()))
+        clases = inventario.clases_por_tipo()
+        self._tipos = nombres_tipo
+        self._clases = [clases.get(nombre) for nombre in nombres_tipo]
+        self._vigente = tienda._descuentos.copiar()
+        self._procesos = procesos
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._n = len(tipos)
+
+        existencias = array("q", inventario.cantidades())
+        datos = (array("d", variables), array("d", fijos), existencias, tipos, materiales)
+        tamaño = sum(len(columna) * columna.itemsize for columna in datos)
+        self._bloque = shared_memory.SharedMemory(create=True, size=max(tamaño, 1))
+        self._columnas = _vistas(self._bloque.buf, self._n)
+        for (nombre, _), columna in zip(_COLUMNAS, datos):
+            self._columnas[nombre][:] = columna
+        self._base = self._evaluar_local(self._tarea(Escenario("Vigente")))
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _tarea(self, escenario: Escenario) -> tuple:
+        """Argumentos de _evaluar para un escenario, salvo las columnas."""
+        factores = [
+            escenario.factor(clase) if clase is not None else 1.0 for clase in self._clases
+        ]
+        return (self._clases, self._materiales, factores, escenario.motor(self._vigente))
+
+    def _evaluar_local(self, tarea: tuple) -> List[int]:
+        return _evaluar(self._columnas, *tarea)
+
+    def _reporte(self, nombre: str, centavos: List[int]) -> Dict:
+        """Arma el resultado de un escenario comparándolo con el vigente."""
+        por_tipo = {
+            tipo: {
+                "valor": valor / 100,
+                "delta": (valor - base) / 100,
+            }
+            for tipo, clase, valor, base in zip(self._tipos, self._clases, centavos, self._base)
+            if clase is not None
+        }
+        total = sum(centavos)
+        return {
+            "escenario": nombre,
+            "valor": total / 100,
+            "delta": (total - sum(self._base)) / 100,
+            "por_tipo": por_tipo,
+        }
+
+    def valor_vigente(self) -> Dict:
+        """Retorna el valor del inventario con los precios y descuentos vigentes."""
+        return self._reporte("Vigente", self._base)
+
+    def evaluar(self, escenarios: Sequence[Escenario]) -> List[Dict]:
+        """
+        Evalúa escenarios en paralelo.
+
+        Args:
+            escenarios: Escenarios a evaluar
+        Returns:
+            List[Dict]: Por escenario, en el mismo orden: nombre, valor
+                proyectado, diferencia con el vigente y {tipo: {valor, delta}}
+        """
+        if self._bloque is None:
+            raise ValueError("El simulador está cerrado")
+        tareas = [self._tarea(escenario) for escenario in escenarios]
+        if self._procesos == 1 or len(tareas) <= 1:
+            resultados = [self._evaluar_local(tarea) for tarea in tareas]
+        else:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._procesos,
+                    initializer=_inicializar_trabajador,
+                    initargs=(self._bloque.name, self._n),
+                )
+            resultados = list(self._pool.map(_evaluar_en_trabajador, tareas))
+        return [
+            self._reporte(escenario.nombre, centavos)
+            for escenario, centavos in zip(escenarios, resultados)
+        ]
+
+    def cerrar(self) -> None:
+        """Detiene el pool de procesos y libera la memoria compartida."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._bloque is not None:
+            for vista in self._columnas.values():
+                vista.release()
+            self._columnas = {}
+            self._bloque.close()
+            self._bloque.unlink()
+            self._bloque = None
+
+    def __enter__(self) -> "Simulador":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
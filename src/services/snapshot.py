@@ -0,0 +1,457 @@
+"""
+Snapshot binario y versionado del estado de una tienda.
+
+Formato (versión 7):
+    cabecera   MAGIA (8 bytes), versión (u16), reservado (u16),
+               longitud de metadatos (u64), little-endian
+    metadatos  JSON UTF-8: nombre, descuentos, acumulativos, comedores,
+               tabla de cadenas, vocabularios del libro de ventas y la
+               descripción de cada columna
+    datos      columnas binarias alineadas a 8 bytes, agrupadas por tipo de
+               mueble (SKU, precio, existencias y un arreglo por argumento del
+               constructor y por atributo de estado), seguidas de las
+               columnas del libro de ventas
+
+La versión 1 guardaba las ventas como una lista de diccionarios dentro de los
+metadatos, la versión 2 no guardaba el tipo de cada venta y hasta la versión 3
+los descuentos eran un diccionario {NombreClase: porcentaje}. Hasta la
+versión 4 cada SKU era una sola unidad, sin columna de existencias, y hasta
+la versión 5 cada pieza de un comedor se guardaba completa (las sillas
+compartidas se restauraban como objetos distintos). Hasta la versión 6 no
+se guardaban los atributos de estado (Mueble.atributos_estado, como el modo
+de un sofá-cama). Todas se siguen pudiendo cargar.
+
+Al cargar, el archivo se mapea en memoria y cada columna se copia a un
+arreglo con una sola copia de bytes. Precios, SKUs, existencias y agregados
+se restauran de inmediato sin recalcular ningún precio; los muebles se
+construyen desde las columnas al primer acceso a su fila y los índices de
+búsqueda se reconstruyen con la primera consulta (ver
+InventarioColumnar.cargar_diferido).
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from models.composicion.comedor import Comedor
+from models.mueble import memoizar_precio
+from services.catalogo import (
+    TIPOS_MUEBLE,
+    a_registro,
+    crear_mueble,
+    nombre_tipo,
+    parametros_constructor,
+)
+from services.descuentos import MotorDescuentos
+from services.ventas import LibroVentas
+
+MAGIA = b"LPA2SNAP"
+VERSION = 7
+_CABECERA = struct.Struct("<8sHHQ")
+_ALINEACION = 8
+
+
+def _alinear(posicion: int) -> int:
+    """Redondea una posición al siguiente múltiplo de la alineación."""
+    return (posicion + _ALINEACION - 1) // _ALINEACION * _ALINEACION
+
+
+def _tipo_columna(valores: list) -> str:
+    """
+    Elige el tipo de columna según los valores reales del atributo:
+    "b" booleanos, "q" enteros, "d" números y "s" textos (o None). Los
+    booleanos mezclados con números se guardan como números (0 y 1).
+    """
+    if all(type(v) is bool for v in valores):
+        return "b"
+    if all(type(v) in (bool, int) for v in valores):
+        return "q"
+    if all(type(v) in (bool, int, float) for v in valores):
+        return "d"
+    if all(v is None or isinstance(v, str) for v in valores):
+        return "s"
+    raise ValueError("No se puede serializar una columna con tipos mixtos")
+
+
+def _agregar_columnas(
+    columnas: list, bloques: List[bytes], posicion: int
+) -> Tuple[List[dict], int]:
+    """
+    Agrega columnas (nombre, tipo, arreglo) a los bloques de datos, alineadas.
+
+    Returns:
+        Tuple: Descripción de cada columna y posición final de los datos
+    """
+    meta_columnas = []
+    for nombre, tipo_columna, datos in columnas:
+        relleno = _alinear(posicion) - posicion
+        if relleno:
+            bloques.append(bytes(relleno))
+        posicion += relleno
+        contenido = datos.tobytes()
+        bloques.append(contenido)
+        meta_columnas.append(
+            {
+                "nombre": nombre,
+                "tipo": tipo_columna,
+                "formato": datos.typecode,
+                "posicion": posicion,
+                "bytes": len(contenido),
+            }
+        )
+        posicion += len(contenido)
+    return meta_columnas, posicion
+
+
+def _pieza(tienda, mueble, numero: Tuple[int, int], vistas: Dict[int, Tuple]) -> Dict:
+    """
+    Codifica una pieza de comedor: por SKU si está en el inventario, como
+    referencia a una pieza ya codificada si se comparte, o completa.
+    """
+    sku = tienda._inventario.sku_de(mueble)
+    if sku is not None:
+        return {"sku": sku}
+    anterior = vistas.get(id(mueble))
+    if anterior is not None:
+        return {"comedor": anterior[0], "pieza": anterior[1]}
+    vistas[id(mueble)] = numero
+    return a_registro(mueble)
+
+
+def piezas_vistas(comedores: List["Comedor"]) -> Dict[int, Tuple[int, int]]:
+    """
+    Retorna {id(pieza): (comedor, pieza)} de las piezas de unos comedores;
+    la pieza 0 es la mesa y las siguientes las sillas.
+    """
+    vistas = {}
+    for numero, comedor in enumerate(comedores):
+        for pieza, mueble in enumerate([comedor.mesa, *comedor.sillas]):
+            vistas.setdefault(id(mueble), (numero, pieza))
+    return vistas
+
+
+def registro_comedor(
+    tienda, comedor: "Comedor", numero: int, vistas: Dict[int, Tuple[int, int]]
+) -> Dict:
+    """
+    Convierte un comedor en un registro que conserva la identidad de sus
+    piezas: las del inventario se guardan como {"sku": n}, las compartidas
+    con una pieza anterior como {"comedor": k, "pieza": j} y el resto
+    completas (ver a_registro).
+
+    Args:
+        tienda: Tienda dueña del inventario
+        comedor: Comedor a convertir
+        numero: Posición que ocupará el comedor en la tienda
+        vistas: Piezas ya codificadas (ver piezas_vistas); se actualiza
+    Returns:
+        Dict: Registro con "nombre", "mesa" y "sillas"
+    """
+    piezas = [
+        _pieza(tienda, mueble, (numero, pieza), vistas)
+        for pieza, mueble in enumerate([comedor.mesa, *comedor.sillas])
+    ]
+    return {"nombre": comedor.nombre, "mesa": piezas[0], "sillas": piezas[1:]}
+
+
+def comedor_desde_registro(tienda, registro: Dict) -> "Comedor":
+    """
+    Reconstruye un comedor de registro_comedor, que ocupará la siguiente
+    posición en la tienda. Acepta también piezas completas de versiones
+    anteriores.
+
+    Args:
+        tienda: Tienda con el inventario y los comedores anteriores
+        registro: Registro del comedor
+    Returns:
+        Comedor: Comedor con sus piezas resueltas
+    Raises:
+        ValueError: Si una pieza referencia un SKU inexistente
+    """
+    numero = len(tienda._comedores)
+    piezas = []
+    for referencia in [registro["mesa"], *registro["sillas"]]:
+        if "sku" in referencia:
+            mueble = tienda._inventario.obtener(referencia["sku"])
+            if mueble is None:
+                raise ValueError(f"No existe un mueble con SKU {referencia['sku']}")
+        elif "pieza" in referencia:
+            comedor, pieza = referencia["comedor"], referencia["pieza"]
+            if comedor == numero:
+                mueble = piezas[pieza]
+            else:
+                anterior = tienda._comedores[comedor]
+                mueble = anterior.mesa if pieza == 0 else anterior.sillas[pieza - 1]
+        else:
+            mueble = crear_mueble(referencia)
+        piezas.append(mueble)
+    return Comedor(registro["nombre"], piezas[0], piezas[1:])
+
+
+def _sincronizar_directorio(ruta: str) -> None:
+    """
+    Hace fsync del directorio de un archivo para que un renombrado sobreviva
+    a una caída. En sistemas que no permiten abrir directorios no hace nada.
+    """
+    try:
+        descriptor = os.open(os.path.dirname(os.path.abspath(ruta)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def guardar(tienda, ruta: str) -> None:
+    """
+    Escribe el snapshot de una tienda.
+    El archivo se escribe primero con extensión .tmp y luego se renombra, de
+    modo que un fallo a mitad de escritura no deja un snapshot corrupto; tras
+    renombrarlo se sincroniza el directorio para que el renombrado sea durable.
+
+    Args:
+        tienda: Instancia de TiendaMuebles
+        ruta: Ruta del archivo destino
+    """
+    cadenas: Dict[str, int] = {}
+    grupos = defaultdict(list)
+    for entrada in tienda._inventario.entradas():
+        grupos[nombre_tipo(entrada[1])].append(entrada)
+
+    bloques: List[bytes] = []
+    posicion = 0
+    meta_grupos = []
+    for tipo, entradas in grupos.items():
+        muebles = [mueble for _, mueble, _, _ in entradas]
+        columnas = [
+            ("__sku", "q", array("q", [sku for sku, _, _, _ in entradas])),
+            ("__precio", "d", array("d", [precio for _, _, precio, _ in entradas])),
+            ("__existencias", "q", array("q", [n for _, _, _, n in entradas])),
+        ]
+        clase = type(muebles[0])
+        atributos = [p.name for p in parametros_constructor(clase)]
+        for atributo in atributos + list(clase.atributos_estado):
+            valores = [getattr(mueble, atributo) for mueble in muebles]
+            tipo_columna = _tipo_columna(valores)
+            if tipo_columna == "s":
+                datos = array(
+                    "i",
+                    [
+                        -1 if v is None else cadenas.setdefault(v, len(cadenas))
+                        for v in valores
+                    ],
+                )
+            else:
+                datos = array(tipo_columna, valores)
+            columnas.append((atributo, tipo_columna, datos))
+        meta_columnas, posicion = _agregar_columnas(columnas, bloques, posicion)
+        meta_grupos.append(
+            {"tipo": tipo, "cantidad": len(entradas), "columnas": meta_columnas}
+        )
+
+    vistas: Dict[int, Tuple[int, int]] = {}
+    libro = tienda._ventas_realizadas
+    muebles_vendidos, clientes, tipos_vendidos = libro.vocabularios()
+    meta_ventas, posicion = _agregar_columnas(
+        [(nombre, "n", datos) for nombre, datos in libro.columnas().items()],
+        bloques,
+        posicion,
+    )
+
+    meta = {
+        "nombre": tienda._nombre,
+        "orden_bytes": sys.byteorder,
+        "siguiente_sku": tienda._inventario.siguiente_sku,
+        "descuentos": tienda._descuentos.a_registro(),
+        "ventas": {
+            "muebles": muebles_vendidos,
+            "clientes": clientes,
+            "tipos": tipos_vendidos,
+            "columnas": meta_ventas,
+        },
+        "total_muebles_vendidos": tienda._total_muebles_vendidos,
+        "valor_total_ventas": tienda._valor_total_ventas,
+        "comedores": [
+            registro_comedor(tienda, comedor, numero, vistas)
+            for numero, comedor in enumerate(tienda._comedores)
+        ],
+        "cadenas": list(cadenas),
+        "grupos": meta_grupos,
+    }
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    inicio_datos = _alinear(_CABECERA.size + len(meta_bytes))
+
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(_CABECERA.pack(MAGIA, VERSION, 0, len(meta_bytes)))
+        archivo.write(meta_bytes)
+        archivo.write(bytes(inicio_datos - _CABECERA.size - len(meta_bytes)))
+        for bloque in bloques:
+            archivo.write(bloque)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+    _sincronizar_directorio(ruta)
+
+
+def _leer_columna(vista: memoryview, inicio: int, columna: dict, invertir: bool):
+    """
+    Copia una columna del snapshot a un arreglo, invirtiendo los bytes si el
+    orden del archivo difiere del de la máquina.
+    """
+    desde = inicio + columna["posicion"]
+    copia = array(columna["formato"])
+    copia.frombytes(vista[desde : desde + columna["bytes"]])
+    if invertir:
+        copia.byteswap()
+    return copia
+
+
+def _fabrica(grupos: List[tuple], ubicaciones: Dict[int, Tuple[int, int]], cadenas):
+    """
+    Retorna la función que construye el mueble de un SKU desde las columnas
+    cargadas, con sus atributos de estado y su precio ya memoizado.
+
+    Args:
+        grupos: Tuplas (clase, precios, [(nombre, tipo, datos)]) por grupo
+        ubicaciones: {sku: (grupo, fila)}
+        cadenas: Tabla de cadenas del snapshot
+    """
+
+    def construir(sku: int):
+        grupo, fila = ubicaciones.pop(sku)
+        clase, precios, columnas = grupos[grupo]
+        argumentos = {}
+        for nombre, tipo_columna, datos in columnas:
+            valor = datos[fila]
+            if tipo_columna == "s":
+                valor = cadenas[valor] if valor >= 0 else None
+            elif tipo_columna == "b":
+                valor = bool(valor)
+            argumentos[nombre] = valor
+        estado = {
+            atributo: argumentos.pop(atributo)
+            for atributo in clase.atributos_estado
+            if atributo in argumentos
+        }
+        mueble = clase(**argumentos)
+        for atributo, valor in estado.items():
+            setattr(mueble, atributo, valor)
+        memoizar_precio(mueble, precios[fila])
+        return mueble
+
+    return construir
+
+
+def cargar_en(tienda, ruta: str) -> None:
+    """
+    Restaura en una tienda vacía el estado guardado en un snapshot.
+    Los muebles se construyen al primer acceso; si la tienda usa un catálogo
+    se construyen y comparten al cargar, para que el catálogo los conozca.
+
+    Args:
+        tienda: Instancia de TiendaMuebles recién creada
+        ruta: Ruta del snapshot
+
+    Raises:
+        ValueError: Si el archivo no es un snapshot o su versión no es soportada
+    """
+    with open(ruta, "rb") as archivo, mmap.mmap(
+        archivo.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapa:
+        magia, version, _, longitud_meta = _CABECERA.unpack_from(mapa, 0)
+        if magia != MAGIA:
+            raise ValueError(f"'{ruta}' no es un snapshot de la tienda")
+        if version > VERSION:
+            raise ValueError(f"Versión de snapshot no soportada: {version}")
+        meta = json.loads(mapa[_CABECERA.size : _CABECERA.size + longitud_meta])
+        inicio = _alinear(_CABECERA.size + longitud_meta)
+        invertir = meta["orden_bytes"] != sys.byteorder
+
+        grupos = []
+        clases: List[type] = []
+        skus, precios, existencias = array("q"), array("d"), array("q")
+        numeros, filas = array("i"), array("q")
+        with memoryview(mapa) as vista:
+            for grupo in meta["grupos"]:
+                clase = TIPOS_MUEBLE[grupo["tipo"]]
+                columnas = [
+                    (c["nombre"], c["tipo"], _leer_columna(vista, inicio, c, invertir))
+                    for c in grupo["columnas"]
+                ]
+                especiales = {
+                    nombre: datos
+                    for nombre, _, datos in columnas
+                    if nombre.startswith("__")
+                }
+                cantidad = grupo["cantidad"]
+                skus.extend(especiales["__sku"])
+                precios.extend(especiales["__precio"])
+                existencias.extend(
+                    especiales.get("__existencias", array("q", [1]) * cantidad)
+                )
+                numeros.extend(array("i", [len(grupos)]) * cantidad)
+                filas.extend(range(cantidad))
+                clases.extend([clase] * cantidad)
+                grupos.append(
+                    (
+                        clase,
+                        especiales["__precio"],
+                        [c for c in columnas if not c[0].startswith("__")],
+                    )
+                )
+
+            ventas = meta["ventas"]
+            if version < 2:
+                libro = LibroVentas()
+                for venta in ventas:
+                    libro.agregar_venta(venta)
+            else:
+                libro = LibroVentas.desde_columnas(
+                    ventas["muebles"],
+                    ventas["clientes"],
+                    {
+                        c["nombre"]: _leer_columna(vista, inicio, c, invertir)
+                        for c in ventas["columnas"]
+                    },
+                    ventas.get("tipos"),
+                )
+
+    construir = _fabrica(grupos, dict(zip(skus, zip(numeros, filas))), meta["cadenas"])
+
+    def compartir(sku: int):
+        return tienda._compartir_definiciones([construir(sku)])[0]
+
+    # Las filas vuelven al orden de los SKUs, que es el orden de alta
+    orden = sorted(range(len(skus)), key=skus.__getitem__)
+    if orden != list(range(len(skus))):
+        clases = [clases[i] for i in orden]
+        precios = array("d", [precios[i] for i in orden])
+        skus = array("q", [skus[i] for i in orden])
+        existencias = array("q", [existencias[i] for i in orden])
+    inventario = tienda._inventario
+    inventario.cargar_diferido(
+        clases,
+        precios,
+        skus,
+        existencias,
+        construir if tienda._catalogo is None else compartir,
+    )
+    if tienda._catalogo is not None:
+        inventario._materializar()
+    inventario.siguiente_sku = meta["siguiente_sku"]
+    tienda._nombre = meta["nombre"]
+    tienda._descuentos = MotorDescuentos.desde_registro(meta["descuentos"])
+    tienda._ventas_realizadas = libro
+    tienda._total_muebles_vendidos = meta["total_muebles_vendidos"]
+    tienda._valor_total_ventas = meta["valor_total_ventas"]
+    for registro in meta["comedores"]:
+        tienda._incorporar_comedor(comedor_desde_registro(tienda, registro))
@@ -0,0 +1,156 @@
+"""
+Ejecución de tareas en segundo plano para la interfaz.
+Las tareas corren en un hilo aparte, informan su progreso y se pueden
+cancelar; sus resultados se guardan en caché mientras no cambie la versión
+de la tienda de la que dependen.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TareaCancelada(Exception):
+    """Se lanza dentro de una tarea cuando se solicitó su cancelación."""
+
+
+class Tarea:
+    """
+    Estado compartido entre una tarea en segundo plano y quien la espera.
+    La función de la tarea llama a avanzar para informar su progreso; si se
+    pidió la cancelación, avanzar lanza TareaCancelada.
+    """
+
+    def __init__(self, descripcion: str):
+        """
+        Args:
+            descripcion: Texto que describe la tarea en la interfaz
+        """
+        self._descripcion = descripcion
+        self._cancelar = threading.Event()
+        self._hechas = 0
+        self._total: Optional[int] = None
+        self.futuro: Optional[Future] = None
+
+    @property
+    def descripcion(self) -> str:
+        """Getter para la descripción."""
+        return self._descripcion
+
+    @property
+    def progreso(self) -> Tuple[int, Optional[int]]:
+        """Unidades hechas y total (None si no se conoce)."""
+        return self._hechas, self._total
+
+    @property
+    def cancelada(self) -> bool:
+        """True si se pidió cancelar la tarea."""
+        return self._cancelar.is_set()
+
+    def avanzar(self, hechas: int, total: Optional[int] = None) -> None:
+        """
+        Informa el progreso de la tarea.
+
+        Args:
+            hechas: Unidades completadas
+            total: Total de unidades, si se conoce
+
+        Raises:
+            TareaCancelada: Si se pidió cancelar la tarea
+        """
+        self._hechas = hechas
+        if total is not None:
+            self._total = total
+        if self._cancelar.is_set():
+            raise TareaCancelada(self._descripcion)
+
+    def cancelar(self) -> None:
+        """Pide la cancelación; la tarea se detiene en su próximo avance."""
+        self._cancelar.set()
+        if self.futuro is not None:
+            self.futuro.cancel()
+
+    def terminada(self) -> bool:
+        """True si la tarea terminó, falló o fue cancelada."""
+        return self.futuro is not None and self.futuro.done()
+
+    def resultado(self, timeout: Optional[float] = None) -> Any:
+        """Espera y retorna el resultado (relanza el error de la tarea)."""
+        return self.futuro.result(timeout)
+
+
+class EjecutorTareas:
+    """
+    Ejecutor de tareas en segundo plano con caché por versión.
+
+    Una tarea enviada con clave y versión se reutiliza mientras la versión no
+    cambie: si ya terminó bien se devuelve su resultado sin recalcularlo, y si
+    sigue en curso se devuelve la misma tarea en lugar de lanzar otra. Las
+    tareas canceladas o fallidas se descartan de la caché.
+    """
+
+    def __init__(self, max_hilos: int = 1):
+        """
+        Args:
+            max_hilos: Número de hilos del ejecutor
+        """
+        self._ejecutor = ThreadPoolExecutor(
+            max_workers=max_hilos, thread_name_prefix="tienda"
+        )
+        self._cache: Dict[Hashable, Tuple[Hashable, Tarea]] = {}
+        self._candado = threading.Lock()
+
+    def enviar(
+        self,
+        descripcion: str,
+        funcion: Callable[["Tarea"], Any],
+        clave: Optional[Hashable] = None,
+        version: Hashable = None,
+    ) -> Tarea:
+        """
+        Ejecuta funcion(tarea) en segundo plano.
+
+        Args:
+            descripcion: Texto que describe la tarea
+            funcion: Función que recibe la Tarea para informar progreso
+            clave: Clave de caché; None para no guardar el resultado
+            version: Versión de los datos de los que depende el resultado
+
+        Returns:
+            Tarea: Tarea nueva o reutilizada desde la caché
+        """
+        with self._candado:
+            if clave is not None:
+                guardada = self._cache.get(clave)
+                if guardada is not None and guardada[0] == version:
+                    tarea = guardada[1]
+                    if not tarea.cancelada and (
+                        not tarea.terminada()
+                        or (
+                            not tarea.futuro.cancelled()
+                            and tarea.futuro.exception() is None
+                        )
+                    ):
+                        return tarea
+                    del self._cache[clave]
+            tarea = Tarea(descripcion)
+            tarea.futuro = self._ejecutor.submit(funcion, tarea)
+            if clave is not None:
+                self._cache[clave] = (version, tarea)
+            return tarea
+
+    def invalidar(self, clave: Optional[Hashable] = None) -> None:
+        """Descarta el resultado guardado de una clave, o de todas."""
+        with self._candado:
+            if clave is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(clave, None)
+
+    def cerrar(self) -> None:
+        """Cancela las tareas pendientes y detiene el ejecutor."""
+        with self._candado:
+            for _, tarea in self._cache.values():
+                tarea.cancelar()
+            self._cache.clear()
+        self._ejecutor.shutdown(wait=False, cancel_futures=True)
@@ -3,111 +3,97 @@ Servicio de la tienda que maneja la lógica de negocio.
 Esta clase implementa el patrón de servicio para separar la lógica de negocio de la UI.
 """
 
-from typing import List, Dict, Optional, Union
+import time
+from datetime import datetime
+from itertools import islice
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, TextIO, Tuple, Union
 
 # Corrección de imports para ejecución directa
 from models.mueble import Mueble
 from models.composicion.comedor import Comedor
-# TODO: Importar las clases necesarias
+from services import snapshot
+from services.catalogo import Catalogo, a_registro
+from services.descuentos import MotorDescuentos, ReglaDescuento, resolver_categoria
+from services.inventario import InventarioColumnar
+from services.precios import cotizar
+from services.simulador import Escenario, Simulador
+from services.ventas import NS_HORA, FilaVenta, LibroVentas
+from services.wal import Bitacora, reproducir
 
 
 class TiendaMuebles:
     def obtener_estadisticas(self) -> dict:
         """
         Retorna estadísticas básicas y acumulativas de la tienda para la UI.
+        Los valores salen de agregados que se mantienen al agregar, vender o
+        modificar muebles, por lo que el costo no depende del inventario.
         Returns:
             dict: Diccionario con estadísticas
         """
         try:
-            total_muebles = len(self._inventario)
-            total_comedores = len(self._comedores)
-            valor_inventario = 0
-            for mueble in self._inventario:
-                try:
-                    valor_inventario += mueble.calcular_precio()
-                except Exception:
-                    pass
-            tipos_muebles = {}
-            for mueble in self._inventario:
-                tipo = type(mueble).__name__
-                tipos_muebles[tipo] = tipos_muebles.get(tipo, 0) + 1
-            ventas_realizadas = (
-                len(self._ventas_realizadas)
-                if hasattr(self, "_ventas_realizadas")
-                else 0
-            )
-            # Acumulativos
-            total_muebles_vendidos = getattr(self, "_total_muebles_vendidos", 0)
-            valor_total_ventas = getattr(self, "_valor_total_ventas", 0.0)
+            valor_por_tipo = self._inventario.valor_por_tipo()
+            valor_con_descuentos = self._valor_con_descuentos(valor_por_tipo)
             return {
-                "total_muebles": total_muebles,
-                "total_comedores": total_comedores,
-                "valor_inventario": valor_inventario,
-                "tipos_muebles": tipos_muebles,
-                "descuentos_activos": self._descuentos_activos.copy(),
-                "ventas_realizadas": ventas_realizadas,
-                "total_muebles_vendidos": total_muebles_vendidos,
-                "valor_total_ventas": valor_total_ventas,
+                "total_muebles": self._inventario.unidades(),
+                "total_productos": len(self._inventario),
+                "total_comedores": len(self._comedores),
+                "valor_inventario": self._inventario.valor_total(),
+                "valor_inventario_con_descuentos": round(valor_con_descuentos, 2),
+                "tipos_muebles": self._inventario.conteo_por_tipo(),
+                "valor_por_tipo": valor_por_tipo,
+                "descuentos_activos": self._descuentos.resumen(),
+                "ventas_realizadas": len(self._ventas_realizadas),
+                # Acumulativos
+                "total_muebles_vendidos": self._total_muebles_vendidos,
+                "valor_total_ventas": self._valor_total_ventas,
             }
         except Exception:
             return {
                 "total_muebles": 0,
+                "total_productos": 0,
                 "total_comedores": 0,
                 "valor_inventario": 0.0,
+                "valor_inventario_con_descuentos": 0.0,
                 "tipos_muebles": {},
+                "valor_por_tipo": {},
                 "descuentos_activos": {},
                 "ventas_realizadas": 0,
                 "total_muebles_vendidos": 0,
                 "valor_total_ventas": 0.0,
             }
 
+    def _valor_con_descuentos(self, valor_por_tipo: Dict[str, float]) -> float:
+        """
+        Calcula el valor del inventario con descuentos.
+        Si ninguna regla depende del material o del precio, basta el descuento
+        fijo de cada clase sobre su valor agregado; si no, se aplica el motor
+        sobre la columna de precios (por las existencias de cada SKU) y el
+        resultado se guarda hasta que cambien el inventario o las reglas.
+        Método privado auxiliar.
+        """
+        if not self._descuentos.condicional:
+            clases = self._inventario.clases_por_tipo()
+            return sum(
+                valor * (1 - self._descuentos.descuento_clase(clases[tipo]))
+                for tipo, valor in valor_por_tipo.items()
+            )
+        clave = (self._inventario.version, self._descuentos.version)
+        if self._valor_descuentos_cache[0] != clave:
+            precios = self._descuentos.aplicar(self._inventario, self._inventario.precios())
+            valor = sum(
+                precio * cantidad
+                for precio, cantidad in zip(precios, self._inventario.cantidades())
+            )
+            self._valor_descuentos_cache = (clave, valor)
+        return self._valor_descuentos_cache[1]
+
     def estadisticas(self) -> dict:
         """
-        Retorna estadísticas básicas y acumulativas de la tienda para la UI.
+        Alias de obtener_estadisticas, conservado por compatibilidad.
         Returns:
             dict: Diccionario con estadísticas
         """
-        try:
-            total_muebles = len(self._inventario)
-            total_comedores = len(self._comedores)
-            valor_inventario = 0
-            for mueble in self._inventario:
-                try:
-                    valor_inventario += mueble.calcular_precio()
-                except Exception:
-                    pass
-            tipos_muebles = {}
-            for mueble in self._inventario:
-                tipo = type(mueble).__name__
-                tipos_muebles[tipo] = tipos_muebles.get(tipo, 0) + 1
-            ventas_realizadas = (
-                len(self._ventas_realizadas)
-                if hasattr(self, "_ventas_realizadas")
-                else 0
-            )
-            total_muebles_vendidos = getattr(self, "_total_muebles_vendidos", 0)
-            valor_total_ventas = getattr(self, "_valor_total_ventas", 0.0)
-            return {
-                "total_muebles": total_muebles,
-                "total_comedores": total_comedores,
-                "valor_inventario": valor_inventario,
-                "tipos_muebles": tipos_muebles,
-                "descuentos_activos": self._descuentos_activos.copy(),
-                "ventas_realizadas": ventas_realizadas,
-                "total_muebles_vendidos": total_muebles_vendidos,
-                "valor_total_ventas": valor_total_ventas,
-            }
-        except Exception:
-            return {
-                "total_muebles": 0,
-                "total_comedores": 0,
-                "valor_inventario": 0.0,
-                "tipos_muebles": {},
-                "descuentos_activos": {},
-                "ventas_realizadas": 0,
-                "total_muebles_vendidos": 0,
-                "valor_total_ventas": 0.0,
-            }
+        return self.obtener_estadisticas()
 
     """
     Clase que maneja toda la lógica de negocio de la tienda de muebles.
@@ -124,51 +110,452 @@ class TiendaMuebles:
     - Composición: Contiene colecciones de muebles
     """
 
-    def __init__(self, nombre_tienda: str = "Mueblería OOP"):
+    def __init__(
+        self, nombre_tienda: str = "Mueblería OOP", catalogo: Optional[Catalogo] = None
+    ):
         """
         Constructor de la tienda.
 
         Args:
             nombre_tienda: Nombre de la tienda
+            catalogo: Catálogo compartido con otras tiendas (opcional); si se
+                indica, el inventario guarda las definiciones del catálogo y
+                la tienda solo lleva sus existencias y descuentos
         """
         self._nombre = nombre_tienda
-        self._inventario: List[Mueble] = []
+        self._catalogo = catalogo
+        self._inventario = InventarioColumnar(
+            catalogo.indice_nombres if catalogo is not None else None
+        )
         self._comedores: List[Comedor] = []
-        self._ventas_realizadas: List[Dict] = []
-        self._descuentos_activos: Dict[str, float] = {}
+        # id(pieza) -> (comedor, pieza) de la primera aparición de cada pieza
+        # de los comedores; la pieza 0 es la mesa
+        self._piezas_comedor: Dict[int, Tuple[int, int]] = {}
+        self._ventas_realizadas = LibroVentas()
+        self._descuentos = MotorDescuentos()
+        self._valor_descuentos_cache: tuple = (None, 0.0)
         # Campos acumulativos
         self._total_muebles_vendidos: int = 0
         self._valor_total_ventas: float = 0.0
-        pass
+        # Cambios que no pasan por el inventario (descuentos, comedores, ventas)
+        self._version = 0
+        # Bitácora de escritura anticipada (opcional)
+        self._bitacora: Optional[Bitacora] = None
+        # Los cambios hechos con los setters de un mueble llegan por el
+        # observador del inventario y también se registran en la bitácora
+        self._inventario.al_modificar = self._registrar_modificacion
 
     @property
     def nombre(self) -> str:
         """Getter para el nombre de la tienda."""
         return self._nombre
 
+    @property
+    def catalogo(self) -> Optional[Catalogo]:
+        """Getter para el catálogo compartido, o None si la tienda no usa uno."""
+        return self._catalogo
+
+    @property
+    def version(self) -> int:
+        """
+        Versión del estado de la tienda: cambia con cualquier alta, baja,
+        modificación, venta, descuento o comedor. Sirve como clave de caché.
+        """
+        return self._inventario.version + self._version
+
+    def guardar_snapshot(self, ruta: str) -> None:
+        """
+        Guarda inventario, comedores, descuentos, ventas y acumulativos en un
+        snapshot binario versionado (ver services.snapshot).
+
+        Args:
+            ruta: Ruta del archivo destino
+        """
+        snapshot.guardar(self, ruta)
+
+    @classmethod
+    def cargar_snapshot(
+        cls, ruta: str, catalogo: Optional[Catalogo] = None
+    ) -> "TiendaMuebles":
+        """
+        Crea una tienda a partir de un snapshot guardado con guardar_snapshot.
+        Restaura precios y SKUs desde el archivo sin recalcularlos.
+
+        Args:
+            ruta: Ruta del snapshot
+            catalogo: Catálogo compartido de la tienda restaurada (opcional)
+        Returns:
+            TiendaMuebles: Tienda restaurada
+        """
+        tienda = cls(catalogo=catalogo)
+        snapshot.cargar_en(tienda, ruta)
+        return tienda
+
+    def habilitar_bitacora(
+        self, directorio: str, fsync_cada: int = 64, fsync_ms: float = 50
+    ) -> None:
+        """
+        Empieza a registrar las operaciones de la tienda en una bitácora de
+        escritura anticipada. El estado actual se guarda como snapshot base.
+        Para reabrir un directorio con datos se usa recuperar.
+
+        Args:
+            directorio: Directorio nuevo o vacío para segmentos y snapshots
+            fsync_cada: Registros pendientes que disparan un fsync
+            fsync_ms: Milisegundos máximos que un registro espera su fsync
+
+        Raises:
+            ValueError: Si el directorio ya contiene una bitácora
+        """
+        bitacora = Bitacora(directorio, fsync_cada, fsync_ms)
+        if bitacora.ultimo_snapshot()[0] is not None or len(bitacora.segmentos()) > 1:
+            bitacora.cerrar()
+            raise ValueError(
+                f"'{directorio}' ya contiene una bitácora; use TiendaMuebles.recuperar"
+            )
+        bitacora.compactar(self)
+        self._bitacora = bitacora
+
+    @classmethod
+    def recuperar(
+        cls,
+        directorio: str,
+        fsync_cada: int = 64,
+        fsync_ms: float = 50,
+        catalogo: Optional[Catalogo] = None,
+    ) -> "TiendaMuebles":
+        """
+        Reconstruye una tienda desde su bitácora: carga el último snapshot y
+        reaplica los registros posteriores. La tienda sigue registrando sus
+        operaciones en la misma bitácora.
+
+        Args:
+            directorio: Directorio de la bitácora
+            fsync_cada: Registros pendientes que disparan un fsync
+            fsync_ms: Milisegundos máximos que un registro espera su fsync
+            catalogo: Catálogo compartido de la tienda recuperada (opcional)
+        Returns:
+            TiendaMuebles: Tienda recuperada
+        """
+        bitacora = Bitacora(directorio, fsync_cada, fsync_ms)
+        numero, ruta = bitacora.ultimo_snapshot()
+        if ruta:
+            tienda = cls.cargar_snapshot(ruta, catalogo)
+        else:
+            tienda = cls(catalogo=catalogo)
+        for registro in bitacora.leer(numero or 0):
+            reproducir(tienda, registro)
+        tienda._bitacora = bitacora
+        return tienda
+
+    def compactar_bitacora(self) -> str:
+        """
+        Pliega los segmentos de la bitácora en un snapshot nuevo.
+        Returns:
+            str: Mensaje de confirmación
+        """
+        if self._bitacora is None:
+            return "Error: La tienda no tiene una bitácora activa"
+        ruta = self._bitacora.compactar(self)
+        return f"Bitácora compactada en {ruta}"
+
+    def cerrar(self) -> None:
+        """Sincroniza y cierra la bitácora, si está activa."""
+        if self._bitacora is not None:
+            self._bitacora.cerrar()
+            self._bitacora = None
+
+    def _registrar(self, registro: Dict) -> None:
+        """
+        Agrega un registro a la bitácora, si está activa.
+        Método privado auxiliar.
+        """
+        if self._bitacora is not None:
+            self._bitacora.registrar(registro)
+
+    def _registrar_modificacion(self, sku: int, mueble: "Mueble") -> None:
+        """
+        Registra en la bitácora el estado de un mueble modificado con sus
+        setters, para que recuperar lo reaplique.
+        Método privado auxiliar.
+        """
+        if self._bitacora is not None:
+            self._registrar(
+                {"op": "modificar", "sku": sku, "mueble": a_registro(mueble)}
+            )
+
+    def _registrar_pieza(self, mueble: "Mueble") -> None:
+        """
+        Observador de las piezas de los comedores: registra en la bitácora
+        los cambios de las piezas que no están en el inventario (las demás
+        ya llegan por _registrar_modificacion).
+        Método privado auxiliar.
+        """
+        if self._bitacora is None or mueble in self._inventario:
+            return
+        comedor, pieza = self._piezas_comedor[id(mueble)]
+        self._registrar(
+            {
+                "op": "modificar",
+                "comedor": comedor,
+                "pieza": pieza,
+                "mueble": a_registro(mueble),
+            }
+        )
+
+    def _incorporar_comedor(self, comedor: "Comedor") -> None:
+        """
+        Agrega un comedor a la lista y se suscribe a sus piezas nuevas, para
+        que sus cambios queden en la bitácora.
+        Método privado auxiliar.
+        """
+        numero = len(self._comedores)
+        self._comedores.append(comedor)
+        for pieza, mueble in enumerate([comedor.mesa, *comedor.sillas]):
+            if id(mueble) not in self._piezas_comedor:
+                self._piezas_comedor[id(mueble)] = (numero, pieza)
+                mueble._suscribir(self._registrar_pieza)
+
     # @property
     # def total_muebles(self) -> int:
     #     """Retorna el total de muebles en inventario."""
     #     return len(self._inventario)
 
-    def agregar_mueble(self, mueble: "Mueble") -> str:
+    def _compartir_definiciones(self, muebles: List["Mueble"]) -> List["Mueble"]:
         """
-        Agrega un mueble al inventario de la tienda.
+        Sustituye cada mueble por su definición del catálogo, si la tienda
+        usa uno. Al restaurar, los SKUs que resultan ser el mismo producto
+        (o uno que ya está en el inventario) se registran como definiciones
+        propias, ya que cada SKU necesita un mueble distinto.
+        Método privado auxiliar.
+        """
+        if self._catalogo is None:
+            return muebles
+        compartidos = []
+        usados = set()
+        for mueble in muebles:
+            definicion = self._catalogo.registrar(mueble)
+            if definicion in self._inventario or id(definicion) in usados:
+                definicion = self._catalogo.registrar(mueble, compartir=False)
+            usados.add(id(definicion))
+            compartidos.append(definicion)
+        return compartidos
+
+    def agregar_mueble(self, mueble: "Mueble", cantidad: int = 1) -> str:
+        """
+        Agrega un producto al inventario de la tienda con sus unidades en
+        existencia. Las unidades idénticas comparten un solo objeto y un SKU.
+        Si la tienda usa un catálogo, se guarda la definición compartida y un
+        producto que ya está en el inventario suma existencias. El mueble se
+        registra en el catálogo solo después de validarlo.
         Args:
             mueble: Objeto mueble a agregar
+            cantidad: Unidades en existencia
         Returns:
             str: Mensaje de confirmación
         """
         if mueble is None:
             return "Error: El mueble no puede ser None"
+        if not isinstance(cantidad, int) or cantidad < 1:
+            return "Error: La cantidad debe ser un entero mayor a 0"
+        if self._catalogo is None and mueble in self._inventario:
+            return "Error: El mueble ya está en el inventario; use reponer_existencias"
         try:
             precio = mueble.calcular_precio()
             if precio <= 0:
                 return "Error: El mueble debe tener un precio válido mayor a 0"
         except Exception as e:
             return f"Error al calcular precio del mueble: {str(e)}"
-        self._inventario.append(mueble)
-        return f"Mueble {getattr(mueble, 'nombre', str(mueble))} agregado exitosamente al inventario"
+        registro = None
+        if self._bitacora is not None:
+            try:
+                registro = a_registro(mueble)
+            except ValueError as e:
+                return f"Error: {str(e)}"
+        if self._catalogo is not None:
+            mueble = self._catalogo.registrar(mueble)
+            if mueble in self._inventario:
+                return self.reponer_existencias(self._inventario.sku_de(mueble), cantidad)
+            precio = mueble.calcular_precio()
+        sku = self._inventario.agregar(mueble, precio, cantidad=cantidad)
+        if registro is not None:
+            self._registrar({"op": "agregar", "entradas": [[sku, registro, cantidad]]})
+        unidades = f" ({cantidad} unidades)" if cantidad > 1 else ""
+        return f"Mueble {getattr(mueble, 'nombre', str(mueble))} agregado exitosamente al inventario{unidades}"
+
+    def agregar_muebles(self, muebles: Iterable["Mueble"]) -> Dict[str, int]:
+        """
+        Agrega muchos muebles de una vez, pensado para cargas masivas.
+
+        Calcula y valida los precios del lote completo (con los kernels por
+        clase de services.precios) y agrega solo los muebles válidos de una
+        vez, sin construir un mensaje por mueble.
+
+        Si la tienda usa un catálogo, los muebles válidos se registran en él y
+        los que son el mismo producto se agregan como unidades de un solo SKU;
+        los productos que ya están en el inventario suman existencias. Los
+        muebles rechazados no se registran en el catálogo.
+
+        Args:
+            muebles: Muebles a agregar
+        Returns:
+            Dict[str, int]: Número de muebles agregados y rechazados
+        """
+        muebles = list(muebles)
+        try:
+            cotizar(list({id(mueble): mueble for mueble in muebles}.values()), memoizar=True)
+        except Exception:
+            # Algún mueble no se puede cotizar por columnas; se valida uno a uno
+            pass
+        validos = []
+        registros = []
+        vistos = set()
+        posiciones: Dict[int, int] = {}  # id(definición) -> posición en validos
+        reposiciones: Dict[int, int] = {}  # sku -> unidades a sumar
+        rechazados = 0
+        for mueble in muebles:
+            try:
+                precio = mueble.calcular_precio()
+            except Exception:
+                precio = None
+            if precio is None or precio <= 0:
+                rechazados += 1
+                continue
+            if self._catalogo is None and (
+                mueble in self._inventario or id(mueble) in vistos
+            ):
+                rechazados += 1
+                continue
+            registro = None
+            if self._bitacora is not None:
+                try:
+                    registro = a_registro(mueble)
+                except ValueError:
+                    rechazados += 1
+                    continue
+            if self._catalogo is not None:
+                mueble = self._catalogo.registrar(mueble)
+                if mueble in self._inventario:
+                    sku = self._inventario.sku_de(mueble)
+                    reposiciones[sku] = reposiciones.get(sku, 0) + 1
+                    continue
+                posicion = posiciones.get(id(mueble))
+                if posicion is not None:
+                    definicion, precio, _, cantidad = validos[posicion]
+                    validos[posicion] = (definicion, precio, None, cantidad + 1)
+                    continue
+                precio = mueble.calcular_precio()
+            if registro is not None:
+                registros.append(registro)
+            vistos.add(id(mueble))
+            posiciones[id(mueble)] = len(validos)
+            validos.append((mueble, precio, None, 1))
+        skus = self._inventario.agregar_lote(validos)
+        if validos:
+            self._registrar(
+                {
+                    "op": "agregar",
+                    "entradas": [
+                        [sku, registro, cantidad]
+                        for sku, registro, (_, _, _, cantidad) in zip(skus, registros, validos)
+                    ],
+                }
+            )
+        for sku, cantidad in reposiciones.items():
+            self._inventario.reponer(sku, cantidad)
+            self._registrar({"op": "reponer", "sku": sku, "cantidad": cantidad})
+        agregados = sum(cantidad for _, _, _, cantidad in validos) + sum(reposiciones.values())
+        return {"agregados": agregados, "rechazados": rechazados}
+
+    def obtener_sku(self, mueble: "Mueble") -> Optional[int]:
+        """
+        Retorna el SKU estable asignado a un mueble al entrar al inventario.
+        Args:
+            mueble: Mueble del inventario
+        Returns:
+            Optional[int]: SKU del mueble, o None si no está en inventario
+        """
+        return self._inventario.sku_de(mueble)
+
+    def obtener_mueble(self, sku: int) -> Optional["Mueble"]:
+        """
+        Busca un mueble por su SKU en O(1).
+        Args:
+            sku: SKU del mueble
+        Returns:
+            Optional[Mueble]: El mueble, o None si el SKU no existe
+        """
+        return self._inventario.obtener(sku)
+
+    def obtener_precio(self, mueble: "Mueble") -> Optional[float]:
+        """
+        Retorna en O(1) el precio registrado de un mueble, sin recalcularlo.
+        Args:
+            mueble: Mueble del inventario
+        Returns:
+            Optional[float]: Precio del mueble, o None si no está en inventario
+        """
+        if mueble not in self._inventario:
+            return None
+        return self._inventario.precio(mueble)
+
+    def obtener_descripcion(self, mueble: "Mueble") -> str:
+        """
+        Retorna la descripción de un mueble; si la tienda usa un catálogo, la
+        toma de su caché en lugar de generarla en cada llamada.
+        Args:
+            mueble: Mueble del inventario
+        Returns:
+            str: Descripción completa del mueble
+        """
+        if self._catalogo is not None:
+            return self._catalogo.descripcion(mueble)
+        return mueble.obtener_descripcion()
+
+    def obtener_existencias(self, sku: int) -> int:
+        """
+        Retorna en O(1) las unidades en existencia de un SKU.
+        Args:
+            sku: SKU del producto
+        Returns:
+            int: Unidades en existencia (0 si el SKU no existe)
+        """
+        return self._inventario.existencias(sku)
+
+    def reponer_existencias(self, sku: int, cantidad: int) -> str:
+        """
+        Suma unidades a un producto del inventario.
+        Args:
+            sku: SKU del producto
+            cantidad: Unidades a sumar
+        Returns:
+            str: Mensaje de confirmación
+        """
+        if not isinstance(cantidad, int) or cantidad < 1:
+            return "Error: La cantidad debe ser un entero mayor a 0"
+        if not self._inventario.reponer(sku, cantidad):
+            return f"Error: No existe un mueble con SKU {sku}"
+        self._registrar({"op": "reponer", "sku": sku, "cantidad": cantidad})
+        mueble = self._inventario.obtener(sku)
+        return (
+            f"Existencias de {getattr(mueble, 'nombre', str(mueble))}: "
+            f"{self._inventario.existencias(sku)} unidades"
+        )
+
+    def quitar_mueble(self, sku: int) -> str:
+        """
+        Quita un producto del inventario, con todas sus unidades, sin
+        registrar una venta.
+        Args:
+            sku: SKU del mueble
+        Returns:
+            str: Mensaje de confirmación
+        """
+        mueble = self._inventario.quitar_sku(sku)
+        if mueble is None:
+            return f"Error: No existe un mueble con SKU {sku}"
+        self._registrar({"op": "quitar", "sku": sku})
+        return f"Mueble {getattr(mueble, 'nombre', str(mueble))} retirado del inventario"
 
     def agregar_comedor(self, comedor: "Comedor") -> str:
         """
@@ -180,14 +567,30 @@ class TiendaMuebles:
         """
         if comedor is None:
             return "Error: El comedor no puede ser None"
-        self._comedores.append(comedor)
+        if self._bitacora is not None:
+            try:
+                registro = {
+                    "op": "comedor",
+                    **snapshot.registro_comedor(
+                        self,
+                        comedor,
+                        len(self._comedores),
+                        snapshot.piezas_vistas(self._comedores),
+                    ),
+                }
+            except ValueError as e:
+                return f"Error: {str(e)}"
+            self._registrar(registro)
+        self._incorporar_comedor(comedor)
+        self._version += 1
         return (
             f"Comedor {getattr(comedor, 'nombre', str(comedor))} agregado exitosamente"
         )
 
     def buscar_muebles_por_nombre(self, nombre: str) -> List["Mueble"]:
         """
-        Busca muebles por nombre (búsqueda parcial, case-insensitive).
+        Busca muebles por nombre (búsqueda parcial, sin distinguir mayúsculas
+        ni tildes).
         Args:
             nombre: Nombre o parte del nombre a buscar
         Returns:
@@ -195,12 +598,7 @@ class TiendaMuebles:
         """
         if not nombre or not nombre.strip():
             return []
-        nombre_lower = nombre.lower().strip()
-        resultados = []
-        for mueble in self._inventario:
-            if nombre_lower in mueble.nombre.lower():
-                resultados.append(mueble)
-        return resultados
+        return self._inventario.buscar_por_nombre(nombre)
 
     def filtrar_por_precio(
         self, precio_min: float = 0, precio_max: float = float("inf")
@@ -212,19 +610,31 @@ class TiendaMuebles:
             precio_min: Precio mínimo (inclusivo)
             precio_max: Precio máximo (inclusivo)
         Returns:
-            List[Mueble]: Lista de muebles en el rango de precios
+            List[Mueble]: Lista de muebles en el rango, de menor a mayor precio
         """
         if precio_min < 0:
             precio_min = 0
-        resultados = []
-        for mueble in self._inventario:
-            try:
-                precio = mueble.calcular_precio()
-                if precio_min <= precio <= precio_max:
-                    resultados.append(mueble)
-            except Exception:
-                continue  # Saltar muebles con errores de precio
-        return resultados
+        return self._inventario.filtrar_por_precio(precio_min, precio_max)
+
+    def iterar_por_precio(self, descendente: bool = False) -> Iterator["Mueble"]:
+        """
+        Recorre el inventario ordenado por precio usando el índice de precios.
+
+        Args:
+            descendente: True para ir del más costoso al más económico
+        Returns:
+            Iterator[Mueble]: Muebles en orden de precio
+        """
+        indice = self._inventario.indice_precios
+        return indice.descendente() if descendente else indice.ascendente()
+
+    def obtener_mas_economico(self) -> Optional["Mueble"]:
+        """Retorna el mueble de menor precio, o None si no hay inventario."""
+        return self._inventario.indice_precios.minimo()
+
+    def obtener_mas_costoso(self) -> Optional["Mueble"]:
+        """Retorna el mueble de mayor precio, o None si no hay inventario."""
+        return self._inventario.indice_precios.maximo()
 
     def filtrar_por_material(self, material: str) -> List["Mueble"]:
         """
@@ -237,131 +647,351 @@ class TiendaMuebles:
         """
         if not material or not material.strip():
             return []
-        material_lower = material.lower().strip()
-        resultados = []
-        for mueble in self._inventario:
-            try:
-                if (
-                    hasattr(mueble, "material")
-                    and mueble.material
-                    and mueble.material.lower().strip() == material_lower
-                ):
-                    resultados.append(mueble)
-            except Exception:
-                continue
-        return resultados
+        return self._inventario.filtrar_por_atributo("material", material)
+
+    def filtrar_por_color(self, color: str) -> List["Mueble"]:
+        """
+        Filtra muebles por color.
+
+        Args:
+            color: Color a buscar
+        Returns:
+            List[Mueble]: Lista de muebles del color especificado
+        """
+        if not color or not color.strip():
+            return []
+        return self._inventario.filtrar_por_atributo("color", color)
+
+    def filtrar_por_tapizado(self, material_tapizado: str) -> List["Mueble"]:
+        """
+        Filtra asientos por material de tapizado.
+
+        Args:
+            material_tapizado: Material de tapizado a buscar (ej: "cuero")
+        Returns:
+            List[Mueble]: Lista de muebles con ese tapizado
+        """
+        if not material_tapizado or not material_tapizado.strip():
+            return []
+        return self._inventario.filtrar_por_atributo(
+            "material_tapizado", material_tapizado
+        )
+
+    def estadisticas_indices(self) -> Dict[str, dict]:
+        """
+        Retorna el tamaño de los cubos y la memoria de los índices de atributos.
+
+        Returns:
+            Dict[str, dict]: Estadísticas por atributo indexado
+        """
+        return self._inventario.estadisticas_indices()
 
     def obtener_muebles_por_tipo(self, tipo_clase: type) -> List["Mueble"]:
         """
-        Obtiene todos los muebles de un tipo específico.
+        Obtiene todos los muebles de un tipo específico, incluidas sus
+        subclases (ej: Asiento incluye sillas y sofás; Cama incluye sofá-camas).
 
         Args:
-            tipo_clase: Clase del tipo de mueble (ej: Silla, Mesa, etc.)
+            tipo_clase: Clase del tipo de mueble (ej: Silla, Mesa, Asiento, etc.)
 
         Returns:
             List[Mueble]: Lista de muebles del tipo especificado
         """
-        # TODO: Implementar filtro por tipo
-        # resultados = []
-        # for mueble in self._inventario:
-        #     if isinstance(mueble, tipo_clase):
-        #         resultados.append(mueble)
-        # return resultados
-        pass
+        if not isinstance(tipo_clase, type):
+            return []
+        return self._inventario.filtrar_por_tipo(tipo_clase)
 
     def calcular_valor_inventario(self) -> float:
         """
         Calcula el valor total del inventario.
 
         Returns:
-            float: Valor total de todos los muebles en inventario
+            float: Valor total de los muebles en inventario y de los comedores
         """
-        # TODO: Implementar cálculo de valor total
-        # valor_total = 0
-        # for mueble in self._inventario:
-        #     try:
-        #         valor_total += mueble.calcular_precio()
-        #     except Exception:
-        #         continue  # Saltar muebles con errores
-
-        # for comedor in self._comedores:
-        #     try:
-        #         valor_total += comedor.calcular_precio_total()
-        #     except Exception:
-        #         continue
-
-        # return round(valor_total, 2)
-        pass
+        valor_total = self._inventario.valor_total()
+        for comedor in self._comedores:
+            try:
+                valor_total += comedor.calcular_precio_total()
+            except Exception:
+                continue
+        return round(valor_total, 2)
 
-    def aplicar_descuento(self, categoria: str, porcentaje: float) -> str:
+    def aplicar_descuento(
+        self,
+        categoria: str,
+        porcentaje: float,
+        material: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+    ) -> str:
         """
-        Aplica un descuento a una categoría de muebles.
+        Aplica un descuento a una categoría de muebles y a todas sus
+        subclases (ej: "asientos" alcanza sillas, sofás y sofá-camas).
 
         Args:
-            categoria: Nombre de la categoría (ej: "sillas", "mesas")
+            categoria: Nombre de la categoría (ej: "sillas", "mesas", "asientos")
             porcentaje: Porcentaje de descuento (0-100)
+            material: Aplicar solo a muebles de este material
+            precio_min: Aplicar solo desde este precio (inclusivo)
+            precio_max: Aplicar solo hasta este precio (inclusivo)
         Returns:
             str: Mensaje de confirmación
         """
         if not 0 < porcentaje <= 100:
             return "Error: El porcentaje debe estar entre 1 y 100"
-        categoria_lower = categoria.lower().strip()
-        # Normalizar nombres de clase (Silla, Mesa, etc.)
-        # El sistema usa el nombre de la clase, por ejemplo 'Silla', 'Mesa', etc.
-        # Si el usuario ingresa 'sillas', 'mesas', etc., quitamos la 's' final si existe
-        if categoria_lower.endswith("s"):
-            categoria_lower = categoria_lower[:-1]
-        # Capitalizar para coincidir con el nombre de clase
-        categoria_clase = categoria_lower.capitalize()
-        self._descuentos_activos[categoria_clase] = porcentaje / 100
+        clase = resolver_categoria(categoria)
+        if clase is None:
+            return f"Error: Categoría desconocida '{categoria}'"
+        regla = ReglaDescuento(clase, porcentaje / 100, material, precio_min, precio_max)
+        self._descuentos.agregar_regla(regla)
+        self._version += 1
+        self._registrar({"op": "descuento", **regla.a_registro()})
+        return f"Descuento del {porcentaje}% aplicado a la categoría '{regla.etiqueta()}'"
+
+    def quitar_descuento(
+        self,
+        categoria: str,
+        material: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+    ) -> str:
+        """
+        Quita la regla de descuento con esa categoría y condiciones.
+        Returns:
+            str: Mensaje de confirmación
+        """
+        clase = resolver_categoria(categoria)
+        if clase is None:
+            return f"Error: Categoría desconocida '{categoria}'"
+        clave = ReglaDescuento(clase, 1, material, precio_min, precio_max).clave
+        if not self._descuentos.quitar_regla(clave):
+            return f"Error: No hay un descuento para '{categoria}'"
+        self._version += 1
+        self._registrar(
+            {
+                "op": "quitar_descuento",
+                "categoria": clase.__name__,
+                "material": clave[1],
+                "precio_min": precio_min,
+                "precio_max": precio_max,
+            }
+        )
+        return f"Descuento de la categoría '{clase.__name__}' retirado"
+
+    def establecer_politica_descuentos(self, politica: str) -> str:
+        """
+        Define cómo se combinan varias reglas que aplican a un mismo mueble:
+        "mas_especifico" (por defecto), "maximo" o "acumulativo".
+        Returns:
+            str: Mensaje de confirmación
+        """
+        try:
+            self._descuentos.politica = politica
+        except ValueError as e:
+            return f"Error: {str(e)}"
+        self._version += 1
+        self._registrar({"op": "politica_descuentos", "politica": politica})
+        return f"Política de descuentos: {politica}"
+
+    def precios_con_descuento(self, muebles: Iterable["Mueble"]) -> List[float]:
+        """
+        Calcula de una vez el precio con descuento de un conjunto de muebles
+        del inventario (ej: los resultados de una búsqueda).
+        Args:
+            muebles: Muebles del inventario
+        Returns:
+            List[float]: Precio final de cada mueble, en el mismo orden
+        """
+        muebles = list(muebles)
+        return self._descuentos.aplicar(
+            muebles, [self._inventario.precio(mueble) for mueble in muebles]
+        )
+
+    def simular_escenarios(
+        self, escenarios: List[Escenario], procesos: Optional[int] = None
+    ) -> Dict:
+        """
+        Evalúa escenarios de descuentos y precios base sobre una copia
+        congelada del inventario, sin modificar la tienda.
+        Args:
+            escenarios: Escenarios a evaluar (ver services.simulador.Escenario)
+            procesos: Procesos del pool (None usa uno por CPU)
+        Returns:
+            Dict: Valor vigente y resultado de cada escenario, o {"error": ...}
+        """
+        try:
+            with Simulador(self, procesos) as simulador:
+                return {
+                    "vigente": simulador.valor_vigente(),
+                    "escenarios": simulador.evaluar(escenarios),
+                }
+        except (OSError, ValueError) as e:
+            return {"error": str(e)}
+
+    def _resolver_mueble(self, mueble: Union["Mueble", int]) -> Optional["Mueble"]:
+        """
+        Convierte un SKU o un mueble en un mueble del inventario.
+        Método privado auxiliar.
+
+        Returns:
+            Optional[Mueble]: El mueble, o None si no está en inventario
+        """
+        if isinstance(mueble, int):
+            return self._inventario.obtener(mueble)
+        if mueble is None or mueble not in self._inventario:
+            return None
+        return mueble
+
+    def _preparar_venta(self, mueble: "Mueble", cliente: str, marca: int) -> FilaVenta:
+        """
+        Calcula precio y descuento de una venta sin modificar la tienda.
+        Método privado auxiliar.
+
+        Returns:
+            FilaVenta: Fila de la venta lista para confirmarse
+        """
+        precio_original = self._inventario.precio(mueble)
+        # El nombre de la clase es la clave con que se registran los descuentos
+        tipo_mueble = type(mueble).__name__
+        descuento_aplicado = self._descuentos.descuento(mueble, precio_original)
+        precio_final = precio_original * (1 - descuento_aplicado)
+        # Ensure mueble.nombre is always a string
+        nombre_mueble = getattr(mueble, "nombre", None)
+        if not nombre_mueble:
+            nombre_mueble = tipo_mueble
         return (
-            f"Descuento del {porcentaje}% aplicado a la categoría '{categoria_clase}'"
+            nombre_mueble,
+            cliente,
+            precio_original,
+            descuento_aplicado,
+            round(precio_final, 2),
+            marca,
+            tipo_mueble,
         )
 
+    def _registrar_ventas(self, muebles: List["Mueble"], filas: List[FilaVenta]) -> None:
+        """
+        Escribe las ventas en la bitácora antes de confirmarlas.
+        Método privado auxiliar.
+        """
+        if self._bitacora is not None:
+            skus = [self._inventario.sku_de(mueble) for mueble in muebles]
+            self._registrar({"op": "venta", "skus": skus, "ventas": filas})
+
+    def _confirmar_ventas(self, muebles: List["Mueble"], filas: List[FilaVenta]) -> None:
+        """
+        Registra las ventas, descuenta una unidad por venta y actualiza los
+        acumulativos; un producto sale del inventario al agotarse.
+        Solo recibe ventas ya validadas, por lo que no puede fallar a medias.
+        Método privado auxiliar.
+        """
+        for fila in filas:
+            self._ventas_realizadas.agregar(fila)
+        for mueble in muebles:
+            self._inventario.retirar(self._inventario.sku_de(mueble))
+        self._version += 1
+        # Acumulativos
+        self._total_muebles_vendidos += len(filas)
+        self._valor_total_ventas += sum(fila[4] for fila in filas)
+
     def realizar_venta(
-        self, mueble: "Mueble", cliente: str = "Cliente Anónimo"
+        self, mueble: Union["Mueble", int], cliente: str = "Cliente Anónimo"
     ) -> Dict:
         """
-        Procesa la venta de un mueble.
+        Procesa la venta de una unidad de un mueble en O(1).
         Args:
-            mueble: Mueble a vender
+            mueble: Mueble a vender, o su SKU
             cliente: Nombre del cliente
         Returns:
             Dict: Información de la venta realizada o error
         """
-        if mueble not in self._inventario:
+        mueble = self._resolver_mueble(mueble)
+        if mueble is None:
             return {"error": "El mueble no está disponible en inventario"}
         try:
-            precio_original = mueble.calcular_precio()
-            descuento_aplicado = 0
-            # Use the class name as key, matching how discounts are registered
-            tipo_mueble = type(mueble).__name__
-            if self._descuentos_activos and tipo_mueble in self._descuentos_activos:
-                descuento_aplicado = self._descuentos_activos[tipo_mueble]
-            precio_final = precio_original * (1 - descuento_aplicado)
-            from datetime import datetime
-
-            # Ensure mueble.nombre is always a string
-            nombre_mueble = getattr(mueble, "nombre", None)
-            if not nombre_mueble:
-                nombre_mueble = tipo_mueble
-            venta = {
-                "mueble": nombre_mueble,
-                "cliente": cliente,
-                "precio_original": precio_original,
-                "descuento": descuento_aplicado * 100,
-                "precio_final": round(precio_final, 2),
-                "fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            }
-            self._ventas_realizadas.append(venta)
-            self._inventario.remove(mueble)
-            # Acumulativos
-            self._total_muebles_vendidos += 1
-            self._valor_total_ventas += venta["precio_final"]
-            return venta
+            fila = self._preparar_venta(mueble, cliente, time.time_ns())
+            self._registrar_ventas([mueble], [fila])
+            self._confirmar_ventas([mueble], [fila])
+            return self._ventas_realizadas[-1]
         except Exception as e:
             return {"error": f"Error al procesar la venta: {str(e)}"}
 
+    def realizar_ventas_lote(
+        self, items: Iterable[Union["Mueble", int]], cliente: str = "Cliente Anónimo"
+    ) -> Dict:
+        """
+        Procesa varias ventas con semántica todo o nada.
+
+        Primero valida la disponibilidad, calcula precios y aplica descuentos de
+        todos los items en una sola pasada, sin modificar la tienda. Solo si
+        todos son válidos registra las ventas y actualiza los acumulativos de una
+        vez; si alguno falla, no se vende ninguno.
+
+        Args:
+            items: Muebles o SKUs a vender, uno por unidad (un SKU puede
+                repetirse mientras alcancen sus existencias)
+            cliente: Nombre del cliente
+        Returns:
+            Dict: {"ventas", "cantidad", "valor_total"} o {"error"}
+        """
+        marca = time.time_ns()
+        muebles = []
+        filas = []
+        pedidas: Dict[int, int] = {}
+        try:
+            for item in items:
+                mueble = self._resolver_mueble(item)
+                if mueble is None:
+                    return {
+                        "error": f"Lote cancelado: el mueble {item} no está disponible en inventario"
+                    }
+                sku = self._inventario.sku_de(mueble)
+                pedidas[sku] = pedidas.get(sku, 0) + 1
+                if pedidas[sku] > self._inventario.existencias(sku):
+                    return {
+                        "error": f"Lote cancelado: no hay suficientes unidades de {getattr(mueble, 'nombre', item)}"
+                    }
+                muebles.append(mueble)
+                filas.append(self._preparar_venta(mueble, cliente, marca))
+            self._registrar_ventas(muebles, filas)
+        except Exception as e:
+            return {"error": f"Lote cancelado: error al procesar la venta: {str(e)}"}
+        inicio = len(self._ventas_realizadas)
+        self._confirmar_ventas(muebles, filas)
+        return {
+            "ventas": self._ventas_realizadas[inicio:],
+            "cantidad": len(filas),
+            "valor_total": round(sum(fila[4] for fila in filas), 2),
+        }
+
+    def resumen_ventas(
+        self, desde: datetime, hasta: Optional[datetime] = None
+    ) -> Dict:
+        """
+        Totaliza las ventas de un rango de fechas usando los resúmenes por
+        hora y por día del libro de ventas.
+
+        Args:
+            desde: Inicio del rango (inclusivo)
+            hasta: Fin del rango (exclusivo); por defecto, ahora
+        Returns:
+            Dict: ventas, bruto, descuentos, neto y desglose por_tipo
+        """
+        fin = time.time_ns() + 1 if hasta is None else int(hasta.timestamp() * 1e9)
+        return self._ventas_realizadas.resumen(int(desde.timestamp() * 1e9), fin)
+
+    def resumen_ventas_recientes(self, horas: float) -> Dict:
+        """
+        Totaliza las ventas de las últimas horas (ej: 24 o 24 * 30).
+
+        Args:
+            horas: Tamaño de la ventana hacia atrás desde ahora
+        Returns:
+            Dict: ventas, bruto, descuentos, neto y desglose por_tipo
+        """
+        fin = time.time_ns() + 1
+        return self._ventas_realizadas.resumen(fin - int(horas * NS_HORA), fin)
+
     def _contar_tipos_muebles(self) -> Dict[str, int]:
         """
         Cuenta cuántos muebles hay de cada tipo.
@@ -370,35 +1000,150 @@ class TiendaMuebles:
         Returns:
             Dict[str, int]: Diccionario con el conteo por tipo
         """
-        # TODO: Implementar conteo por tipos
-        # conteo = {}
-        # for mueble in self._inventario:
-        #     tipo = type(mueble).__name__
-        #     conteo[tipo] = conteo.get(tipo, 0) + 1
-        # return conteo
-        pass
+        return self._inventario.conteo_por_tipo()
 
-    def generar_reporte_inventario(self) -> str:
+    def instantanea_reporte(self, detallado: bool = False) -> Dict:
         """
-        Genera un reporte completo del inventario.
+        Copia los datos que usa el reporte de inventario en este momento.
+        La tienda no es segura entre hilos: quien genere el reporte en otro
+        hilo debe tomar la instantánea en el hilo que modifica la tienda y
+        pasarla a iterar_reporte_inventario o escribir_reporte_inventario.
+
+        Args:
+            detallado: True para copiar también una fila por mueble
         Returns:
-            str: Reporte detallado del inventario
+            Dict: nombre, estadisticas y filas (sku, tipo, nombre, precio, existencias)
+        """
+        filas = ()
+        if detallado:
+            filas = tuple(
+                (
+                    sku,
+                    type(mueble).__name__,
+                    getattr(mueble, "nombre", None) or type(mueble).__name__,
+                    precio,
+                    existencias,
+                )
+                for sku, mueble, precio, existencias in self._inventario.entradas()
+            )
+        return {
+            "nombre": getattr(self, "_nombre", "Tienda"),
+            "estadisticas": self.obtener_estadisticas(),
+            "filas": filas,
+        }
+
+    def iterar_reporte_inventario(
+        self, detallado: bool = False, instantanea: Optional[Dict] = None
+    ) -> Iterator[str]:
+        """
+        Genera el reporte de inventario línea por línea.
+        Las secciones de resumen salen de los agregados de la tienda y el
+        detalle por mueble recorre las columnas del inventario una sola vez,
+        por lo que la memoria no depende del tamaño del inventario.
+
+        Args:
+            detallado: True para incluir una línea por mueble
+            instantanea: Datos de instantanea_reporte; si se indica, el
+                reporte sale de ellos y no lee la tienda
+        Returns:
+            Iterator[str]: Líneas del reporte, cada una terminada en salto de línea
         """
-        estadisticas = self.obtener_estadisticas() or {}
-        nombre_tienda = getattr(self, "_nombre", "Tienda")
+        if instantanea is not None:
+            estadisticas = instantanea["estadisticas"]
+            nombre_tienda = instantanea["nombre"]
+            filas = instantanea["filas"]
+        else:
+            estadisticas = self.obtener_estadisticas() or {}
+            nombre_tienda = getattr(self, "_nombre", "Tienda")
+            filas = (
+                (sku, type(mueble).__name__, getattr(mueble, "nombre", None), precio, n)
+                for sku, mueble, precio, n in self._inventario.entradas()
+            )
         if not isinstance(estadisticas, dict):
             estadisticas = {}
-        reporte = f"=== REPORTE DE INVENTARIO - {nombre_tienda} ===\n\n"
-        reporte += f"Total de muebles: {estadisticas.get('total_muebles', 0)}\n"
-        reporte += f"Total de comedores: {estadisticas.get('total_comedores', 0)}\n"
-        reporte += f"Valor total del inventario: ${estadisticas.get('valor_inventario', 0):.2f}\n\n"
-        reporte += "DISTRIBUCIÓN POR TIPOS:\n"
+        yield f"=== REPORTE DE INVENTARIO - {nombre_tienda} ===\n"
+        yield "\n"
+        yield f"Total de muebles: {estadisticas.get('total_muebles', 0)}\n"
+        yield f"Total de productos (SKU): {estadisticas.get('total_productos', 0)}\n"
+        yield f"Total de comedores: {estadisticas.get('total_comedores', 0)}\n"
+        yield f"Valor total del inventario: ${estadisticas.get('valor_inventario', 0):.2f}\n"
+        yield f"Valor con descuentos: ${estadisticas.get('valor_inventario_con_descuentos', 0):.2f}\n"
+        yield "\n"
+        yield "DISTRIBUCIÓN POR TIPOS:\n"
         tipos = estadisticas.get("tipos_muebles", {}) or {}
         for tipo, cantidad in tipos.items():
-            reporte += f"- {tipo}: {cantidad} unidades\n"
+            yield f"- {tipo}: {cantidad} unidades\n"
         descuentos = estadisticas.get("descuentos_activos", {}) or {}
         if descuentos:
-            reporte += "\nDESCUENTOS ACTIVOS:\n"
+            yield "\nDESCUENTOS ACTIVOS:\n"
             for categoria, descuento in descuentos.items():
-                reporte += f"- {categoria}: {descuento * 100:.1f}%\n"
-        return reporte
+                yield f"- {categoria}: {descuento * 100:.1f}%\n"
+        if detallado:
+            yield "\nDETALLE POR MUEBLE:\n"
+            for sku, tipo, nombre, precio, existencias in filas:
+                nombre = nombre or tipo
+                unidades = f" x {existencias}" if existencias > 1 else ""
+                yield f"- [{sku}] {tipo}: {nombre} - ${precio:.2f}{unidades}\n"
+
+    def escribir_reporte_inventario(
+        self,
+        destino: TextIO,
+        detallado: bool = False,
+        lineas_por_bloque: int = 1000,
+        progreso: Optional[Callable[[int, int], None]] = None,
+        instantanea: Optional[Dict] = None,
+    ) -> int:
+        """
+        Escribe el reporte de inventario en un archivo o flujo de texto por
+        bloques de líneas, sin armar el reporte completo en memoria.
+
+        Args:
+            destino: Archivo o flujo abierto en modo texto (ej: sys.stdout)
+            detallado: True para incluir una línea por mueble
+            lineas_por_bloque: Líneas que se acumulan antes de cada escritura
+            progreso: Función opcional llamada tras cada bloque con las líneas
+                escritas y el total estimado; puede lanzar una excepción para
+                interrumpir la escritura
+            instantanea: Datos de instantanea_reporte; obligatoria si se
+                escribe desde otro hilo
+        Returns:
+            int: Número de líneas escritas
+        """
+        if instantanea is not None:
+            estadisticas = instantanea["estadisticas"]
+            tipos = len(estadisticas.get("tipos_muebles", {}))
+            descuentos = len(estadisticas.get("descuentos_activos", {}))
+            filas = len(instantanea["filas"])
+        else:
+            tipos = len(self._inventario.conteo_por_tipo())
+            descuentos = len(self._descuentos.reglas())
+            filas = len(self._inventario)
+        estimado = (
+            9
+            + tipos
+            + (descuentos + 1 if descuentos else 0)
+            + (filas + 1 if detallado else 0)
+        )
+        lineas = self.iterar_reporte_inventario(detallado, instantanea)
+        total = 0
+        while True:
+            bloque = list(islice(lineas, lineas_por_bloque))
+            if not bloque:
+                break
+            destino.write("".join(bloque))
+            total += len(bloque)
+            if progreso is not None:
+                progreso(total, max(estimado, total))
+        return total
+
+    def generar_reporte_inventario(self, detallado: bool = False) -> str:
+        """
+        Genera un reporte completo del inventario.
+        Para inventarios grandes conviene escribir_reporte_inventario.
+
+        Args:
+            detallado: True para incluir una línea por mueble
+        Returns:
+            str: Reporte detallado del inventario
+        """
+        return "".join(self.iterar_reporte_inventario(detallado))
@@ -0,0 +1,343 @@
+"""
+Libro de ventas compacto.
+Guarda cada venta como una fila en arreglos tipados (estructura de arreglos)
+en lugar de un diccionario con cadenas por venta: la fecha es una marca de
+tiempo en nanosegundos, el mueble y el cliente son códigos internados y los
+precios se guardan en centavos enteros. Las vistas como diccionario o texto
+se construyen solo al consultarlas.
+
+Al registrar cada venta se actualizan también resúmenes por hora y por día,
+de modo que los totales de un rango de fechas se obtienen combinando cubos en
+lugar de recorrer todas las ventas.
+"""
+
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from models.vocabulario import Vocabulario
+
+# Fila de una venta antes de guardarse:
+# (mueble, cliente, precio_original, descuento, precio_final, marca_ns, tipo)
+FilaVenta = Tuple[str, str, float, float, float, int, str]
+
+NS_HORA = 3600 * 10**9
+NS_DIA = 24 * NS_HORA
+
+# Índices de los campos de un cubo de resumen
+_CONTEO, _BRUTO, _DESCUENTO, _POR_TIPO = range(4)
+
+
+def _a_centavos(valor: float) -> int:
+    """Convierte un monto a centavos enteros."""
+    return int(round(valor * 100))
+
+
+def formatear_fecha(marca_ns: int) -> str:
+    """Formatea una marca de tiempo en nanosegundos como en los reportes."""
+    return datetime.fromtimestamp(marca_ns / 1e9).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _acumular(cubo: list, tipo: int, original: int, final: int) -> None:
+    """Suma una venta (en centavos) a un cubo de resumen."""
+    cubo[_CONTEO] += 1
+    cubo[_BRUTO] += original
+    cubo[_DESCUENTO] += original - final
+    por_tipo = cubo[_POR_TIPO].get(tipo)
+    if por_tipo is None:
+        cubo[_POR_TIPO][tipo] = [1, original, original - final]
+    else:
+        por_tipo[0] += 1
+        por_tipo[1] += original
+        por_tipo[2] += original - final
+
+
+def _combinar(destino: list, cubo: list) -> None:
+    """Suma un cubo de resumen a otro."""
+    destino[_CONTEO] += cubo[_CONTEO]
+    destino[_BRUTO] += cubo[_BRUTO]
+    destino[_DESCUENTO] += cubo[_DESCUENTO]
+    for tipo, (conteo, bruto, descuento) in cubo[_POR_TIPO].items():
+        por_tipo = destino[_POR_TIPO].setdefault(tipo, [0, 0, 0])
+        por_tipo[0] += conteo
+        por_tipo[1] += bruto
+        por_tipo[2] += descuento
+
+
+def _cubo_vacio() -> list:
+    return [0, 0, 0, {}]
+
+
+class LibroVentas:
+    """
+    Registro de ventas en columnas tipadas.
+
+    Cada venta ocupa 44 bytes en arreglos (marca de tiempo, códigos de
+    mueble, cliente y tipo, precio original y final en centavos, descuento)
+    más, una sola vez, el texto de cada nombre, cliente o tipo distinto.
+    Indexar el libro retorna la venta con la misma forma de diccionario que
+    retorna realizar_venta.
+
+    Las marcas de tiempo son no decrecientes (si el reloj retrocede, la venta
+    toma la marca de la anterior), lo que permite ubicar un instante con
+    búsqueda binaria. Los cubos por hora y por día se alinean a UTC.
+    """
+
+    # Nombre y código de tipo de cada columna, en orden
+    COLUMNAS = (
+        ("marcas", "q"),
+        ("muebles", "i"),
+        ("clientes", "i"),
+        ("originales", "q"),
+        ("descuentos", "d"),
+        ("finales", "q"),
+        ("tipos", "i"),
+    )
+
+    def __init__(self):
+        """Crea un libro vacío."""
+        self._muebles = Vocabulario("mueble", ())
+        self._clientes = Vocabulario("cliente", ())
+        self._tipos = Vocabulario("tipo", ())
+        self._columnas: Dict[str, array] = {
+            nombre: array(tipo) for nombre, tipo in self.COLUMNAS
+        }
+        self._total_centavos = 0
+        self._por_hora: Dict[int, list] = {}
+        self._por_dia: Dict[int, list] = {}
+
+    def agregar(self, fila: FilaVenta) -> None:
+        """
+        Agrega una venta al final del libro y a los resúmenes por hora y día.
+
+        Args:
+            fila: (mueble, cliente, precio_original, descuento, precio_final,
+                marca_ns, tipo), con el descuento como fracción (0.1 = 10%)
+        """
+        mueble, cliente, original, descuento, final, marca, tipo = fila
+        columnas = self._columnas
+        marcas = columnas["marcas"]
+        if marcas and marca < marcas[-1]:
+            marca = marcas[-1]
+        marcas.append(marca)
+        columnas["muebles"].append(self._muebles.codificar(mueble))
+        columnas["clientes"].append(self._clientes.codificar(cliente))
+        original_centavos = _a_centavos(original)
+        columnas["originales"].append(original_centavos)
+        columnas["descuentos"].append(descuento)
+        final_centavos = _a_centavos(final)
+        columnas["finales"].append(final_centavos)
+        codigo_tipo = self._tipos.codificar(tipo)
+        columnas["tipos"].append(codigo_tipo)
+        self._total_centavos += final_centavos
+        self._acumular_resumenes(marca, codigo_tipo, original_centavos, final_centavos)
+
+    def _acumular_resumenes(
+        self, marca: int, tipo: int, original: int, final: int
+    ) -> None:
+        """Suma una venta a sus cubos por hora y por día."""
+        hora = self._por_hora.get(marca // NS_HORA)
+        if hora is None:
+            hora = self._por_hora[marca // NS_HORA] = _cubo_vacio()
+        _acumular(hora, tipo, original, final)
+        dia = self._por_dia.get(marca // NS_DIA)
+        if dia is None:
+            dia = self._por_dia[marca // NS_DIA] = _cubo_vacio()
+        _acumular(dia, tipo, original, final)
+
+    def agregar_venta(self, venta: Dict) -> None:
+        """
+        Agrega una venta en la forma de diccionario de realizar_venta
+        (usada al leer snapshots de la versión 1).
+        """
+        marca = int(
+            datetime.strptime(venta["fecha"], "%Y-%m-%d %H:%M:%S").timestamp() * 1e9
+        )
+        self.agregar(
+            (
+                venta["mueble"],
+                venta["cliente"],
+                venta["precio_original"],
+                venta["descuento"] / 100,
+                venta["precio_final"],
+                marca,
+                "",
+            )
+        )
+
+    def fila(self, indice: int) -> FilaVenta:
+        """Retorna la venta en la forma de tupla con que se agregó."""
+        columnas = self._columnas
+        return (
+            self._muebles.valor(columnas["muebles"][indice]),
+            self._clientes.valor(columnas["clientes"][indice]),
+            columnas["originales"][indice] / 100,
+            columnas["descuentos"][indice],
+            columnas["finales"][indice] / 100,
+            columnas["marcas"][indice],
+            self._tipos.valor(columnas["tipos"][indice]),
+        )
+
+    def venta(self, indice: int) -> Dict:
+        """
+        Construye la vista como diccionario de una venta.
+
+        Args:
+            indice: Posición de la venta (admite índices negativos)
+        Returns:
+            Dict: mueble, cliente, precio_original, descuento (%), precio_final
+            y fecha formateada
+        """
+        mueble, cliente, original, descuento, final, marca, _ = self.fila(indice)
+        return {
+            "mueble": mueble,
+            "cliente": cliente,
+            "precio_original": original,
+            "descuento": descuento * 100,
+            "precio_final": final,
+            "fecha": formatear_fecha(marca),
+        }
+
+    def linea(self, indice: int) -> str:
+        """Retorna una venta formateada como una línea de texto."""
+        venta = self.venta(indice)
+        return (
+            f"{venta['fecha']} {venta['mueble']} - {venta['cliente']}: "
+            f"${venta['precio_final']:.2f} (descuento {venta['descuento']:.1f}%)"
+        )
+
+    def valor_total(self) -> float:
+        """Retorna la suma de los precios finales de todas las ventas."""
+        return self._total_centavos / 100
+
+    def _sumar_filas(self, resultado: list, inicio: int, fin: int) -> None:
+        """Suma al resultado las ventas con marca en [inicio, fin)."""
+        if inicio >= fin:
+            return
+        columnas = self._columnas
+        marcas = columnas["marcas"]
+        originales = columnas["originales"]
+        finales = columnas["finales"]
+        tipos = columnas["tipos"]
+        for i in range(bisect_left(marcas, inicio), bisect_left(marcas, fin)):
+            _acumular(resultado, tipos[i], originales[i], finales[i])
+
+    def _sumar_horas(self, resultado: list, inicio: int, fin: int) -> None:
+        """Suma [inicio, fin) con cubos por hora completos y filas en los bordes."""
+        primera = -(-inicio // NS_HORA)
+        ultima = fin // NS_HORA
+        if primera >= ultima:
+            self._sumar_filas(resultado, inicio, fin)
+            return
+        self._sumar_filas(resultado, inicio, primera * NS_HORA)
+        for hora in range(primera, ultima):
+            cubo = self._por_hora.get(hora)
+            if cubo is not None:
+                _combinar(resultado, cubo)
+        self._sumar_filas(resultado, ultima * NS_HORA, fin)
+
+    def resumen(self, inicio: int, fin: int) -> Dict:
+        """
+        Totaliza las ventas con marca de tiempo en [inicio, fin).
+        Usa los cubos por día completos del rango, cubos por hora en los días
+        de los bordes y solo recorre ventas en las horas parciales de los
+        extremos, por lo que el costo depende del número de cubos y no del
+        número de ventas.
+
+        Args:
+            inicio: Marca inicial en nanosegundos desde la época (inclusiva)
+            fin: Marca final en nanosegundos desde la época (exclusiva)
+        Returns:
+            Dict: ventas, bruto, descuentos, neto y desglose por_tipo
+        """
+        resultado = _cubo_vacio()
+        marcas = self._columnas["marcas"]
+        if marcas:
+            # Fuera de las marcas existentes no hay cubos que recorrer
+            inicio = max(inicio, marcas[0])
+            fin = min(fin, marcas[-1] + 1)
+        if marcas and inicio < fin:
+            primero = -(-inicio // NS_DIA)
+            ultimo = fin // NS_DIA
+            if primero >= ultimo:
+                self._sumar_horas(resultado, inicio, fin)
+            else:
+                self._sumar_horas(resultado, inicio, primero * NS_DIA)
+                for dia in range(primero, ultimo):
+                    cubo = self._por_dia.get(dia)
+                    if cubo is not None:
+                        _combinar(resultado, cubo)
+                self._sumar_horas(resultado, ultimo * NS_DIA, fin)
+        conteo, bruto, descuento, por_tipo = resultado
+        return {
+            "ventas": conteo,
+            "bruto": bruto / 100,
+            "descuentos": descuento / 100,
+            "neto": (bruto - descuento) / 100,
+            "por_tipo": {
+                self._tipos.valor(tipo) or "Desconocido": {
+                    "ventas": t_conteo,
+                    "bruto": t_bruto / 100,
+                    "descuentos": t_descuento / 100,
+                    "neto": (t_bruto - t_descuento) / 100,
+                }
+                for tipo, (t_conteo, t_bruto, t_descuento) in por_tipo.items()
+            },
+        }
+
+    def columnas(self) -> Dict[str, array]:
+        """Retorna los arreglos del libro (sin copiarlos)."""
+        return self._columnas
+
+    def vocabularios(self) -> Tuple[List[str], List[str], List[str]]:
+        """Retorna los textos internados de muebles, clientes y tipos."""
+        return self._muebles.textos(), self._clientes.textos(), self._tipos.textos()
+
+    @classmethod
+    def desde_columnas(
+        cls,
+        muebles: List[str],
+        clientes: List[str],
+        columnas: Dict,
+        tipos: Optional[List[str]] = None,
+    ) -> "LibroVentas":
+        """
+        Reconstruye un libro a partir de sus vocabularios y columnas, y
+        recalcula los resúmenes por hora y día.
+
+        Args:
+            muebles: Textos internados de muebles, en orden de código
+            clientes: Textos internados de clientes, en orden de código
+            columnas: Secuencias por nombre de columna (se copian); si falta
+                la columna de tipos, las ventas quedan con tipo desconocido
+            tipos: Textos internados de tipos, en orden de código
+        """
+        libro = cls()
+        libro._muebles = Vocabulario("mueble", muebles)
+        libro._clientes = Vocabulario("cliente", clientes)
+        libro._tipos = Vocabulario("tipo", tipos or [""])
+        cantidad = len(columnas["marcas"])
+        for nombre, tipo in cls.COLUMNAS:
+            datos = columnas.get(nombre)
+            if datos is None:
+                datos = [0] * cantidad
+            libro._columnas[nombre] = array(tipo, datos)
+        libro._total_centavos = sum(libro._columnas["finales"])
+        for marca, tipo, original, final in zip(
+            *(libro._columnas[c] for c in ("marcas", "tipos", "originales", "finales"))
+        ):
+            libro._acumular_resumenes(marca, tipo, original, final)
+        return libro
+
+    def __len__(self) -> int:
+        return len(self._columnas["marcas"])
+
+    def __getitem__(self, indice: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if isinstance(indice, slice):
+            return [self.venta(i) for i in range(*indice.indices(len(self)))]
+        return self.venta(indice)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for indice in range(len(self)):
+            yield self.venta(indice)
@@ -0,0 +1,335 @@
+"""
+Bitácora de escritura anticipada (write-ahead log) de la tienda.
+
+Cada operación que modifica la tienda (altas, reposiciones, ventas,
+descuentos, bajas, comedores y cambios hechos con los setters de un mueble)
+se agrega como un registro a un segmento de
+solo anexado. Para no limitar el rendimiento con un fsync por operación,
+los registros se sincronizan en grupo: cada N registros o cada T
+milisegundos, lo que ocurra primero.
+
+Estructura del directorio:
+    snapshot-000007.bin   estado con todos los segmentos anteriores al 7
+    wal-000007.log        segmentos de registros, en orden
+    wal-000008.log
+
+Cada registro es: longitud (u32), CRC32 (u32) y el JSON UTF-8 del registro.
+Un registro incompleto o con CRC inválido al final de un segmento (una
+escritura cortada por una caída) se descarta al recuperar.
+"""
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from services import snapshot
+from services.catalogo import crear_mueble
+from services.descuentos import regla_desde_registro
+from services.precios import cotizar
+
+_ENCABEZADO = struct.Struct("<II")
+_PREFIJO_SEGMENTO = "wal-"
+_SUFIJO_SEGMENTO = ".log"
+_PREFIJO_SNAPSHOT = "snapshot-"
+_SUFIJO_SNAPSHOT = ".bin"
+
+
+def _numero(nombre: str, prefijo: str, sufijo: str) -> Optional[int]:
+    """Extrae el número de un nombre de segmento o snapshot."""
+    if nombre.startswith(prefijo) and nombre.endswith(sufijo):
+        numero = nombre[len(prefijo) : -len(sufijo)]
+        if numero.isdigit():
+            return int(numero)
+    return None
+
+
+class Bitacora:
+    """
+    Bitácora de escritura anticipada con commit en grupo.
+
+    Los registros se escriben en el archivo del segmento activo de inmediato
+    y se sincronizan a disco (fsync) cuando se acumulan fsync_cada registros
+    o pasan fsync_ms milisegundos desde el primero pendiente. Con
+    fsync_cada=1 cada operación es durable antes de retornar.
+    """
+
+    def __init__(
+        self,
+        directorio: str,
+        fsync_cada: int = 64,
+        fsync_ms: float = 50,
+        tam_segmento: int = 16 * 1024 * 1024,
+    ):
+        """
+        Abre (o crea) una bitácora en un directorio. Los registros nuevos van
+        a un segmento nuevo, salvo que el último segmento exista y esté vacío.
+
+        Args:
+            directorio: Directorio de segmentos y snapshots
+            fsync_cada: Registros pendientes que disparan un fsync
+            fsync_ms: Milisegundos máximos que un registro espera su fsync;
+                0 desactiva el hilo de sincronización periódica
+            tam_segmento: Bytes a partir de los cuales se abre un segmento nuevo
+        """
+        if fsync_cada < 1:
+            raise ValueError("fsync_cada debe ser al menos 1")
+        if fsync_ms < 0:
+            raise ValueError("fsync_ms no puede ser negativo")
+        os.makedirs(directorio, exist_ok=True)
+        self._directorio = directorio
+        self._fsync_cada = fsync_cada
+        self._fsync_ms = fsync_ms
+        self._tam_segmento = tam_segmento
+        self._candado = threading.Lock()
+        self._pendientes = 0
+        self._primer_pendiente = 0.0
+        self._archivo = None
+        segmentos = self.segmentos()
+        self._segmento = max(segmentos + [self.ultimo_snapshot()[0] or 0])
+        ruta = self._ruta_segmento(self._segmento)
+        if segmentos and segmentos[-1] == self._segmento and not os.path.getsize(ruta):
+            self._archivo = open(ruta, "ab")
+        else:
+            self._rotar()
+        self._cerrada = threading.Event()
+        self._hilo = None
+        if fsync_ms > 0:
+            self._hilo = threading.Thread(
+                target=self._sincronizar_periodicamente, daemon=True
+            )
+            self._hilo.start()
+
+    @property
+    def directorio(self) -> str:
+        """Getter para el directorio de la bitácora."""
+        return self._directorio
+
+    @property
+    def segmento_activo(self) -> int:
+        """Número del segmento donde se escriben los registros nuevos."""
+        return self._segmento
+
+    def _ruta_segmento(self, numero: int) -> str:
+        return os.path.join(
+            self._directorio, f"{_PREFIJO_SEGMENTO}{numero:06d}{_SUFIJO_SEGMENTO}"
+        )
+
+    def _ruta_snapshot(self, numero: int) -> str:
+        return os.path.join(
+            self._directorio, f"{_PREFIJO_SNAPSHOT}{numero:06d}{_SUFIJO_SNAPSHOT}"
+        )
+
+    def segmentos(self) -> List[int]:
+        """Retorna los números de los segmentos existentes, en orden."""
+        return sorted(
+            numero
+            for numero in (
+                _numero(nombre, _PREFIJO_SEGMENTO, _SUFIJO_SEGMENTO)
+                for nombre in os.listdir(self._directorio)
+            )
+            if numero is not None
+        )
+
+    def ultimo_snapshot(self) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Retorna el número y la ruta del snapshot más reciente.
+        Un snapshot con número N contiene el efecto de todos los segmentos
+        anteriores a N.
+
+        Returns:
+            Tuple: (número, ruta), o (None, None) si no hay snapshots
+        """
+        numeros = [
+            numero
+            for numero in (
+                _numero(nombre, _PREFIJO_SNAPSHOT, _SUFIJO_SNAPSHOT)
+                for nombre in os.listdir(self._directorio)
+            )
+            if numero is not None
+        ]
+        if not numeros:
+            return None, None
+        numero = max(numeros)
+        return numero, self._ruta_snapshot(numero)
+
+    def _rotar(self) -> None:
+        """Sincroniza y cierra el segmento activo y abre el siguiente."""
+        if self._archivo is not None:
+            self._sincronizar()
+            self._archivo.close()
+        self._segmento += 1
+        self._archivo = open(self._ruta_segmento(self._segmento), "ab")
+
+    def registrar(self, registro: Dict) -> None:
+        """
+        Agrega un registro al segmento activo.
+        El registro queda escrito de inmediato y se sincroniza a disco según
+        la política de commit en grupo.
+
+        Args:
+            registro: Diccionario serializable a JSON con la clave "op"
+        """
+        datos = json.dumps(registro, ensure_ascii=False).encode("utf-8")
+        with self._candado:
+            if self._archivo is None:
+                raise ValueError("La bitácora está cerrada")
+            self._archivo.write(_ENCABEZADO.pack(len(datos), zlib.crc32(datos)))
+            self._archivo.write(datos)
+            if self._pendientes == 0:
+                self._primer_pendiente = time.monotonic()
+            self._pendientes += 1
+            if self._pendientes >= self._fsync_cada or (
+                self._fsync_ms
+                and (time.monotonic() - self._primer_pendiente) * 1000 >= self._fsync_ms
+            ):
+                self._sincronizar()
+            if self._archivo.tell() >= self._tam_segmento:
+                self._rotar()
+
+    def _sincronizar(self) -> None:
+        """Vacía el búfer y hace fsync del segmento activo. Requiere el candado."""
+        if self._pendientes:
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+            self._pendientes = 0
+
+    def sincronizar(self) -> None:
+        """Fuerza el fsync de los registros pendientes."""
+        with self._candado:
+            if self._archivo is not None:
+                self._sincronizar()
+
+    def _sincronizar_periodicamente(self) -> None:
+        """Hilo que sincroniza los registros que esperan más de fsync_ms."""
+        intervalo = self._fsync_ms / 1000
+        while not self._cerrada.wait(intervalo):
+            self.sincronizar()
+
+    def cerrar(self) -> None:
+        """Sincroniza los registros pendientes y cierra el segmento activo."""
+        self._cerrada.set()
+        if self._hilo is not None:
+            self._hilo.join()
+        with self._candado:
+            if self._archivo is not None:
+                self._sincronizar()
+                self._archivo.close()
+                self._archivo = None
+
+    def leer(self, desde: int = 0) -> Iterator[Dict]:
+        """
+        Lee los registros de los segmentos con número >= desde, en orden.
+        Un registro cortado o corrupto termina la lectura de su segmento.
+
+        Args:
+            desde: Primer segmento a leer
+        Returns:
+            Iterator[Dict]: Registros decodificados
+        """
+        self.sincronizar()
+        for numero in self.segmentos():
+            if numero < desde:
+                continue
+            with open(self._ruta_segmento(numero), "rb") as archivo:
+                while True:
+                    encabezado = archivo.read(_ENCABEZADO.size)
+                    if len(encabezado) < _ENCABEZADO.size:
+                        break
+                    longitud, crc = _ENCABEZADO.unpack(encabezado)
+                    datos = archivo.read(longitud)
+                    if len(datos) < longitud or zlib.crc32(datos) != crc:
+                        break
+                    yield json.loads(datos)
+
+    def compactar(self, tienda) -> str:
+        """
+        Pliega los segmentos cerrados en un snapshot nuevo y los elimina.
+        Se abre un segmento nuevo (salvo que el activo esté vacío), de modo que
+        el snapshot cubre exactamente los segmentos anteriores a él. El
+        candado se mantiene mientras se escribe el snapshot, para que ningún
+        registro quede en el segmento nuevo con su efecto ya en el snapshot.
+
+        Args:
+            tienda: Tienda cuyo estado corresponde a todos los registros escritos
+        Returns:
+            str: Ruta del snapshot escrito
+        """
+        with self._candado:
+            if self._archivo is None:
+                raise ValueError("La bitácora está cerrada")
+            if self._archivo.tell():
+                self._rotar()
+            corte = self._segmento
+            ruta = self._ruta_snapshot(corte)
+            snapshot.guardar(tienda, ruta)
+        for numero in self.segmentos():
+            if numero < corte:
+                os.remove(self._ruta_segmento(numero))
+        for nombre in os.listdir(self._directorio):
+            numero = _numero(nombre, _PREFIJO_SNAPSHOT, _SUFIJO_SNAPSHOT)
+            if numero is not None and numero < corte:
+                os.remove(os.path.join(self._directorio, nombre))
+        return ruta
+
+
+def reproducir(tienda, registro: Dict) -> None:
+    """
+    Aplica a una tienda el efecto de un registro de la bitácora.
+    Las ventas se reaplican con el precio y la fecha registrados, y las altas
+    conservan su SKU.
+
+    Args:
+        tienda: Tienda sin bitácora activa
+        registro: Registro leído de la bitácora
+    """
+    operacion = registro["op"]
+    inventario = tienda._inventario
+    if operacion == "agregar":
+        # Entradas [sku, registro, cantidad]; antes no incluían la cantidad
+        entradas = registro["entradas"]
+        muebles = tienda._compartir_definiciones(
+            [crear_mueble(entrada[1]) for entrada in entradas]
+        )
+        inventario.agregar_lote(
+            (mueble, precio, entrada[0], entrada[2] if len(entrada) > 2 else 1)
+            for entrada, mueble, precio in zip(
+                entradas, muebles, cotizar(muebles, memoizar=True)
+            )
+        )
+    elif operacion == "venta":
+        muebles = [inventario.obtener(sku) for sku in registro["skus"]]
+        tienda._confirmar_ventas(
+            [mueble for mueble in muebles if mueble is not None], registro["ventas"]
+        )
+    elif operacion == "modificar":
+        # Estado completo del mueble tras el cambio; los setters reaplican solo
+        # los atributos que difieren. Las piezas de comedor que no están en el
+        # inventario se ubican por comedor y posición (0 es la mesa)
+        if "sku" in registro:
+            mueble = inventario.obtener(registro["sku"])
+        else:
+            comedor = tienda._comedores[registro["comedor"]]
+            pieza = registro["pieza"]
+            mueble = comedor.mesa if pieza == 0 else comedor.sillas[pieza - 1]
+        for atributo, valor in registro["mueble"].items():
+            if atributo != "tipo" and getattr(mueble, atributo) != valor:
+                setattr(mueble, atributo, valor)
+    elif operacion == "quitar":
+        inventario.quitar_sku(registro["sku"])
+    elif operacion == "reponer":
+        inventario.reponer(registro["sku"], registro["cantidad"])
+    elif operacion == "descuento":
+        tienda._descuentos.agregar_regla(regla_desde_registro(registro))
+    elif operacion == "quitar_descuento":
+        regla = regla_desde_registro({**registro, "valor": 1})
+        tienda._descuentos.quitar_regla(regla.clave)
+    elif operacion == "politica_descuentos":
+        tienda._descuentos.politica = registro["politica"]
+    elif operacion == "comedor":
+        tienda._incorporar_comedor(snapshot.comedor_desde_registro(tienda, registro))
+    else:
+        raise ValueError(f"Operación desconocida en la bitácora: '{operacion}'")
@@ -10,12 +10,16 @@ Interfaz de usuario usando Rich para crear un menú interactivo y atractivo.
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
-from typing import List, Optional
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+from concurrent.futures import CancelledError, wait
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+import io
 import time
 
 # Corrección de imports para ejecución directa
 from services.tienda import TiendaMuebles
 from models.mueble import Mueble
+from services.tareas import EjecutorTareas, Tarea, TareaCancelada
 # TODO: Importar los servicios y modelos
 
 
@@ -36,6 +40,11 @@ class MenuTienda:
     - Composición: Usa una instancia de TiendaMuebles para las operaciones
     """
 
+    # Filas por página en las tablas de muebles
+    TAM_PAGINA = 20
+    # Segundos que el menú espera una tarea antes de dejarla en segundo plano
+    ESPERA_MAXIMA = 0.5
+
     def __init__(self, tienda: "TiendaMuebles"):
         """
         Constructor del menú.
@@ -47,36 +56,21 @@ class MenuTienda:
         self.tienda = tienda
         self.console = Console()
         self.running = True
+        # Estadísticas y reportes se calculan en segundo plano
+        self._tareas = EjecutorTareas()
+        # Tareas en curso y la función que muestra su resultado al terminar
+        self._pendientes: List[Tuple["Tarea", Callable[[Any], None]]] = []
 
     def mostrar_catalogo_completo(self):
-        """Muestra todos los muebles disponibles en una tabla."""
+        """Muestra todos los muebles disponibles en una tabla paginada."""
 
-        # Implementar visualización del catálogo
         muebles = self.tienda._inventario  # Acceso directo para el ejemplo
 
         if not muebles:
             self.console.print("[yellow]No hay muebles en el inventario.[/yellow]")
             return
 
-        table = Table(title="📋 Catálogo de Muebles")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Nombre", style="magenta")
-        table.add_column("Tipo", style="green")
-        table.add_column("Material", style="yellow")
-        table.add_column("Color", style="blue")
-        table.add_column("Precio", style="red", justify="right")
-
-        for i, mueble in enumerate(muebles, 1):
-            try:
-                precio = f"${mueble.calcular_precio():.2f}"
-                tipo = type(mueble).__name__
-                table.add_row(
-                    str(i), mueble.nombre, tipo, mueble.material, mueble.color, precio
-                )
-            except Exception as e:
-                table.add_row(str(i), mueble.nombre, "Error", "-", "-", "Error")
-
-        self.console.print(table)
+        self._paginar_muebles(muebles, titulo="📋 Catálogo de Muebles", con_color=True)
 
     def buscar_muebles_interactivo(self):
         """Interfaz interactiva para buscar muebles."""
@@ -90,7 +84,6 @@ class MenuTienda:
             return
 
         with self.console.status("[bold green]Buscando muebles..."):
-            time.sleep(0.5)  # Simular tiempo de búsqueda
             resultados = self.tienda.buscar_muebles_por_nombre(termino_busqueda)
 
         if not resultados:
@@ -125,7 +118,6 @@ class MenuTienda:
             return
 
         with self.console.status("[bold green]Filtrando muebles..."):
-            time.sleep(0.3)
             resultados = self.tienda.filtrar_por_precio(precio_min, precio_max)
 
         if not resultados:
@@ -151,7 +143,6 @@ class MenuTienda:
             return
 
         with self.console.status(f"[bold green]Buscando muebles de {material}..."):
-            time.sleep(0.3)
             resultados = self.tienda.filtrar_por_material(material)
 
         if not resultados:
@@ -187,19 +178,17 @@ class MenuTienda:
             return
 
         self.console.print("[cyan]Selecciona un mueble para vender:[/cyan]")
-        self._mostrar_lista_muebles(muebles, numerada=True)
+        mueble_seleccionado = self._paginar_muebles(muebles, seleccionar=True)
+        if mueble_seleccionado is None:
+            self.console.print("[yellow]Venta cancelada.[/yellow]")
+            return
 
         try:
-            indice = IntPrompt.ask(
-                "Número del mueble",
-                choices=[str(i) for i in range(1, len(muebles) + 1)],
-            )
-
-            mueble_seleccionado = muebles[indice - 1]
+            sku = self.tienda.obtener_sku(mueble_seleccionado)
 
             # Mostrar detalles del mueble
             self.console.print(f"\n[green]Mueble seleccionado:[/green]")
-            self.console.print(mueble_seleccionado.obtener_descripcion())
+            self.console.print(self.tienda.obtener_descripcion(mueble_seleccionado))
 
             confirmar = Confirm.ask("\n¿Confirmar la venta?")
             if not confirmar:
@@ -208,7 +197,7 @@ class MenuTienda:
 
             cliente = Prompt.ask("Nombre del cliente", default="Cliente Anónimo")
 
-            resultado = self.tienda.realizar_venta(mueble_seleccionado, cliente)
+            resultado = self.tienda.realizar_venta(sku, cliente)
 
             if "error" in resultado:
                 self.console.print(f"[red]Error: {resultado['error']}[/red]")
@@ -218,22 +207,160 @@ class MenuTienda:
         except (ValueError, IndexError):
             self.console.print("[red]Selección inválida.[/red]")
 
+    def _ejecutar_en_segundo_plano(
+        self,
+        descripcion: str,
+        funcion: Callable[["Tarea"], Any],
+        al_terminar: Callable[[Any], None],
+        clave: Optional[str] = None,
+        version: Any = None,
+    ) -> None:
+        """
+        Ejecuta una función en segundo plano sin bloquear el menú.
+        Se muestra su progreso durante ESPERA_MAXIMA segundos; si termina en
+        ese lapso su resultado se muestra de inmediato y, si no, el menú
+        vuelve a estar disponible y el resultado se muestra al regresar a él.
+        Ctrl+C durante la espera cancela la tarea; después se puede cancelar
+        desde la opción de tareas en segundo plano. Con clave y versión, el
+        resultado se reutiliza mientras la versión no cambie. La función
+        corre en otro hilo y no debe leer la tienda, que no es segura entre
+        hilos: lo que necesite se copia antes de enviarla.
+        Método auxiliar privado.
+
+        Args:
+            descripcion: Texto que describe la tarea
+            funcion: Función que recibe la Tarea para informar progreso
+            al_terminar: Función que muestra el resultado
+            clave: Clave de caché del resultado (opcional)
+            version: Versión de los datos de los que depende el resultado
+        """
+        tarea = self._tareas.enviar(descripcion, funcion, clave, version)
+        if any(pendiente is tarea for pendiente, _ in self._pendientes):
+            self.console.print(f"[cyan]{descripcion} sigue en segundo plano.[/cyan]")
+            return
+        if not tarea.terminada():
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[bold green]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.completed}/{task.total}"),
+                console=self.console,
+                transient=True,
+            ) as barra:
+                id_barra = barra.add_task(descripcion, total=None)
+                limite = time.monotonic() + self.ESPERA_MAXIMA
+                try:
+                    while not tarea.terminada() and time.monotonic() < limite:
+                        wait([tarea.futuro], timeout=0.05)
+                        hechas, total = tarea.progreso
+                        barra.update(id_barra, completed=hechas, total=total)
+                except KeyboardInterrupt:
+                    tarea.cancelar()
+                    self.console.print("[yellow]Operación cancelada.[/yellow]")
+                    return
+        if not tarea.terminada():
+            self._pendientes.append((tarea, al_terminar))
+            self.console.print(
+                f"[cyan]{descripcion} sigue en segundo plano; el resultado se "
+                "mostrará al volver al menú.[/cyan]"
+            )
+            return
+        self._entregar(tarea, al_terminar)
+
+    def _entregar(self, tarea: "Tarea", al_terminar: Callable[[Any], None]) -> None:
+        """
+        Muestra el resultado de una tarea terminada, o su cancelación o error.
+        Método auxiliar privado.
+        """
+        try:
+            resultado = tarea.resultado()
+        except (TareaCancelada, CancelledError):
+            self.console.print(f"[yellow]{tarea.descripcion} cancelada.[/yellow]")
+            return
+        except Exception as e:
+            self.console.print(f"[red]Error: {str(e)}[/red]")
+            return
+        al_terminar(resultado)
+
+    def _atender_tareas(self) -> None:
+        """
+        Muestra los resultados de las tareas que terminaron en segundo plano.
+        Método auxiliar privado.
+        """
+        terminadas = [p for p in self._pendientes if p[0].terminada()]
+        if not terminadas:
+            return
+        self._pendientes = [p for p in self._pendientes if not p[0].terminada()]
+        for tarea, al_terminar in terminadas:
+            self.console.print(f"[green]✔ Terminó: {tarea.descripcion}[/green]")
+            self._entregar(tarea, al_terminar)
+
+    def gestionar_tareas(self):
+        """Muestra las tareas en segundo plano y permite cancelar una."""
+
+        self._atender_tareas()
+        if not self._pendientes:
+            self.console.print("[yellow]No hay tareas en segundo plano.[/yellow]")
+            return
+
+        table = Table(title="⏳ Tareas en segundo plano")
+        table.add_column("#", style="cyan", justify="right")
+        table.add_column("Tarea", style="magenta")
+        table.add_column("Progreso", style="green", justify="right")
+        for numero, (tarea, _) in enumerate(self._pendientes, 1):
+            hechas, total = tarea.progreso
+            table.add_row(
+                str(numero), tarea.descripcion, f"{hechas}/{total if total else '?'}"
+            )
+        self.console.print(table)
+
+        respuesta = Prompt.ask(
+            "Número de la tarea a cancelar (Enter para volver)", default=""
+        )
+        if not respuesta.strip():
+            return
+        if not respuesta.strip().isdigit() or not (
+            1 <= int(respuesta) <= len(self._pendientes)
+        ):
+            self.console.print("[red]Selección inválida.[/red]")
+            return
+        tarea, _ = self._pendientes.pop(int(respuesta) - 1)
+        tarea.cancelar()
+        self.console.print(f"[yellow]{tarea.descripcion} cancelada.[/yellow]")
+
     def mostrar_estadisticas(self):
         """Muestra las estadísticas de la tienda."""
+        # Salen de agregados (por tipo y por cubo de ventas) que solo este
+        # hilo modifica, así que se leen aquí y no en segundo plano
+        self._mostrar_tabla_estadisticas(
+            (
+                self.tienda.obtener_estadisticas(),
+                self.tienda.resumen_ventas_recientes(24),
+                self.tienda.resumen_ventas_recientes(24 * 30),
+            )
+        )
 
-        with self.console.status("[bold green]Calculando estadísticas..."):
-            time.sleep(0.5)
-            stats = self.tienda.obtener_estadisticas()
-            if not isinstance(stats, dict):
-                stats = {}
+    def _mostrar_tabla_estadisticas(self, resultado: tuple):
+        """
+        Muestra las estadísticas calculadas por mostrar_estadisticas.
+        Método auxiliar privado.
+        """
+        stats, ultimas_24h, ultimos_30d = resultado
+        if not isinstance(stats, dict):
+            stats = {}
         table = Table(title="📊 Estadísticas de la Tienda")
         table.add_column("Métrica", style="cyan", no_wrap=True)
         table.add_column("Valor", style="magenta", justify="right")
         table.add_row("Total de muebles", str(stats.get("total_muebles", 0)))
+        table.add_row("Productos (SKU)", str(stats.get("total_productos", 0)))
         table.add_row("Total de comedores", str(stats.get("total_comedores", 0)))
         table.add_row(
             "Valor del inventario", f"${stats.get('valor_inventario', 0):.2f}"
         )
+        table.add_row(
+            "Valor con descuentos",
+            f"${stats.get('valor_inventario_con_descuentos', 0):.2f}",
+        )
         table.add_row("Ventas realizadas", str(stats.get("ventas_realizadas", 0)))
         table.add_row("Descuentos activos", str(stats.get("descuentos_activos", {})))
         # Estadísticas acumulativas
@@ -245,6 +372,15 @@ class MenuTienda:
             "Valor total de ventas (acumulado)",
             f"${stats.get('valor_total_ventas', 0):.2f}",
         )
+        for etiqueta, resumen in (
+            ("últimas 24 h", ultimas_24h),
+            ("últimos 30 días", ultimos_30d),
+        ):
+            table.add_row(
+                f"Ventas ({etiqueta})",
+                f"{resumen['ventas']} · ${resumen['neto']:.2f}"
+                f" (descuentos ${resumen['descuentos']:.2f})",
+            )
         self.console.print(table)
         tipos = stats.get("tipos_muebles", {})
         if tipos:
@@ -255,10 +391,30 @@ class MenuTienda:
     def generar_reporte_interactivo(self):
         """Genera y muestra el reporte de inventario."""
 
-        with self.console.status("[bold green]Generando reporte..."):
-            time.sleep(1)  # Simular tiempo de generación
-            reporte = self.tienda.generar_reporte_inventario()
+        # La tienda no es segura entre hilos: la tarea solo formatea una copia
+        instantanea = self.tienda.instantanea_reporte()
+
+        def generar(tarea: "Tarea") -> str:
+            # El progreso por bloques permite seguir y cancelar la tarea
+            destino = io.StringIO()
+            self.tienda.escribir_reporte_inventario(
+                destino, progreso=tarea.avanzar, instantanea=instantanea
+            )
+            return destino.getvalue()
+
+        self._ejecutar_en_segundo_plano(
+            "Generando reporte...",
+            generar,
+            self._mostrar_reporte,
+            clave="reporte",
+            version=self.tienda.version,
+        )
 
+    def _mostrar_reporte(self, reporte: str):
+        """
+        Muestra el reporte generado y ofrece guardarlo en un archivo.
+        Método auxiliar privado.
+        """
         panel = Panel(
             reporte,
             title="📋 Reporte de Inventario",
@@ -274,12 +430,23 @@ class MenuTienda:
             filename = Prompt.ask(
                 "Nombre del archivo", default="reporte_inventario.txt"
             )
-            try:
+            detallado = Confirm.ask("¿Incluir el detalle por mueble?", default=False)
+            instantanea = self.tienda.instantanea_reporte(detallado)
+
+            def escribir(tarea: "Tarea") -> int:
+                # El reporte se escribe por bloques, sin armarlo en memoria
                 with open(filename, "w", encoding="utf-8") as f:
-                    f.write(reporte)
-                self.console.print(f"[green]Reporte guardado en {filename}[/green]")
-            except Exception as e:
-                self.console.print(f"[red]Error al guardar: {str(e)}[/red]")
+                    return self.tienda.escribir_reporte_inventario(
+                        f, detallado, progreso=tarea.avanzar, instantanea=instantanea
+                    )
+
+            self._ejecutar_en_segundo_plano(
+                "Guardando reporte...",
+                escribir,
+                lambda lineas: self.console.print(
+                    f"[green]Reporte guardado en {filename} ({lineas} líneas)[/green]"
+                ),
+            )
 
     def aplicar_descuentos_interactivo(self):
         """Interfaz para aplicar descuentos por categoría."""
@@ -291,6 +458,7 @@ class MenuTienda:
             "cama",
             "armario",
             "escritorio",
+            "asiento",
         ]
 
         self.console.print("[cyan]Categorías disponibles:[/cyan]")
@@ -318,41 +486,137 @@ class MenuTienda:
 
     def _mostrar_lista_muebles(self, muebles: List["Mueble"], numerada: bool = False):
         """
-        Muestra una lista de muebles en formato tabla.
+        Muestra una lista de muebles en formato tabla, paginada.
         Método auxiliar privado.
 
         Args:
             muebles: Lista de muebles a mostrar
-            numerada: Si incluir números para selección
+            numerada: Si incluir el SKU de cada mueble para selección
+        """
+        self._paginar_muebles(muebles, con_sku=numerada)
+
+    def _tabla_pagina(
+        self,
+        muebles: Sequence["Mueble"],
+        pagina: int,
+        titulo: Optional[str] = None,
+        con_sku: bool = True,
+        con_color: bool = False,
+    ) -> Table:
         """
+        Construye la tabla de una sola página de muebles.
+        Solo formatea las filas visibles y toma el precio registrado en el
+        inventario en lugar de recalcularlo.
+        Método auxiliar privado.
 
-        table = Table()
+        Args:
+            muebles: Secuencia indexable de muebles (lista o inventario)
+            pagina: Número de página, empezando en 0
+            titulo: Título de la tabla
+            con_sku: Si incluir las columnas SKU y Stock
+            con_color: Si incluir la columna Color
+        """
+        total_paginas = max(1, -(-len(muebles) // self.TAM_PAGINA))
+        table = Table(
+            title=titulo,
+            caption=f"Página {pagina + 1} de {total_paginas} · {len(muebles)} muebles",
+        )
 
-        if numerada:
-            table.add_column("#", style="cyan", no_wrap=True)
+        if con_sku:
+            table.add_column("SKU", style="cyan", no_wrap=True)
 
         table.add_column("Nombre", style="magenta")
         table.add_column("Tipo", style="green")
         table.add_column("Material", style="yellow")
+        if con_color:
+            table.add_column("Color", style="blue")
         table.add_column("Precio", style="red", justify="right")
+        if con_sku:
+            table.add_column("Stock", style="white", justify="right")
+
+        inicio = pagina * self.TAM_PAGINA
+        for mueble in muebles[inicio : inicio + self.TAM_PAGINA]:
+            precio = self.tienda.obtener_precio(mueble)
+            row_data = [
+                mueble.nombre,
+                type(mueble).__name__,
+                mueble.material,
+                f"${precio:.2f}" if precio is not None else "-",
+            ]
+            if con_color:
+                row_data.insert(3, mueble.color)
+            if con_sku:
+                sku = self.tienda.obtener_sku(mueble)
+                row_data.insert(0, str(sku))
+                row_data.append(str(self.tienda.obtener_existencias(sku)))
+            table.add_row(*row_data)
+
+        return table
+
+    def _paginar_muebles(
+        self,
+        muebles: Sequence["Mueble"],
+        titulo: Optional[str] = None,
+        con_sku: bool = True,
+        con_color: bool = False,
+        seleccionar: bool = False,
+    ) -> Optional["Mueble"]:
+        """
+        Muestra muebles página por página con navegación siguiente, anterior
+        y salto a una página. Cada página se construye al mostrarse, así que
+        el costo no depende del tamaño de la lista.
+        Método auxiliar privado.
 
-        for i, mueble in enumerate(muebles, 1):
-            try:
-                precio = f"${mueble.calcular_precio():.2f}"
-                tipo = type(mueble).__name__
-
-                row_data = [mueble.nombre, tipo, mueble.material, precio]
-                if numerada:
-                    row_data.insert(0, str(i))
-
-                table.add_row(*row_data)
-            except Exception:
-                row_data = [mueble.nombre, "Error", mueble.material, "Error"]
-                if numerada:
-                    row_data.insert(0, str(i))
-                table.add_row(*row_data)
+        Args:
+            muebles: Secuencia indexable de muebles (lista o inventario)
+            titulo: Título de la tabla
+            con_sku: Si incluir la columna SKU
+            con_color: Si incluir la columna Color
+            seleccionar: Si permitir elegir un mueble por SKU
 
-        self.console.print(table)
+        Returns:
+            Optional[Mueble]: Mueble elegido (solo con seleccionar), o None
+        """
+        total_paginas = max(1, -(-len(muebles) // self.TAM_PAGINA))
+        pagina = 0
+        while True:
+            self.console.print(
+                self._tabla_pagina(muebles, pagina, titulo, con_sku or seleccionar, con_color)
+            )
+            if total_paginas == 1 and not seleccionar:
+                return None
+
+            comandos = []
+            if total_paginas > 1:
+                comandos.append("[s]iguiente, [a]nterior, [p N] ir a página")
+            if seleccionar:
+                comandos.append("[e SKU] elegir")
+            comandos.append("[q] salir")
+            self.console.print(f"[dim]{', '.join(comandos)}[/dim]")
+            respuesta = Prompt.ask("Opción", default="q" if not seleccionar else "")
+            partes = respuesta.strip().lower().split()
+            if not partes or partes[0] == "q":
+                return None
+            comando, argumento = partes[0], partes[1] if len(partes) > 1 else None
+
+            if comando == "s":
+                pagina = min(pagina + 1, total_paginas - 1)
+            elif comando == "a":
+                pagina = max(pagina - 1, 0)
+            elif comando == "p" and argumento and argumento.isdigit():
+                pagina = min(max(int(argumento) - 1, 0), total_paginas - 1)
+            elif seleccionar and comando == "e" and argumento and argumento.isdigit():
+                mueble = self.tienda.obtener_mueble(int(argumento))
+                if mueble is not None:
+                    return mueble
+                self.console.print(f"[red]SKU {argumento} inexistente.[/red]")
+            elif seleccionar and comando.isdigit():
+                mueble = self.tienda.obtener_mueble(int(comando))
+                if mueble is not None:
+                    return mueble
+                self.console.print(f"[red]SKU {comando} inexistente.[/red]")
+            else:
+                self.console.print("[red]Opción inválida.[/red]")
 
     def _mostrar_comprobante_venta(self, venta: dict):
         """
@@ -392,11 +656,13 @@ class MenuTienda:
 
         while self.running:
             try:
+                self._atender_tareas()
                 opcion = self.mostrar_menu_principal()
 
                 if opcion == 0:
                     self.console.print("[red]¡Hasta luego! 👋[/red]")
                     self.running = False
+                    self._tareas.cerrar()
                 elif opcion == 1:
                     self.mostrar_catalogo_completo()
                 elif opcion == 2:
@@ -415,6 +681,8 @@ class MenuTienda:
                     self.generar_reporte_interactivo()
                 elif opcion == 9:
                     self.aplicar_descuentos_interactivo()
+                elif opcion == 10:
+                    self.gestionar_tareas()
 
                 if self.running:
                     input("\nPresiona Enter para continuar...")
@@ -465,11 +733,16 @@ class MenuTienda:
             "7. Ver estadísticas",
             "8. Generar reporte de inventario",
             "9. Aplicar descuentos",
+            "10. Tareas en segundo plano",
             "0. Salir",
         ]
 
         for opcion in opciones:
             menu_text.append(f"{opcion}\n", style="green")
+        if self._pendientes:
+            menu_text.append(
+                f"\n⏳ {len(self._pendientes)} tarea(s) en segundo plano\n", style="dim"
+            )
 
         panel = Panel(
             menu_text,
@@ -482,7 +755,7 @@ class MenuTienda:
 
         try:
             opcion = IntPrompt.ask(
-                "Selecciona una opción", choices=[str(i) for i in range(0, 10)]
+                "Selecciona una opción", choices=[str(i) for i in range(0, 11)]
             )
             return opcion
         except ValueError:
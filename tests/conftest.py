@@ -0,0 +1,46 @@
+"""
+Fixtures compartidas por las pruebas unitarias y de integración.
+"""
+
+import pytest
+
+from models.concretos.armario import Armario
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sofa import Sofa
+from services.tienda import TiendaMuebles
+
+
+@pytest.fixture
+def silla():
+    return Silla("Silla Clásica", "Madera", "Café", 150.0, material_tapizado="tela")
+
+
+@pytest.fixture
+def mesa():
+    return Mesa("Mesa Comedor", "Roble", "Natural", 500.0, capacidad_personas=6)
+
+
+@pytest.fixture
+def sofa():
+    return Sofa("Sofá Cómodo", "Tela", "Gris", 900.0, material_tapizado="cuero")
+
+
+@pytest.fixture
+def armario():
+    return Armario("Armario Grande", "Pino", "Blanco", 700, num_puertas=3)
+
+
+@pytest.fixture
+def muebles(silla, mesa, sofa, armario):
+    return [silla, mesa, sofa, armario]
+
+
+@pytest.fixture
+def tienda(muebles):
+    """Tienda con un mueble de cada fixture en el inventario."""
+    tienda = TiendaMuebles("Tienda de Prueba")
+    for mueble in muebles:
+        tienda.agregar_mueble(mueble)
+    yield tienda
+    tienda.cerrar()
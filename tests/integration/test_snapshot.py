@@ -0,0 +1,171 @@
+import os
+
+import pytest
+
+from models.composicion.comedor import Comedor
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sofacama import SofaCama
+from services import snapshot
+from services.catalogo import Catalogo, a_registro
+from services.tienda import TiendaMuebles
+
+
+@pytest.fixture
+def ruta(tmp_path):
+    return str(tmp_path / "tienda.snap")
+
+
+def _restaurar(tienda, ruta, catalogo=None):
+    tienda.guardar_snapshot(ruta)
+    return TiendaMuebles.cargar_snapshot(ruta, catalogo=catalogo)
+
+
+def _nombres(muebles):
+    return sorted(mueble.nombre for mueble in muebles)
+
+
+class TestIdaYVuelta:
+    def test_conserva_estado(self, tienda, silla, mesa, ruta):
+        tienda.aplicar_descuento("silla", 10)
+        tienda.reponer_existencias(tienda.obtener_sku(mesa), 2)
+        tienda.realizar_venta(silla)
+        restaurada = _restaurar(tienda, ruta)
+        assert restaurada.nombre == tienda.nombre
+        assert restaurada.obtener_estadisticas() == tienda.obtener_estadisticas()
+        assert len(restaurada._ventas_realizadas) == 1
+        assert restaurada.obtener_existencias(tienda.obtener_sku(mesa)) == 3
+
+    def test_conserva_skus_y_orden(self, tienda, muebles, ruta):
+        restaurada = _restaurar(tienda, ruta)
+        assert [restaurada.obtener_sku(m) for m in restaurada._inventario] == [
+            tienda.obtener_sku(m) for m in muebles
+        ]
+        nuevo = Silla("Nueva", "Pino", "Azul", 50.0)
+        restaurada.agregar_mueble(nuevo)
+        assert restaurada.obtener_sku(nuevo) == tienda._inventario.siguiente_sku
+
+    def test_no_recalcula_precios(self, tienda, sofa, ruta):
+        restaurada = _restaurar(tienda, ruta)
+        restaurado = restaurada.obtener_mueble(tienda.obtener_sku(sofa))
+        assert restaurado._precio_cache == sofa.calcular_precio()
+
+    def test_conserva_atributos_de_estado(self, tienda, ruta):
+        sofacama = SofaCama("Sofá Cama", "Tela", "Gris", 900)
+        tienda.agregar_mueble(sofacama)
+        sofacama.convertir_a_cama()
+        restaurada = _restaurar(tienda, ruta)
+        restaurado = restaurada.obtener_mueble(tienda.obtener_sku(sofacama))
+        assert restaurado.modo_actual == "cama"
+        assert restaurado._precio_cache == sofacama.calcular_precio()
+
+    def test_columna_con_booleanos_y_enteros(self, tienda, ruta):
+        con_ruedas = Silla("Con ruedas", "Pino", "Azul", 80.0, tiene_ruedas=True)
+        sin_ruedas = Silla("Sin ruedas", "Pino", "Azul", 80.0, tiene_ruedas=0)
+        tienda.agregar_mueble(con_ruedas)
+        tienda.agregar_mueble(sin_ruedas)
+        restaurada = _restaurar(tienda, ruta)
+        for mueble in (con_ruedas, sin_ruedas):
+            restaurado = restaurada.obtener_mueble(tienda.obtener_sku(mueble))
+            assert restaurado.tiene_ruedas == mueble.tiene_ruedas
+            assert restaurado.calcular_precio() == mueble.calcular_precio()
+
+    def test_sincroniza_directorio(self, tienda, ruta, monkeypatch):
+        abiertos = []
+        abrir = os.open
+        monkeypatch.setattr(
+            os, "open", lambda r, *a, **k: abiertos.append(r) or abrir(r, *a, **k)
+        )
+        tienda.guardar_snapshot(ruta)
+        assert os.path.dirname(ruta) in abiertos
+        assert not os.path.exists(ruta + ".tmp")
+
+
+class TestCargaDiferida:
+    def test_no_construye_muebles_al_cargar(self, tienda, ruta):
+        restaurada = _restaurar(tienda, ruta)
+        inventario = restaurada._inventario
+        assert inventario._muebles == [None] * 4
+        assert restaurada.obtener_estadisticas()["total_muebles"] == 4
+
+    def test_construye_solo_la_fila_pedida(self, tienda, mesa, ruta):
+        restaurada = _restaurar(tienda, ruta)
+        restaurado = restaurada.obtener_mueble(tienda.obtener_sku(mesa))
+        assert restaurado.nombre == mesa.nombre
+        assert restaurada._inventario._muebles.count(None) == 3
+        assert restaurada.obtener_mueble(tienda.obtener_sku(mesa)) is restaurado
+
+    def test_consultas_iguales_a_la_original(self, tienda, ruta):
+        restaurada = _restaurar(tienda, ruta)
+        assert _nombres(restaurada.buscar_muebles_por_nombre("sof")) == ["Sofá Cómodo"]
+        assert _nombres(restaurada.filtrar_por_precio(100, 800)) == _nombres(
+            tienda.filtrar_por_precio(100, 800)
+        )
+        assert _nombres(restaurada.filtrar_por_material("roble")) == ["Mesa Comedor"]
+        assert _nombres(restaurada.obtener_muebles_por_tipo(Silla)) == [
+            "Silla Clásica"
+        ]
+
+    def test_cambios_antes_de_la_primera_consulta(self, tienda, silla, sofa, mesa, ruta):
+        restaurada = _restaurar(tienda, ruta)
+        restaurada.realizar_venta(tienda.obtener_sku(sofa))
+        restaurada.obtener_mueble(tienda.obtener_sku(silla)).precio_base = 5000.0
+        restaurada.agregar_mueble(Mesa("Mesa Nueva", "Vidrio", "Negro", 300.0))
+        assert _nombres(restaurada.buscar_muebles_por_nombre("sofa")) == []
+        assert _nombres(restaurada.filtrar_por_precio(4000, 10000)) == ["Silla Clásica"]
+        assert _nombres(restaurada.obtener_muebles_por_tipo(Mesa)) == [
+            "Mesa Comedor",
+            "Mesa Nueva",
+        ]
+        assert restaurada.calcular_valor_inventario() == pytest.approx(
+            sum(m.calcular_precio() for m in restaurada._inventario)
+        )
+
+    def test_catalogo_comparte_definiciones(self, tienda, ruta):
+        catalogo = Catalogo()
+        primera = _restaurar(tienda, ruta, catalogo)
+        segunda = TiendaMuebles.cargar_snapshot(ruta, catalogo=catalogo)
+        assert all(a is b for a, b in zip(primera._inventario, segunda._inventario))
+        assert len(catalogo) == 4
+
+
+class TestComedores:
+    def test_piezas_compartidas_siguen_siendo_el_mismo_objeto(self, tienda, silla, ruta):
+        mesa = Mesa("Mesa Familiar", "Roble", "Natural", 400.0)
+        suelta = Silla("Silla Suelta", "Pino", "Blanco", 80.0)
+        tienda.agregar_comedor(Comedor("Familiar", mesa, [silla, suelta, suelta]))
+        tienda.agregar_comedor(Comedor("Reunión", mesa, [suelta]))
+        restaurada = _restaurar(tienda, ruta)
+        familiar, reunion = restaurada._comedores
+        sillas = list(familiar.sillas)
+        assert sillas[0] is restaurada.obtener_mueble(tienda.obtener_sku(silla))
+        assert sillas[1] is sillas[2]
+        assert reunion.mesa is familiar.mesa
+        assert reunion.sillas[0] is sillas[1]
+        assert familiar.calcular_precio_total() == (
+            tienda._comedores[0].calcular_precio_total()
+        )
+
+    def test_registro_de_piezas(self, tienda, silla):
+        mesa = Mesa("Mesa Familiar", "Roble", "Natural", 400.0)
+        registro = snapshot.registro_comedor(
+            tienda, Comedor("Familiar", mesa, [silla, silla]), 0, {}
+        )
+        assert registro["mesa"] == a_registro(mesa)
+        assert registro["sillas"] == [{"sku": tienda.obtener_sku(silla)}] * 2
+
+    def test_carga_piezas_completas_de_versiones_anteriores(self, tienda, silla):
+        mesa = Mesa("Mesa Familiar", "Roble", "Natural", 400.0)
+        comedor = snapshot.comedor_desde_registro(
+            tienda,
+            {
+                "nombre": "Antiguo",
+                "mesa": a_registro(mesa),
+                "sillas": [a_registro(silla)],
+            },
+        )
+        assert comedor.mesa.nombre == "Mesa Familiar"
+        assert comedor.sillas[0] is not silla
+        assert comedor.calcular_precio_total() == pytest.approx(
+            Comedor("x", mesa, [silla]).calcular_precio_total()
+        )
@@ -0,0 +1,169 @@
+import os
+
+import pytest
+
+from models.composicion.comedor import Comedor
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sofacama import SofaCama
+from services import snapshot
+from services.tienda import TiendaMuebles
+
+
+@pytest.fixture
+def directorio(tmp_path):
+    return str(tmp_path / "wal")
+
+
+@pytest.fixture
+def registrada(tienda, directorio):
+    tienda.habilitar_bitacora(directorio, fsync_cada=1, fsync_ms=0)
+    return tienda
+
+
+def _recuperar(tienda, directorio):
+    tienda.cerrar()
+    return TiendaMuebles.recuperar(directorio, fsync_ms=0)
+
+
+def _estado(tienda):
+    estadisticas = tienda.obtener_estadisticas()
+    return estadisticas, sorted(
+        (tienda.obtener_sku(m), m.nombre, m.calcular_precio()) for m in tienda._inventario
+    )
+
+
+class TestRecuperacion:
+    def test_reaplica_operaciones(self, registrada, silla, mesa, directorio):
+        registrada.aplicar_descuento("mesa", 15)
+        registrada.reponer_existencias(registrada.obtener_sku(mesa), 3)
+        registrada.realizar_venta(silla)
+        registrada.agregar_mueble(Silla("Nueva", "Pino", "Azul", 80.0), cantidad=2)
+        esperado = _estado(registrada)
+        recuperada = _recuperar(registrada, directorio)
+        assert _estado(recuperada) == esperado
+        recuperada.cerrar()
+
+    def test_reaplica_cambios_de_setters(self, registrada, silla, sofa, directorio):
+        silla.precio_base = 999.0
+        sofa.nombre = "Sofá Renovado"
+        sofa.color = "Azul"
+        esperado = _estado(registrada)
+        recuperada = _recuperar(registrada, directorio)
+        assert _estado(recuperada) == esperado
+        assert [m.nombre for m in recuperada.filtrar_por_color("azul")] == [
+            "Sofá Renovado"
+        ]
+        recuperada.cerrar()
+
+    def test_reaplica_atributos_de_estado(self, registrada, directorio):
+        convertido = SofaCama("Convertido", "Tela", "Gris", 900)
+        registrada.agregar_mueble(convertido)
+        convertido.convertir_a_cama()
+        nuevo = SofaCama("Nuevo", "Tela", "Gris", 900)
+        nuevo.convertir_a_cama()
+        registrada.agregar_mueble(nuevo)
+        recuperada = _recuperar(registrada, directorio)
+        for mueble in (convertido, nuevo):
+            sku = registrada.obtener_sku(mueble)
+            assert recuperada.obtener_mueble(sku).modo_actual == "cama"
+        recuperada.cerrar()
+
+    def test_tras_compactar(self, registrada, silla, armario, directorio):
+        silla.precio_base = 400.0
+        registrada.realizar_venta(armario)
+        registrada.compactar_bitacora()
+        silla.precio_base = 420.0
+        registrada.agregar_mueble(Mesa("Mesa Nueva", "Vidrio", "Negro", 300.0))
+        esperado = _estado(registrada)
+        recuperada = _recuperar(registrada, directorio)
+        assert _estado(recuperada) == esperado
+        recuperada.cerrar()
+
+    def test_descarta_registro_cortado(self, registrada, silla, mesa, directorio):
+        sku_mesa = registrada.obtener_sku(mesa)
+        registrada.realizar_venta(silla)
+        esperado = _estado(registrada)
+        registrada.realizar_venta(mesa)
+        bitacora = registrada._bitacora
+        ruta = bitacora._ruta_segmento(bitacora.segmento_activo)
+        registrada.cerrar()
+        with open(ruta, "r+b") as archivo:
+            archivo.truncate(os.path.getsize(ruta) - 3)
+        recuperada = TiendaMuebles.recuperar(directorio, fsync_ms=0)
+        assert _estado(recuperada) == esperado
+        # Los registros nuevos van a otro segmento y se recuperan completos
+        recuperada.realizar_venta(sku_mesa)
+        esperado = _estado(recuperada)
+        assert _estado(_recuperar(recuperada, directorio)) == esperado
+
+    def test_comedor_conserva_piezas(self, registrada, silla, directorio):
+        suelta = Silla("Silla Suelta", "Pino", "Blanco", 80.0)
+        mesa = Mesa("Mesa Familiar", "Roble", "Natural", 400.0)
+        registrada.agregar_comedor(Comedor("Familiar", mesa, [silla, suelta, suelta]))
+        registrada.agregar_comedor(Comedor("Reunión", mesa, [suelta]))
+        recuperada = _recuperar(registrada, directorio)
+        familiar, reunion = recuperada._comedores
+        sku = registrada.obtener_sku(silla)
+        assert familiar.sillas[0] is recuperada.obtener_mueble(sku)
+        assert familiar.sillas[1] is familiar.sillas[2] is reunion.sillas[0]
+        assert reunion.mesa is familiar.mesa
+        recuperada.cerrar()
+
+    def test_reaplica_cambios_de_piezas_de_comedor(
+        self, registrada, silla, directorio
+    ):
+        suelta = Silla("Silla Suelta", "Pino", "Blanco", 80.0)
+        mesa = Mesa("Mesa Familiar", "Roble", "Natural", 400.0)
+        registrada.agregar_comedor(Comedor("Familiar", mesa, [silla, suelta]))
+        registrada.agregar_comedor(Comedor("Reunión", mesa, [suelta]))
+        suelta.precio_base = 900.0
+        mesa.material = "Vidrio"
+        silla.precio_base = 300.0
+        registrada.realizar_venta(silla)
+        silla.color = "Verde"
+        totales = [c.calcular_precio_total() for c in registrada._comedores]
+        recuperada = _recuperar(registrada, directorio)
+        familiar, reunion = recuperada._comedores
+        assert [c.calcular_precio_total() for c in recuperada._comedores] == totales
+        assert familiar.mesa.material == "Vidrio"
+        assert familiar.sillas[0].color == "Verde"
+        assert reunion.sillas[0] is familiar.sillas[1]
+        # Los cambios posteriores a la recuperación también se registran
+        reunion.sillas[0].precio_base = 50.0
+        total = reunion.calcular_precio_total()
+        otra = _recuperar(recuperada, directorio)
+        assert otra._comedores[1].calcular_precio_total() == total
+        otra.cerrar()
+
+
+class TestSegmentos:
+    def test_recuperar_reutiliza_segmento_vacio(self, registrada, directorio):
+        registrada.cerrar()
+        segmentos = None
+        for _ in range(3):
+            recuperada = TiendaMuebles.recuperar(directorio, fsync_ms=0)
+            if segmentos is None:
+                segmentos = recuperada._bitacora.segmentos()
+            assert recuperada._bitacora.segmentos() == segmentos
+            recuperada.cerrar()
+
+    def test_compactar_elimina_segmentos_anteriores(self, registrada, silla):
+        registrada.realizar_venta(silla)
+        registrada.compactar_bitacora()
+        bitacora = registrada._bitacora
+        assert bitacora.segmentos() == [bitacora.segmento_activo]
+        assert bitacora.ultimo_snapshot()[0] == bitacora.segmento_activo
+
+    def test_compactar_mantiene_el_candado(self, registrada, silla, monkeypatch):
+        bloqueado = []
+        guardar = snapshot.guardar
+
+        def guardar_y_comprobar(tienda, ruta):
+            bloqueado.append(registrada._bitacora._candado.locked())
+            guardar(tienda, ruta)
+
+        monkeypatch.setattr(snapshot, "guardar", guardar_y_comprobar)
+        registrada.realizar_venta(silla)
+        registrada.compactar_bitacora()
+        assert bloqueado == [True]
@@ -0,0 +1,108 @@
+import pytest
+
+from models.composicion.comedor import Comedor, VistaSillas
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+
+
+def _sillas(n, precio=100.0):
+    return [Silla(f"Silla {i}", "Pino", "Blanco", precio) for i in range(1, n + 1)]
+
+
+def _precio_esperado(mesa, sillas):
+    total = mesa.calcular_precio() + sum(silla.calcular_precio() for silla in sillas)
+    if len(sillas) >= 4:
+        total *= 0.95
+    return round(total, 2)
+
+
+@pytest.fixture
+def comedor(mesa):
+    return Comedor("Familiar", mesa, _sillas(3))
+
+
+class TestPrecioTotal:
+    @pytest.mark.parametrize("n", [0, 3, 4, 6])
+    def test_descuento_desde_cuatro_sillas(self, mesa, n):
+        sillas = _sillas(n)
+        assert Comedor("C", mesa, sillas).calcular_precio_total() == _precio_esperado(
+            mesa, sillas
+        )
+
+    def test_usa_la_suma_de_sillas_en_cache(self, comedor, monkeypatch):
+        comedor.calcular_precio_total()
+        comedor._precio_total = None
+        llamadas = []
+        original = Silla.calcular_precio
+
+        def contar(silla):
+            llamadas.append(silla)
+            return original(silla)
+
+        monkeypatch.setattr(Silla, "calcular_precio", contar)
+        comedor.calcular_precio_total()
+        assert llamadas == []
+
+    def test_total_en_cache(self, comedor):
+        total = comedor.calcular_precio_total()
+        assert comedor._precio_total == total
+        assert comedor.calcular_precio_total() is total
+
+
+class TestInvalidacion:
+    def test_agregar_y_quitar_sillas(self, comedor, mesa):
+        comedor.calcular_precio_total()
+        comedor.agregar_silla(Silla("Extra", "Pino", "Blanco", 100.0))
+        assert comedor.calcular_precio_total() == _precio_esperado(
+            mesa, list(comedor.sillas)
+        )
+        comedor.quitar_silla()
+        comedor.quitar_silla(0)
+        assert comedor.calcular_precio_total() == _precio_esperado(
+            mesa, list(comedor.sillas)
+        )
+
+    def test_cambio_en_un_componente(self, comedor, mesa):
+        resumen = comedor.obtener_resumen()
+        descripcion = comedor.obtener_descripcion_completa()
+        comedor.sillas[0].precio_base = 500.0
+        assert comedor.obtener_resumen()["precio_sillas"] > resumen["precio_sillas"]
+        mesa.precio_base = 50.0
+        assert comedor.calcular_precio_total() == _precio_esperado(
+            mesa, list(comedor.sillas)
+        )
+        assert comedor.obtener_descripcion_completa() != descripcion
+
+    def test_silla_repetida_se_observa_una_vez(self, mesa):
+        silla = Silla("Única", "Pino", "Blanco", 100.0)
+        comedor = Comedor("C", mesa, [silla, silla])
+        assert silla._observadores == [comedor._invalidar]
+        comedor.quitar_silla()
+        silla.precio_base = 200.0
+        assert comedor.calcular_precio_total() == _precio_esperado(mesa, [silla])
+        comedor.quitar_silla()
+        assert silla._observadores == []
+
+
+class TestVistas:
+    def test_vista_sin_copia_y_de_solo_lectura(self, comedor):
+        vista = comedor.sillas
+        assert isinstance(vista, VistaSillas)
+        assert vista is comedor.sillas
+        comedor.agregar_silla(Silla("Extra", "Pino", "Blanco", 100.0))
+        assert len(vista) == 4
+        with pytest.raises(TypeError):
+            vista[0] = None
+
+    def test_lista_inicial_no_se_comparte(self, mesa):
+        sillas = _sillas(2)
+        comedor = Comedor("C", mesa, sillas)
+        sillas.append(Silla("Fuera", "Pino", "Blanco", 1.0))
+        assert len(comedor.sillas) == 2
+
+    def test_resumen_es_una_copia(self, comedor):
+        resumen = comedor.obtener_resumen()
+        resumen["materiales_utilizados"].append("Oro")
+        resumen["nombre"] = "Otro"
+        assert comedor.obtener_resumen()["nombre"] == "Familiar"
+        assert "Oro" not in comedor.obtener_resumen()["materiales_utilizados"]
@@ -0,0 +1,149 @@
+import copy
+import pickle
+
+import pytest
+
+from models.concretos.cama import Cama
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+from models.mueble import Mueble
+from services.catalogo import a_registro
+from services.precios import KERNELS
+
+
+class TestMueble:
+    def test_es_clase_abstracta(self):
+        with pytest.raises(TypeError):
+            Mueble("Mesa", "Madera", "Café", 100.0)
+
+    def test_precio_base_invalido(self, silla):
+        with pytest.raises(ValueError):
+            silla.precio_base = -1
+
+
+class TestPrecioMemoizado:
+    def test_guarda_el_precio(self, silla):
+        assert silla._precio_cache is None
+        precio = silla.calcular_precio()
+        assert silla._precio_cache == precio
+        assert silla.calcular_precio() == precio
+
+    @pytest.mark.parametrize(
+        "atributo, valor",
+        [
+            ("precio_base", 400.0),
+            ("material_tapizado", "cuero"),
+            ("tiene_respaldo", False),
+            ("altura_regulable", True),
+        ],
+    )
+    def test_setter_invalida(self, silla, atributo, valor):
+        silla.calcular_precio()
+        setattr(silla, atributo, valor)
+        assert silla._precio_cache is None
+        assert silla.calcular_precio() == type(silla).calcular_precio.__wrapped__(silla)
+
+    def test_atributo_sin_efecto_en_precio_no_invalida(self, silla):
+        silla.calcular_precio()
+        silla.color = "Negro"
+        assert silla._precio_cache is not None
+
+    def test_superficie_invalida_al_cambiar_dimensiones(self):
+        mesa = Mesa("Mesa", "Roble", "Natural", 500.0)
+        antes = mesa.calcular_precio()
+        mesa.largo = 300.0
+        assert mesa.calcular_precio() != antes
+
+    def test_llamada_a_super_no_usa_la_cache(self):
+        sofacama = SofaCama("Sofá Cama", "Tela", "Gris", 900)
+        precio = sofacama.calcular_precio()
+        # El precio de Sofa calculado desde SofaCama no se guarda como el propio
+        assert Sofa.calcular_precio(sofacama) != precio
+        assert sofacama.calcular_precio() == precio
+
+    def test_observadores_reciben_el_mueble(self, silla):
+        recibidos = []
+        silla._suscribir(recibidos.append)
+        silla.precio_base = 200.0
+        silla._desuscribir(recibidos.append)
+        silla.precio_base = 250.0
+        assert recibidos == [silla]
+
+    def test_instancias_independientes(self):
+        a = Silla("A", "Pino", "Azul", 100.0)
+        b = Silla("B", "Pino", "Azul", 100.0)
+        a.calcular_precio()
+        b.precio_base = 200.0
+        assert a.calcular_precio() == 110.0
+        assert b.calcular_precio() == 220.0
+
+
+class TestSlots:
+    @pytest.fixture(params=list(KERNELS), ids=lambda clase: clase.__name__)
+    def mueble(self, request):
+        clase = request.param
+        return clase(f"{clase.__name__} de prueba", "Roble", "Natural", 300.0)
+
+    def test_sin_dict_propio(self, mueble):
+        if isinstance(mueble, Cama) and type(mueble) is not Cama:
+            # SofaCama hereda el __dict__ de Cama, pero sus atributos son slots
+            assert vars(mueble) == {}
+        elif type(mueble) is Cama:
+            assert set(vars(mueble)) == {
+                "_tamaño",
+                "_incluye_colchon",
+                "_tiene_cabecera",
+            }
+        else:
+            assert not hasattr(mueble, "__dict__")
+            with pytest.raises(AttributeError):
+                mueble.atributo_inexistente = 1
+
+    def test_slots_sin_duplicados(self, mueble):
+        declarados = [
+            atributo
+            for clase in type(mueble).__mro__
+            for atributo in clase.__dict__.get("__slots__", ())
+        ]
+        assert len(declarados) == len(set(declarados))
+
+    def test_pickle_conserva_estado(self, mueble):
+        mueble.calcular_precio()
+        copia = pickle.loads(pickle.dumps(mueble))
+        assert type(copia) is type(mueble)
+        assert a_registro(copia) == a_registro(mueble)
+        assert copia.calcular_precio() == mueble.calcular_precio()
+
+    def test_copia_independiente(self, mueble):
+        copia = copy.deepcopy(mueble)
+        copia.precio_base = 1000.0
+        copia.color = "Negro"
+        assert mueble.precio_base == 300.0
+        assert mueble.color == "Natural"
+        assert copia.calcular_precio() != mueble.calcular_precio()
+
+
+class TestCopiaDeMueblesDeUnaTienda:
+    @pytest.fixture
+    def registrada(self, tienda, tmp_path):
+        tienda.habilitar_bitacora(str(tmp_path), fsync_ms=0)
+        return tienda
+
+    def test_deepcopy_no_copia_la_tienda(self, registrada, silla):
+        silla.calcular_precio()
+        version = registrada.version
+        copia = copy.deepcopy(silla)
+        assert copia._observadores is None
+        assert copia._precio_cache is None
+        copia.precio_base = 999.0
+        assert registrada.version == version
+        assert registrada.obtener_precio(silla) == silla.calcular_precio()
+        assert silla._observadores
+
+    def test_pickle_con_bitacora(self, registrada, silla):
+        copia = pickle.loads(pickle.dumps(silla))
+        assert a_registro(copia) == a_registro(silla)
+        assert copia._observadores is None
+        assert copia.calcular_precio() == silla.calcular_precio()
@@ -0,0 +1,71 @@
+import pytest
+
+from models.concretos.silla import Silla
+from models.concretos.sofa import Sofa
+from models.vocabulario import MATERIALES, TAPIZADOS, VACIO, Vocabulario
+from services.precios import cotizar
+
+
+class TestVocabulario:
+    def test_codigos_exactos_y_canonicos(self):
+        vocabulario = Vocabulario("prueba")
+        cuero = vocabulario.codificar("cuero")
+        mayusculas = vocabulario.codificar(" CUERO ")
+        assert cuero != mayusculas
+        assert vocabulario.valor(mayusculas) == " CUERO "
+        assert vocabulario.canonicos[mayusculas] == cuero
+        assert vocabulario.codificar("cuero") == cuero
+        assert vocabulario.buscar("Cuero") == cuero
+        assert vocabulario.buscar("lino") is None
+
+    def test_vacios_comparten_el_codigo_vacio(self):
+        vocabulario = Vocabulario("prueba")
+        assert vocabulario.codificar(None) == VACIO
+        assert vocabulario.clave("") == vocabulario.clave("  ") == VACIO
+
+    def test_textos_iniciales(self):
+        vocabulario = Vocabulario("prueba", ["b", "a"])
+        assert vocabulario.codificar("b") == 0
+        assert vocabulario.codificar("a") == 1
+        assert vocabulario.textos() == ["b", "a"]
+        assert Vocabulario("prueba").textos() == [None]
+
+    def test_instancias_comparten_codigos(self):
+        a = Silla("A", "Roble", "Azul", 100.0)
+        b = Silla("B", "Roble", "Rojo", 100.0)
+        assert a._material == b._material == MATERIALES.codificar("Roble")
+        c = Silla("C", "roble ", "Azul", 1.0)
+        assert a.clave("material") == c.clave("material")
+
+
+class TestTapizado:
+    @pytest.mark.parametrize(
+        "tapizado, extra",
+        [
+            ("cuero", 0.2),
+            ("Cuero", 0.2),
+            ("TELA", 0.1),
+            (" cuero ", 0.0),
+            ("tela ", 0.0),
+            ("lino", 0.0),
+            ("", 0.0),
+            (None, 0.0),
+        ],
+    )
+    def test_extra_de_comodidad(self, tapizado, extra):
+        sofa = Sofa("Sofá", "Tela", "Gris", 1000.0, material_tapizado=tapizado)
+        sin_tapizado = Sofa("Sofá", "Tela", "Gris", 1000.0)
+        esperado = sin_tapizado.calcular_factor_comodidad() + extra
+        assert sofa.calcular_factor_comodidad() == pytest.approx(esperado)
+        assert cotizar([sofa]) == [sofa.calcular_precio()]
+
+    def test_setter_recalcula(self):
+        silla = Silla("Silla", "Pino", "Azul", 100.0, material_tapizado=" cuero ")
+        antes = silla.calcular_precio()
+        silla.material_tapizado = "cuero"
+        assert silla.calcular_precio() > antes
+        assert silla.material_tapizado == "cuero"
+        assert TAPIZADOS.valor(silla._material_tapizado) == "cuero"
+
+    def test_filtro_normaliza(self, tienda, sofa):
+        assert tienda.filtrar_por_tapizado(" CUERO ") == [sofa]
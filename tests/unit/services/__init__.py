@@ -0,0 +1 @@
+# necesario para que Python trate el directorio tests como un paquete
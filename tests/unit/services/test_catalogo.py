@@ -0,0 +1,178 @@
+import json
+
+import pytest
+
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sofacama import SofaCama
+from services.catalogo import (
+    Catalogo,
+    a_registro,
+    cargar_catalogo,
+    crear_mueble,
+    leer_csv,
+    leer_jsonl,
+)
+from services.tienda import TiendaMuebles
+
+
+def _silla(i):
+    return {
+        "tipo": "silla",
+        "nombre": f"S{i}",
+        "material": "Pino",
+        "color": "Azul",
+        "precio_base": 80 + i,
+    }
+
+
+class TestRegistros:
+    def test_crear_mueble_convierte_tipos(self):
+        mueble = crear_mueble(
+            {
+                "tipo": " Silla ",
+                "nombre": "S",
+                "material": "Pino",
+                "color": "Azul",
+                "precio_base": "120.5",
+                "tiene_ruedas": "sí",
+                "altura_regulable": "",
+            }
+        )
+        assert isinstance(mueble, Silla)
+        assert mueble.precio_base == 120.5
+        assert mueble.tiene_ruedas is True
+        assert mueble.altura_regulable is False
+
+    def test_errores_de_registro(self):
+        with pytest.raises(ValueError, match="desconocido"):
+            crear_mueble({"tipo": "nave"})
+        with pytest.raises(ValueError, match="precio_base"):
+            crear_mueble({"tipo": "mesa", "nombre": "M", "material": "Roble", "color": "Café"})
+
+    def test_a_registro_ida_y_vuelta(self):
+        sofacama = SofaCama("SC", "Tela", "Gris", 900, mecanismo_conversion="hidraulico")
+        copia = crear_mueble(a_registro(sofacama))
+        assert a_registro(copia) == a_registro(sofacama)
+        assert copia.calcular_precio() == sofacama.calcular_precio()
+
+    def test_a_registro_incluye_atributos_de_estado(self):
+        sofacama = SofaCama("SC", "Tela", "Gris", 900)
+        sofacama.convertir_a_cama()
+        registro = a_registro(sofacama)
+        assert registro["modo_actual"] == "cama"
+        assert crear_mueble(registro).modo_actual == "cama"
+        with pytest.raises(ValueError, match="modo"):
+            crear_mueble({**registro, "modo_actual": "litera"})
+
+
+class TestCargaMasiva:
+    def test_csv(self, tmp_path):
+        ruta = tmp_path / "catalogo.csv"
+        ruta.write_text(
+            "tipo,nombre,material,color,precio_base,forma\n"
+            "mesa,Mesa A,Roble,Café,300,redonda\n"
+            "silla,Silla A,Pino,Azul,80,\n",
+            encoding="utf-8",
+        )
+        muebles = list(leer_csv(str(ruta)))
+        assert [type(m) for m in muebles] == [Mesa, Silla]
+        assert muebles[0].forma == "redonda"
+
+    def test_jsonl_registra_lineas_invalidas(self, tmp_path):
+        ruta = tmp_path / "catalogo.jsonl"
+        lineas = [
+            json.dumps(_silla(0)),
+            "",
+            "{no es json",
+            json.dumps({"tipo": "nave", "nombre": "N"}),
+        ]
+        ruta.write_text("\n".join(lineas), encoding="utf-8")
+        errores = []
+        muebles = list(leer_jsonl(str(ruta), errores))
+        assert len(muebles) == 1
+        assert [linea for linea, _ in errores] == [3, 4]
+        with pytest.raises(ValueError, match="Línea 3"):
+            list(leer_jsonl(str(ruta)))
+
+    def test_cargar_catalogo_por_lotes(self, tmp_path):
+        ruta = tmp_path / "catalogo.jsonl"
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            for i in range(25):
+                archivo.write(json.dumps(_silla(i)) + "\n")
+        tienda = TiendaMuebles()
+        totales = cargar_catalogo(tienda, str(ruta), tam_lote=10)
+        assert totales == {"agregados": 25, "rechazados": 0}
+        assert tienda.obtener_estadisticas()["total_muebles"] == 25
+
+    def test_formato_no_soportado(self, tmp_path):
+        with pytest.raises(ValueError, match="no soportado"):
+            cargar_catalogo(TiendaMuebles(), str(tmp_path / "catalogo.xml"))
+
+
+class TestCatalogo:
+    @pytest.fixture
+    def catalogo(self):
+        return Catalogo()
+
+    def test_tiendas_comparten_definiciones(self, catalogo):
+        primera = TiendaMuebles("A", catalogo=catalogo)
+        segunda = TiendaMuebles("B", catalogo=catalogo)
+        primera.agregar_mueble(Silla("Silla", "Pino", "Azul", 80.0))
+        segunda.agregar_mueble(Silla("Silla", "Pino", "Azul", 80.0))
+        assert primera._inventario[0] is segunda._inventario[0]
+        assert len(catalogo) == 1
+
+    def test_mismo_producto_suma_existencias(self, catalogo):
+        tienda = TiendaMuebles(catalogo=catalogo)
+        tienda.agregar_mueble(Silla("Silla", "Pino", "Azul", 80.0))
+        tienda.agregar_mueble(Silla("Silla", "Pino", "Azul", 80.0), cantidad=2)
+        resultado = tienda.agregar_muebles(
+            [Silla("Silla", "Pino", "Azul", 80.0), Mesa("Mesa", "Roble", "Café", 300.0)]
+        )
+        assert resultado == {"agregados": 2, "rechazados": 0}
+        assert len(tienda._inventario) == 2
+        assert tienda.obtener_existencias(1) == 4
+
+    def test_mueble_invalido_no_se_registra(self, catalogo):
+        tienda = TiendaMuebles(catalogo=catalogo)
+        gratis = Silla("Gratis", "Pino", "Azul", 0.0)
+        assert tienda.agregar_mueble(gratis).startswith("Error")
+        resultado = tienda.agregar_muebles([Silla("Otra gratis", "Pino", "Azul", 0.0)])
+        assert resultado == {"agregados": 0, "rechazados": 1}
+        assert len(catalogo) == 0
+        assert gratis not in catalogo
+        assert catalogo.indice_nombres.buscar("gratis") == []
+
+    def test_mueble_sin_registro_no_se_registra(self, catalogo, tmp_path):
+        class SillaPropia(Silla):
+            __slots__ = ()
+
+        tienda = TiendaMuebles(catalogo=catalogo)
+        tienda.habilitar_bitacora(str(tmp_path))
+        resultado = tienda.agregar_mueble(SillaPropia("A", "Pino", "Azul", 80.0))
+        assert resultado.startswith("Error")
+        assert tienda.agregar_muebles([SillaPropia("B", "Pino", "Azul", 80.0)]) == {
+            "agregados": 0,
+            "rechazados": 1,
+        }
+        assert len(catalogo) == 0
+        tienda.cerrar()
+
+    def test_descripcion_en_cache_hasta_que_cambia(self, catalogo):
+        silla = catalogo.registrar(Silla("Silla", "Pino", "Azul", 80.0))
+        descripcion = catalogo.descripcion(silla)
+        assert catalogo.descripcion(silla) is descripcion
+        silla.color = "Rojo"
+        assert "Rojo" in catalogo.descripcion(silla)
+
+    def test_cambio_de_definicion_reindexa(self, catalogo):
+        tienda = TiendaMuebles(catalogo=catalogo)
+        silla = Silla("Silla Azul", "Pino", "Azul", 80.0)
+        tienda.agregar_mueble(silla)
+        silla.nombre = "Banqueta"
+        assert tienda.buscar_muebles_por_nombre("banq") == [silla]
+        assert tienda.buscar_muebles_por_nombre("azul") == []
+        # La definición modificada ya no coincide con el producto original
+        otra = Silla("Silla Azul", "Pino", "Azul", 80.0)
+        assert catalogo.registrar(otra) is otra
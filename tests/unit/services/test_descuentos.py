@@ -0,0 +1,139 @@
+import pytest
+
+from models.categorias.asientos import Asiento
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sillon import Sillon
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+from models.mueble import Mueble
+from services.descuentos import (
+    ACUMULATIVO,
+    MAXIMO,
+    MotorDescuentos,
+    ReglaDescuento,
+    regla_desde_registro,
+    resolver_categoria,
+)
+
+
+class TestResolverCategoria:
+    @pytest.mark.parametrize(
+        "nombre, clase",
+        [
+            ("silla", Silla),
+            ("Sillas", Silla),
+            ("Sofás", Sofa),
+            ("sillón", Sillon),
+            ("Sillones", Sillon),
+            ("asientos", Asiento),
+            ("SofaCama", SofaCama),
+            ("todo", Mueble),
+        ],
+    )
+    def test_nombres_y_plurales(self, nombre, clase):
+        assert resolver_categoria(nombre) is clase
+
+    @pytest.mark.parametrize(
+        "nombre", ["sillax", "mesazz", "mesaes", "sillone", "", "s"]
+    )
+    def test_rechaza_terminaciones_que_no_son_plural(self, nombre):
+        assert resolver_categoria(nombre) is None
+
+
+class TestReglaDescuento:
+    def test_porcentaje_fuera_de_rango(self):
+        with pytest.raises(ValueError):
+            ReglaDescuento(Silla, 0)
+        with pytest.raises(ValueError):
+            ReglaDescuento(Silla, 1.5)
+
+    def test_condiciones(self):
+        regla = ReglaDescuento(Silla, 0.1, "Madera", precio_min=100, precio_max=200)
+        assert regla.condicional
+        assert regla.cumple("madera", 150)
+        assert not regla.cumple("pino", 150)
+        assert not regla.cumple("madera", 250)
+        assert regla.etiqueta() == "Silla [madera, $100-$200]"
+
+    def test_registro(self):
+        regla = ReglaDescuento(Asiento, 0.2, precio_max=500)
+        copia = regla_desde_registro(regla.a_registro())
+        assert copia.clave == regla.clave
+        assert copia.porcentaje == regla.porcentaje
+
+
+class TestMotorDescuentos:
+    @pytest.fixture
+    def sofacama(self):
+        return SofaCama("Sofá Cama", "Tela", "Gris", 1000)
+
+    def test_reglas_alcanzan_subclases(self, sofacama):
+        motor = MotorDescuentos()
+        motor.agregar_regla(ReglaDescuento(Asiento, 0.1))
+        assert motor.descuento(sofacama, 1000) == 0.1
+        assert motor.descuento(Mesa("Mesa", "Roble", "Café", 100), 100) == 0
+
+    def test_politicas(self, sofacama):
+        motor = MotorDescuentos()
+        motor.agregar_regla(ReglaDescuento(Asiento, 0.3))
+        motor.agregar_regla(ReglaDescuento(Sofa, 0.1))
+        assert motor.descuento(sofacama, 1000) == 0.1
+        motor.politica = MAXIMO
+        assert motor.descuento(sofacama, 1000) == 0.3
+        motor.politica = ACUMULATIVO
+        assert motor.descuento(sofacama, 1000) == pytest.approx(1 - 0.7 * 0.9)
+
+    def test_politica_desconocida(self):
+        with pytest.raises(ValueError):
+            MotorDescuentos("la_mejor")
+
+    def test_reglas_condicionales(self, silla):
+        motor = MotorDescuentos()
+        motor.agregar_regla(ReglaDescuento(Silla, 0.25, material="madera"))
+        assert motor.condicional
+        assert motor.descuento_clase(Silla) is None
+        assert motor.descuento(silla, 150) == 0.25
+        assert motor.descuento_atributos(Silla, "pino", 150) == 0
+
+    def test_tabla_se_invalida_al_cambiar_reglas(self, silla):
+        motor = MotorDescuentos()
+        motor.agregar_regla(ReglaDescuento(Silla, 0.1))
+        version = motor.version
+        assert motor.descuento_clase(Silla) == 0.1
+        motor.agregar_regla(ReglaDescuento(Silla, 0.2))
+        assert motor.version != version
+        assert motor.descuento_clase(Silla) == 0.2
+        assert motor.quitar_regla(ReglaDescuento(Silla, 0.2).clave)
+        assert motor.descuento_clase(Silla) == 0
+
+    def test_aplicar(self, silla, mesa):
+        motor = MotorDescuentos()
+        motor.agregar_regla(ReglaDescuento(Silla, 0.1))
+        assert motor.aplicar([silla, mesa], [100.0, 50.0]) == [90.0, 50.0]
+
+    def test_desde_registro_anterior(self):
+        motor = MotorDescuentos.desde_registro({"Silla": 0.1, "Inexistente": 0.5})
+        assert motor.resumen() == {"Silla": 0.1}
+
+    def test_copiar_es_independiente(self):
+        motor = MotorDescuentos()
+        motor.agregar_regla(ReglaDescuento(Silla, 0.1))
+        copia = motor.copiar()
+        copia.agregar_regla(ReglaDescuento(Mesa, 0.2))
+        assert len(motor.reglas()) == 1
+        assert copia.a_registro()["reglas"][0] == motor.a_registro()["reglas"][0]
+
+
+class TestDescuentosDeLaTienda:
+    def test_categoria_desconocida(self, tienda):
+        assert tienda.aplicar_descuento("sillax", 10).startswith("Error")
+
+    def test_porcentaje_invalido(self, tienda):
+        assert tienda.aplicar_descuento("silla", 0).startswith("Error")
+
+    def test_precio_con_descuento(self, tienda, silla):
+        tienda.aplicar_descuento("asientos", 20)
+        assert tienda.precios_con_descuento([silla]) == [
+            round(silla.calcular_precio() * 0.8, 2)
+        ]
@@ -0,0 +1,165 @@
+from models.categorias.asientos import Asiento
+from models.concretos.armario import Armario
+from models.concretos.cama import Cama
+from models.concretos.silla import Silla
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+from models.mueble import Mueble
+from services.indices import IndiceAtributo, IndicePrecios, IndiceTipos, IndiceTrigramas, normalizar_texto
+
+
+def _sillas(precios):
+    return [Silla(f"Silla {precio}", "Pino", "Azul", precio) for precio in precios]
+
+
+class TestIndicePrecios:
+    def test_rango_inclusivo_y_ordenado(self):
+        indice = IndicePrecios()
+        sillas = _sillas([300, 100, 200, 200])
+        for clave, silla in enumerate(sillas):
+            indice.agregar(silla.precio_base, clave, silla)
+        assert indice.rango(100, 200) == [sillas[1], sillas[2], sillas[3]]
+        assert indice.rango(201, 299) == []
+        assert indice.minimo() is sillas[1]
+        assert indice.maximo() is sillas[0]
+
+    def test_quitar_entrada_exacta(self):
+        indice = IndicePrecios()
+        sillas = _sillas([200, 200])
+        for clave, silla in enumerate(sillas):
+            indice.agregar(200, clave, silla)
+        assert indice.quitar(200, 1)
+        assert not indice.quitar(200, 1)
+        assert indice.rango(0, 1000) == [sillas[0]]
+
+    def test_agregar_lote_equivale_a_inserciones(self):
+        sillas = _sillas(range(100, 120))
+        uno_a_uno = IndicePrecios()
+        lote = IndicePrecios()
+        for clave, silla in enumerate(sillas):
+            uno_a_uno.agregar(silla.precio_base, clave, silla)
+        lote.agregar_lote((s.precio_base, c, s) for c, s in reversed(list(enumerate(sillas))))
+        assert list(lote.ascendente()) == list(uno_a_uno.ascendente())
+        assert list(lote.descendente()) == sillas[::-1]
+
+
+class TestFiltrarPorPrecio:
+    def test_filtra_con_el_precio_calculado(self, tienda, muebles):
+        precios = sorted(m.calcular_precio() for m in muebles)
+        resultado = tienda.filtrar_por_precio(precios[1], precios[2])
+        assert [m.calcular_precio() for m in resultado] == precios[1:3]
+
+    def test_precio_min_negativo_se_ignora(self, tienda, muebles):
+        assert len(tienda.filtrar_por_precio(-50)) == len(muebles)
+
+    def test_sigue_al_mueble_modificado(self, tienda, silla):
+        silla.precio_base = 10_000
+        assert tienda.obtener_mas_costoso() is silla
+        assert silla not in tienda.filtrar_por_precio(0, 1000)
+
+    def test_iterar_por_precio(self, tienda, muebles):
+        esperado = sorted(muebles, key=lambda m: m.calcular_precio())
+        assert list(tienda.iterar_por_precio()) == esperado
+        assert list(tienda.iterar_por_precio(descendente=True)) == esperado[::-1]
+
+
+class TestIndiceTrigramas:
+    def test_normalizar_texto(self):
+        assert normalizar_texto("  Sofá CÓMODO ") == "sofa comodo"
+        assert normalizar_texto(None) == ""
+
+    def test_busca_subcadenas_sin_tildes(self):
+        indice = IndiceTrigramas()
+        sillas = [Silla(n, "Pino", "Azul", 100) for n in ("Sofá Cama", "Mesa", "Sofacama")]
+        for clave, silla in enumerate(sillas):
+            indice.agregar(clave, silla.nombre, silla)
+        assert indice.buscar("SOFA") == [sillas[0], sillas[2]]
+        assert indice.buscar("a c") == [sillas[0]]
+        assert indice.buscar("xyz") == []
+        assert indice.buscar("") == []
+
+    def test_consultas_cortas_recorren_los_textos(self):
+        indice = IndiceTrigramas()
+        silla = Silla("Mesa", "Pino", "Azul", 100)
+        indice.agregar(1, silla.nombre, silla)
+        assert indice.buscar("es") == [silla]
+
+    def test_quitar_limpia_las_publicaciones(self):
+        indice = IndiceTrigramas()
+        silla = Silla("Mesa", "Pino", "Azul", 100)
+        indice.agregar(1, silla.nombre, silla)
+        assert indice.quitar(1)
+        assert not indice.quitar(1)
+        assert indice.buscar("mesa") == []
+        assert indice._publicaciones == {}
+
+
+class TestBuscarPorNombre:
+    def test_busqueda_en_tienda(self, tienda, sofa):
+        assert tienda.buscar_muebles_por_nombre("sofa") == [sofa]
+        assert tienda.buscar_muebles_por_nombre("   ") == []
+
+    def test_renombrar_reindexa(self, tienda, sofa):
+        sofa.nombre = "Diván"
+        assert tienda.buscar_muebles_por_nombre("sofa") == []
+        assert tienda.buscar_muebles_por_nombre("divan") == [sofa]
+
+
+class TestIndiceAtributo:
+    def test_cubos_por_valor_normalizado(self):
+        indice = IndiceAtributo("material")
+        sillas = [Silla(f"S{i}", m, "Azul", 100) for i, m in enumerate(["Pino", " pino", "Roble"])]
+        for clave, silla in enumerate(sillas):
+            indice.agregar(clave, silla)
+        assert indice.buscar("PINO") == sillas[:2]
+        assert indice.buscar("haya") == []
+        assert indice.estadisticas()["tamaños"] == {"pino": 2, "roble": 1}
+
+    def test_valores_vacios_no_se_indexan(self):
+        indice = IndiceAtributo("material_tapizado")
+        indice.agregar(1, Silla("S", "Pino", "Azul", 100))
+        assert len(indice) == 0
+
+    def test_actualizar_mueve_de_cubo(self):
+        indice = IndiceAtributo("color")
+        silla = Silla("S", "Pino", "Azul", 100)
+        indice.agregar(1, silla)
+        silla.color = "Rojo"
+        indice.actualizar(1, silla)
+        assert indice.buscar("azul") == []
+        assert indice.buscar("rojo") == [silla]
+
+
+class TestFiltrosPorAtributo:
+    def test_filtros_de_tienda(self, tienda, silla, sofa):
+        assert tienda.filtrar_por_material("MADERA") == [silla]
+        assert tienda.filtrar_por_color("gris") == [sofa]
+        assert tienda.filtrar_por_tapizado("cuero") == [sofa]
+        assert tienda.filtrar_por_material("") == []
+
+    def test_filtros_tras_cambiar_atributo(self, tienda, silla):
+        silla.material_tapizado = "cuero"
+        assert silla in tienda.filtrar_por_tapizado("cuero")
+        assert tienda.filtrar_por_tapizado("tela") == []
+
+
+class TestIndiceTipos:
+    def test_tipos_a_lo_largo_del_mro(self):
+        indice = IndiceTipos()
+        silla = Silla("S", "Pino", "Azul", 100)
+        sofacama = SofaCama("SC", "Tela", "Gris", 900)
+        indice.agregar(1, silla)
+        indice.agregar(2, sofacama)
+        assert indice.buscar(Asiento) == [silla, sofacama]
+        assert indice.buscar(Cama) == [sofacama]
+        assert indice.buscar(Sofa) == [sofacama]
+        assert indice.contar(Mueble) == 2
+        indice.quitar(2, sofacama)
+        assert indice.buscar(Cama) == []
+        assert indice.contar(Asiento) == 1
+
+    def test_obtener_muebles_por_tipo(self, tienda, silla, sofa, armario):
+        assert tienda.obtener_muebles_por_tipo(Asiento) == [silla, sofa]
+        assert tienda.obtener_muebles_por_tipo(Armario) == [armario]
+        assert len(tienda.obtener_muebles_por_tipo(Mueble)) == 4
+        assert tienda.obtener_muebles_por_tipo("Silla") == []
@@ -0,0 +1,137 @@
+import pytest
+
+from models.concretos.silla import Silla
+from services.inventario import InventarioColumnar
+
+
+@pytest.fixture
+def inventario(muebles):
+    inventario = InventarioColumnar()
+    for mueble in muebles:
+        inventario.agregar(mueble, mueble.calcular_precio())
+    return inventario
+
+
+class TestInventarioColumnar:
+    def test_agregar_asigna_skus_consecutivos(self, inventario, muebles):
+        assert [inventario.sku_de(m) for m in muebles] == [1, 2, 3, 4]
+        assert len(inventario) == 4
+        assert all(m in inventario for m in muebles)
+
+    def test_columnas_paralelas(self, inventario, muebles):
+        for sku, mueble, precio, existencias in inventario.entradas():
+            assert inventario.obtener(sku) is mueble
+            assert precio == mueble.calcular_precio()
+            assert existencias == 1
+
+    def test_quitar_mueve_el_ultimo_al_hueco(self, inventario, muebles):
+        silla, mesa, sofa, armario = muebles
+        assert inventario.quitar_sku(1) is silla
+        assert list(inventario) == [armario, mesa, sofa]
+        assert silla not in inventario
+        assert inventario.obtener(1) is None
+        # Los SKUs restantes siguen apuntando a su mueble
+        assert inventario.obtener(4) is armario
+        assert inventario.precio(armario) == armario.calcular_precio()
+
+    def test_quitar_sku_inexistente(self, inventario):
+        assert inventario.quitar_sku(99) is None
+        assert len(inventario) == 4
+
+    def test_agregados_se_mantienen(self, inventario, muebles):
+        esperado = round(sum(m.calcular_precio() for m in muebles), 2)
+        assert inventario.valor_total() == esperado
+        inventario.quitar(muebles[0])
+        assert inventario.valor_total() == round(esperado - muebles[0].calcular_precio(), 2)
+        assert "Silla" not in inventario.conteo_por_tipo()
+        assert "Silla" not in inventario.valor_por_tipo()
+
+    def test_cambio_en_mueble_actualiza_columnas(self, inventario, muebles):
+        silla = muebles[0]
+        version = inventario.version
+        silla.precio_base = 300.0
+        assert inventario.version > version
+        assert inventario.precio(silla) == silla.calcular_precio()
+        assert inventario.valor_por_tipo()["Silla"] == silla.calcular_precio()
+
+    def test_columnas_codificadas_siguen_los_cambios(self, inventario, muebles):
+        silla = muebles[0]
+        silla.material = "Vidrio"
+        tipos, materiales, nombres_tipo, normalizados = inventario.columnas_codificadas()
+        posicion = list(inventario).index(silla)
+        assert nombres_tipo[tipos[posicion]] == "Silla"
+        assert normalizados[materiales[posicion]] == "vidrio"
+
+    def test_mueble_quitado_deja_de_observarse(self, inventario, muebles):
+        silla = muebles[0]
+        inventario.quitar(silla)
+        version = inventario.version
+        silla.precio_base = 300.0
+        assert inventario.version == version
+
+    def test_siguiente_sku_no_retrocede(self, inventario):
+        inventario.siguiente_sku = 2
+        assert inventario.siguiente_sku == 5
+        inventario.siguiente_sku = 10
+        assert inventario.agregar(Silla("Nueva", "Pino", "Azul", 80.0), 80.0) == 10
+
+    def test_agregar_lote_respeta_skus(self):
+        inventario = InventarioColumnar()
+        sillas = [Silla(f"Silla {i}", "Pino", "Azul", 80.0 + i) for i in range(3)]
+        skus = inventario.agregar_lote(
+            (silla, silla.calcular_precio(), sku, 1) for silla, sku in zip(sillas, (7, None, 3))
+        )
+        assert skus == [7, 8, 3]
+        assert inventario.siguiente_sku == 9
+        assert [m.nombre for m in inventario.filtrar_por_precio(0, 1000)] == [
+            "Silla 0",
+            "Silla 1",
+            "Silla 2",
+        ]
+
+
+class TestExistencias:
+    def test_agregar_con_cantidad(self, silla):
+        inventario = InventarioColumnar()
+        sku = inventario.agregar(silla, silla.calcular_precio(), cantidad=5)
+        assert len(inventario) == 1
+        assert inventario.existencias(sku) == 5
+        assert inventario.unidades() == 5
+        assert inventario.valor_total() == pytest.approx(silla.calcular_precio() * 5)
+        assert inventario.conteo_por_tipo() == {"Silla": 5}
+
+    def test_retirar_descuenta_y_quita_en_cero(self, inventario, silla):
+        sku = inventario.sku_de(silla)
+        inventario.reponer(sku, 2)
+        assert inventario.retirar(sku, 2) is silla
+        assert inventario.existencias(sku) == 1
+        assert inventario.retirar(sku) is silla
+        assert silla not in inventario
+        assert inventario.existencias(sku) == 0
+        assert inventario.retirar(sku) is None
+
+    def test_retirar_mas_de_lo_disponible(self, inventario, silla):
+        with pytest.raises(ValueError):
+            inventario.retirar(inventario.sku_de(silla), 2)
+        with pytest.raises(ValueError):
+            inventario.reponer(inventario.sku_de(silla), 0)
+        assert inventario.existencias(inventario.sku_de(silla)) == 1
+
+    def test_agregados_ponderados_por_existencias(self, inventario, muebles):
+        silla, mesa = muebles[:2]
+        inventario.reponer(inventario.sku_de(mesa), 3)
+        inventario.retirar(inventario.sku_de(silla))
+        esperado = sum(m.calcular_precio() for m in muebles[1:])
+        esperado += mesa.calcular_precio() * 3
+        assert inventario.valor_total() == pytest.approx(esperado)
+        assert inventario.unidades() == sum(inventario.cantidades()) == 6
+
+
+class TestAccesoPorPosicion:
+    def test_indices_y_rangos(self, inventario, muebles):
+        assert inventario[0] is muebles[0]
+        assert inventario[-1] is muebles[-1]
+        assert inventario[1:3] == muebles[1:3]
+        assert inventario[::-1] == muebles[::-1]
+        with pytest.raises(IndexError):
+            inventario[4]
@@ -0,0 +1,109 @@
+import inspect
+import random
+
+import pytest
+
+from models.concretos.silla import Silla
+from models.mueble import memoizar_precio
+from services.catalogo import parametros_constructor
+from services.precios import KERNELS, atributos_kernel, cotizar, cotizar_columnas
+
+INSTANCIAS_POR_CLASE = 2000
+
+VALORES_TEXTO = {
+    "material_tapizado": [None, "", "tela", "Tela", "cuero", " CUERO ", "lino"],
+    "forma": ["rectangular", "Rectangular", "redonda", "cuadrada", "L"],
+    "tamaño": ["individual", "matrimonial", "Queen", "queen", "king", "otro"],
+    "tamaño_cama": ["individual", "matrimonial", "Queen", "queen", "king", "otro"],
+    "mecanismo_conversion": ["plegable", "hidraulico", "electrico", "extensible"],
+}
+
+
+def _valor_aleatorio(rnd, parametro):
+    nombre = parametro.name
+    if nombre == "precio_base":
+        return rnd.choice([rnd.randint(1, 5000), round(rnd.uniform(1, 5000), 2)])
+    if nombre in VALORES_TEXTO:
+        return rnd.choice(VALORES_TEXTO[nombre])
+    if nombre in ("largo", "ancho", "altura"):
+        return round(rnd.uniform(0.5, 400), rnd.randint(0, 3))
+    if parametro.annotation is bool:
+        return rnd.random() < 0.5
+    if parametro.annotation is int:
+        return rnd.randint(1, 12)
+    if parametro.annotation is float:
+        return round(rnd.uniform(0, 100), 2)
+    return f"{nombre}-{rnd.randint(0, 999)}"
+
+
+def _instancias(clase, n, semilla=2024):
+    rnd = random.Random(semilla)
+    muebles = []
+    for i in range(n):
+        argumentos = {"nombre": f"{clase.__name__} {i}"}
+        for parametro in parametros_constructor(clase):
+            if parametro.name == "nombre":
+                continue
+            if parametro.default is inspect.Parameter.empty or rnd.random() < 0.8:
+                argumentos[parametro.name] = _valor_aleatorio(rnd, parametro)
+        muebles.append(clase(**argumentos))
+    return muebles
+
+
+@pytest.mark.parametrize("clase", list(KERNELS), ids=lambda clase: clase.__name__)
+class TestKernels:
+    def test_identico_a_calcular_precio(self, clase):
+        muebles = _instancias(clase, INSTANCIAS_POR_CLASE)
+        esperados = [mueble.calcular_precio() for mueble in muebles]
+        obtenidos = cotizar(muebles)
+        for mueble, esperado, obtenido in zip(muebles, esperados, obtenidos):
+            assert (obtenido, type(obtenido)) == (esperado, type(esperado)), mueble
+
+    def test_columnas(self, clase):
+        muebles = _instancias(clase, 200, semilla=7)
+        columnas = {
+            atributo: [getattr(mueble, atributo) for mueble in muebles]
+            for atributo in atributos_kernel(clase)
+        }
+        assert cotizar_columnas(clase, columnas) == [
+            mueble.calcular_precio() for mueble in muebles
+        ]
+
+    def test_memoizar(self, clase):
+        muebles = _instancias(clase, 50, semilla=11)
+        precios = cotizar(muebles, memoizar=True)
+        assert [mueble._precio_cache for mueble in muebles] == precios
+
+
+class TestCotizar:
+    def test_mezcla_clases_y_conserva_orden(self, muebles):
+        assert cotizar(list(reversed(muebles))) == [
+            mueble.calcular_precio() for mueble in reversed(muebles)
+        ]
+
+    def test_clase_sin_kernel_usa_calcular_precio(self, silla):
+        class SillaEspecial(Silla):
+            __slots__ = ()
+
+            def calcular_precio(self):
+                return 1.0
+
+        especial = SillaEspecial("Especial", "Pino", "Rojo", 10.0)
+        assert cotizar([especial, silla], memoizar=True) == [
+            1.0,
+            silla.calcular_precio(),
+        ]
+
+    def test_memoizar_precio_respeta_clases_sin_memoizacion(self):
+        class SillaEspecial(Silla):
+            __slots__ = ()
+
+            def calcular_precio(self):
+                return 1.0
+
+        especial = SillaEspecial("Especial", "Pino", "Rojo", 10.0)
+        memoizar_precio(especial, 99.0)
+        assert especial._precio_cache is None
+        silla = Silla("Silla", "Pino", "Rojo", 10.0)
+        memoizar_precio(silla, 99.0)
+        assert silla.calcular_precio() == 99.0
@@ -0,0 +1,94 @@
+import io
+
+import pytest
+
+from models.concretos.silla import Silla
+
+
+@pytest.fixture
+def tienda_grande(tienda):
+    for i in range(25):
+        tienda.agregar_mueble(Silla(f"Silla {i}", "Pino", "Azul", 50.0 + i))
+    tienda.aplicar_descuento("silla", 10)
+    return tienda
+
+
+class TestReporteInventario:
+    def test_lineas_terminadas_en_salto(self, tienda_grande):
+        lineas = list(tienda_grande.iterar_reporte_inventario(detallado=True))
+        assert all(linea.endswith("\n") for linea in lineas)
+        assert "".join(lineas) == tienda_grande.generar_reporte_inventario(True)
+
+    def test_contenido(self, tienda_grande, silla):
+        reporte = tienda_grande.generar_reporte_inventario(detallado=True)
+        assert "Total de muebles: 29\n" in reporte
+        assert "- Silla: 26 unidades\n" in reporte
+        assert "DESCUENTOS ACTIVOS:\n" in reporte
+        sku = tienda_grande.obtener_sku(silla)
+        assert f"- [{sku}] Silla: Silla Clásica - ${silla.calcular_precio():.2f}\n" in reporte
+
+    def test_sin_detalle_no_lista_muebles(self, tienda_grande):
+        assert "DETALLE POR MUEBLE" not in tienda_grande.generar_reporte_inventario()
+
+    def test_unidades_en_el_detalle(self, tienda, mesa):
+        tienda.reponer_existencias(tienda.obtener_sku(mesa), 2)
+        assert " x 3\n" in tienda.generar_reporte_inventario(detallado=True)
+
+
+class TestEscribirReporte:
+    def test_igual_al_reporte_completo(self, tienda_grande):
+        destino = io.StringIO()
+        total = tienda_grande.escribir_reporte_inventario(
+            destino, detallado=True, lineas_por_bloque=7
+        )
+        assert destino.getvalue() == tienda_grande.generar_reporte_inventario(True)
+        assert total == len(list(tienda_grande.iterar_reporte_inventario(True)))
+
+    def test_progreso_por_bloque(self, tienda_grande):
+        avances = []
+        total = tienda_grande.escribir_reporte_inventario(
+            io.StringIO(),
+            detallado=True,
+            lineas_por_bloque=10,
+            progreso=lambda hechas, estimado: avances.append((hechas, estimado)),
+        )
+        assert [hechas for hechas, _ in avances] == list(range(10, total, 10)) + [total]
+        assert all(hechas <= estimado for hechas, estimado in avances)
+        assert avances[-1] == (total, total)
+
+    def test_progreso_puede_interrumpir(self, tienda_grande):
+        destino = io.StringIO()
+
+        def detener(hechas, estimado):
+            raise InterruptedError
+
+        with pytest.raises(InterruptedError):
+            tienda_grande.escribir_reporte_inventario(
+                destino, detallado=True, lineas_por_bloque=5, progreso=detener
+            )
+        lineas = list(tienda_grande.iterar_reporte_inventario(True))
+        assert destino.getvalue() == "".join(lineas[:5])
+
+
+class TestInstantaneaReporte:
+    def test_no_ve_cambios_posteriores(self, tienda_grande, silla):
+        esperado = tienda_grande.generar_reporte_inventario(detallado=True)
+        instantanea = tienda_grande.instantanea_reporte(detallado=True)
+        tienda_grande.realizar_venta(silla)
+        tienda_grande.agregar_mueble(Silla("Nueva", "Pino", "Azul", 80.0))
+        destino = io.StringIO()
+        tienda_grande.escribir_reporte_inventario(
+            destino, detallado=True, instantanea=instantanea
+        )
+        assert destino.getvalue() == esperado
+
+    def test_progreso_estimado_desde_la_instantanea(self, tienda_grande):
+        avances = []
+        instantanea = tienda_grande.instantanea_reporte(detallado=True)
+        total = tienda_grande.escribir_reporte_inventario(
+            io.StringIO(),
+            detallado=True,
+            progreso=lambda hechas, estimado: avances.append((hechas, estimado)),
+            instantanea=instantanea,
+        )
+        assert avances == [(total, total)]
@@ -0,0 +1,132 @@
+import copy
+
+import pytest
+
+from models.concretos.mesa import Mesa
+from models.concretos.sillon import Sillon
+from services.descuentos import MAXIMO
+from services.simulador import Escenario, Simulador
+
+
+def _valor_esperado(tienda, escenario):
+    """Valor del escenario calculado mueble por mueble, en centavos."""
+    motor = escenario.motor(tienda._descuentos)
+    total = 0
+    for sku, mueble, _, existencias in tienda._inventario.entradas():
+        factor = escenario.factor(type(mueble))
+        if factor != 1.0:
+            mueble = copy.copy(mueble)
+            mueble.precio_base = mueble.precio_base * factor
+        precio = round(mueble.calcular_precio(), 2)
+        final = round(precio * (1 - motor.descuento(mueble, precio)), 2)
+        total += round(final * 100) * existencias
+    return total / 100
+
+
+@pytest.fixture
+def simulador(tienda):
+    tienda.reponer_existencias(2, 3)
+    tienda.aplicar_descuento("silla", 10)
+    simulador = Simulador(tienda, procesos=1)
+    yield simulador
+    simulador.cerrar()
+
+
+class TestEscenario:
+    def test_categoria_desconocida(self):
+        with pytest.raises(ValueError):
+            Escenario("x").descuento("sillax", 10)
+        with pytest.raises(ValueError):
+            Escenario("x").ajustar_precio_base("mesazz", 10)
+
+    def test_valores_invalidos(self):
+        with pytest.raises(ValueError):
+            Escenario("x").descuento("mesa", 0)
+        with pytest.raises(ValueError):
+            Escenario("x").ajustar_precio_base("mesa", -100)
+        with pytest.raises(ValueError):
+            Escenario("x", politica="la_mejor")
+
+    def test_factor_usa_la_categoria_mas_especifica(self):
+        escenario = Escenario("x").ajustar_precio_base("asientos", 10)
+        escenario.ajustar_precio_base("sofa", -5)
+        assert escenario.factor(Sillon) == pytest.approx(1.1)
+        assert escenario.factor(Mesa) == 1.0
+
+    def test_motor_no_modifica_el_vigente(self, tienda):
+        tienda.aplicar_descuento("silla", 10)
+        motor = Escenario("x").descuento("mesa", 20).motor(tienda._descuentos)
+        assert len(motor.reglas()) == 2
+        assert len(tienda._descuentos.reglas()) == 1
+        reemplazo = Escenario("x", reemplazar=True).descuento("mesa", 20)
+        assert len(reemplazo.motor(tienda._descuentos).reglas()) == 1
+
+
+class TestSimulador:
+    def test_valor_vigente(self, tienda, simulador):
+        vigente = simulador.valor_vigente()
+        assert vigente["delta"] == 0
+        esperado = _valor_esperado(tienda, Escenario("v"))
+        assert vigente["valor"] == pytest.approx(esperado)
+        assert set(vigente["por_tipo"]) == {"Silla", "Mesa", "Sofa", "Armario"}
+
+    @pytest.mark.parametrize(
+        "escenario",
+        [
+            Escenario("Mesas").descuento("mesas", 15),
+            Escenario("Cuero").descuento("muebles", 5, material="cuero"),
+            Escenario("Banda").descuento("todo", 20, precio_min=600, precio_max=1500),
+            Escenario("Sin reglas", reemplazar=True),
+            Escenario("Máximo", politica=MAXIMO).descuento("asientos", 25),
+            Escenario("Precios").ajustar_precio_base("mesa", 10).descuento("sofa", 5),
+        ],
+        ids=lambda escenario: escenario.nombre,
+    )
+    def test_igual_al_calculo_por_mueble(self, tienda, simulador, escenario):
+        (resultado,) = simulador.evaluar([escenario])
+        esperado = _valor_esperado(tienda, escenario)
+        assert resultado["escenario"] == escenario.nombre
+        assert resultado["valor"] == pytest.approx(esperado)
+        assert resultado["delta"] == pytest.approx(
+            esperado - simulador.valor_vigente()["valor"]
+        )
+        assert sum(t["valor"] for t in resultado["por_tipo"].values()) == pytest.approx(
+            resultado["valor"]
+        )
+
+    def test_delta_por_tipo(self, simulador):
+        (resultado,) = simulador.evaluar([Escenario("Mesas").descuento("mesa", 50)])
+        por_tipo = resultado["por_tipo"]
+        assert por_tipo["Mesa"]["delta"] < 0
+        assert por_tipo["Silla"]["delta"] == por_tipo["Sofa"]["delta"] == 0
+
+    def test_congela_el_inventario(self, tienda, simulador):
+        antes = simulador.valor_vigente()
+        tienda.quitar_mueble(tienda.obtener_mueble(1))
+        tienda.aplicar_descuento("todo", 50)
+        assert simulador.valor_vigente() == antes
+        assert len(simulador) == 4
+
+    def test_cerrado(self, simulador):
+        simulador.cerrar()
+        with pytest.raises(ValueError):
+            simulador.evaluar([Escenario("x")])
+        simulador.cerrar()
+
+    def test_pool_de_procesos(self, tienda, simulador):
+        escenarios = [Escenario(f"E{i}").descuento("todo", 10 * i) for i in range(1, 4)]
+        with Simulador(tienda, procesos=2) as paralelo:
+            assert paralelo.evaluar(escenarios) == simulador.evaluar(escenarios)
+
+
+class TestSimularEscenarios:
+    def test_resultado(self, tienda):
+        resultado = tienda.simular_escenarios([Escenario("x").descuento("mesa", 10)], 1)
+        assert resultado["vigente"]["valor"] == tienda.calcular_valor_inventario()
+        assert resultado["escenarios"][0]["delta"] < 0
+
+    def test_no_modifica_la_tienda(self, tienda):
+        antes = tienda.obtener_estadisticas()
+        tienda.simular_escenarios([Escenario("x").ajustar_precio_base("todo", 50)], 1)
+        assert tienda.obtener_estadisticas() == antes
+        assert tienda._descuentos.reglas() == []
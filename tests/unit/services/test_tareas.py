@@ -0,0 +1,89 @@
+import threading
+
+import pytest
+
+from services.tareas import EjecutorTareas, Tarea, TareaCancelada
+
+
+@pytest.fixture
+def ejecutor():
+    ejecutor = EjecutorTareas()
+    yield ejecutor
+    ejecutor.cerrar()
+
+
+def _esperar_cancelacion(iniciada: threading.Event):
+    """Función de tarea que avanza hasta que se pide cancelarla."""
+
+    def funcion(tarea):
+        iniciada.set()
+        while True:
+            tarea.avanzar(1)
+            threading.Event().wait(0.01)
+
+    return funcion
+
+
+class TestTarea:
+    def test_progreso(self):
+        tarea = Tarea("Prueba")
+        assert tarea.progreso == (0, None)
+        tarea.avanzar(2, 5)
+        tarea.avanzar(3)
+        assert tarea.progreso == (3, 5)
+
+    def test_avanzar_tras_cancelar(self):
+        tarea = Tarea("Prueba")
+        tarea.cancelar()
+        assert tarea.cancelada
+        with pytest.raises(TareaCancelada):
+            tarea.avanzar(1)
+
+
+class TestEjecutorTareas:
+    def test_resultado(self, ejecutor):
+        tarea = ejecutor.enviar("Suma", lambda tarea: 1 + 1)
+        assert tarea.resultado(timeout=5) == 2
+        assert tarea.terminada()
+
+    def test_reutiliza_mientras_no_cambie_la_version(self, ejecutor):
+        llamadas = []
+
+        def funcion(tarea):
+            llamadas.append(tarea)
+            return len(llamadas)
+
+        primera = ejecutor.enviar("Cálculo", funcion, clave="c", version=1)
+        assert primera.resultado(timeout=5) == 1
+        assert ejecutor.enviar("Cálculo", funcion, clave="c", version=1) is primera
+        segunda = ejecutor.enviar("Cálculo", funcion, clave="c", version=2)
+        assert segunda.resultado(timeout=5) == 2
+
+    def test_no_reutiliza_tareas_fallidas(self, ejecutor):
+        def fallar(tarea):
+            raise RuntimeError("falla")
+
+        fallida = ejecutor.enviar("Falla", fallar, clave="f", version=1)
+        with pytest.raises(RuntimeError):
+            fallida.resultado(timeout=5)
+        assert ejecutor.enviar("Falla", fallar, clave="f", version=1) is not fallida
+
+    def test_descarta_tareas_canceladas_en_curso(self, ejecutor):
+        iniciada = threading.Event()
+        funcion = _esperar_cancelacion(iniciada)
+        tarea = ejecutor.enviar("Larga", funcion, clave="l", version=1)
+        assert iniciada.wait(5)
+        tarea.cancelar()
+        nueva = ejecutor.enviar("Larga", lambda tarea: "ok", clave="l", version=1)
+        assert nueva is not tarea
+        with pytest.raises(TareaCancelada):
+            tarea.resultado(timeout=5)
+        assert nueva.resultado(timeout=5) == "ok"
+        assert ejecutor.enviar("Larga", funcion, clave="l", version=1) is nueva
+
+    def test_invalidar(self, ejecutor):
+        tarea = ejecutor.enviar("Cálculo", lambda tarea: 1, clave="c", version=1)
+        tarea.resultado(timeout=5)
+        ejecutor.invalidar("c")
+        nueva = ejecutor.enviar("Cálculo", lambda tarea: 1, clave="c", version=1)
+        assert nueva is not tarea
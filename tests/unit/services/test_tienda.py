@@ -0,0 +1,164 @@
+import pytest
+
+import main
+from models.concretos.silla import Silla
+from services.tienda import TiendaMuebles
+
+
+class TestEstadisticas:
+    def test_tienda_vacia(self):
+        estadisticas = TiendaMuebles().obtener_estadisticas()
+        assert estadisticas["total_muebles"] == 0
+        assert estadisticas["valor_inventario"] == 0
+        assert estadisticas["tipos_muebles"] == {}
+
+    def test_valores_agregados(self, tienda, muebles):
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["total_muebles"] == 4
+        assert estadisticas["valor_inventario"] == pytest.approx(
+            sum(m.calcular_precio() for m in muebles)
+        )
+        assert estadisticas["tipos_muebles"] == {"Silla": 1, "Mesa": 1, "Sofa": 1, "Armario": 1}
+        assert tienda.calcular_valor_inventario() == estadisticas["valor_inventario"]
+
+    def test_igual_a_recalcular_tras_cambios(self, tienda, silla, sofa):
+        silla.precio_base = 333.33
+        tienda.realizar_venta(sofa)
+        tienda.agregar_mueble(Silla("Otra", "Pino", "Azul", 99.99))
+        estadisticas = tienda.obtener_estadisticas()
+        inventario = list(tienda._inventario)
+        assert estadisticas["valor_inventario"] == pytest.approx(
+            sum(m.calcular_precio() for m in inventario)
+        )
+        assert estadisticas["valor_por_tipo"]["Silla"] == pytest.approx(
+            sum(m.calcular_precio() for m in inventario if isinstance(m, Silla))
+        )
+        assert estadisticas["total_muebles_vendidos"] == 1
+        assert estadisticas["valor_total_ventas"] == sofa.calcular_precio()
+
+    def test_valor_con_descuentos(self, tienda, silla, muebles):
+        tienda.aplicar_descuento("silla", 10)
+        estadisticas = tienda.obtener_estadisticas()
+        esperado = sum(m.calcular_precio() for m in muebles) - silla.calcular_precio() * 0.1
+        assert estadisticas["valor_inventario_con_descuentos"] == pytest.approx(esperado)
+
+    def test_version_cambia_con_cada_operacion(self, tienda, silla):
+        versiones = [tienda.version]
+        silla.precio_base = 200.0
+        versiones.append(tienda.version)
+        tienda.aplicar_descuento("mesa", 5)
+        versiones.append(tienda.version)
+        tienda.realizar_venta(silla)
+        versiones.append(tienda.version)
+        assert len(set(versiones)) == len(versiones)
+
+
+class TestSkusYVentas:
+    def test_sku_estable_tras_ventas(self, tienda, silla, mesa, armario):
+        sku_armario = tienda.obtener_sku(armario)
+        tienda.realizar_venta(silla)
+        tienda.realizar_venta(mesa)
+        assert tienda.obtener_sku(armario) == sku_armario
+        assert tienda.obtener_mueble(sku_armario) is armario
+        assert tienda.obtener_sku(silla) is None
+
+    def test_venta_por_sku(self, tienda, sofa):
+        venta = tienda.realizar_venta(tienda.obtener_sku(sofa), "Ana")
+        assert venta["mueble"] == sofa.nombre
+        assert venta["cliente"] == "Ana"
+        assert venta["precio_final"] == sofa.calcular_precio()
+        assert sofa not in tienda._inventario
+
+    def test_venta_aplica_descuento(self, tienda, silla):
+        tienda.aplicar_descuento("silla", 25)
+        venta = tienda.realizar_venta(silla)
+        assert venta["descuento"] == 25.0
+        assert venta["precio_final"] == round(silla.calcular_precio() * 0.75, 2)
+
+    def test_venta_de_mueble_ausente(self, tienda, silla):
+        tienda.realizar_venta(silla)
+        assert "error" in tienda.realizar_venta(silla)
+        assert "error" in tienda.realizar_venta(999)
+        assert tienda.obtener_estadisticas()["ventas_realizadas"] == 1
+
+    def test_skus_no_se_reutilizan(self, tienda, silla):
+        tienda.quitar_mueble(tienda.obtener_sku(silla))
+        nuevo = Silla("Nueva", "Pino", "Azul", 90.0)
+        tienda.agregar_mueble(nuevo)
+        assert tienda.obtener_sku(nuevo) == 5
+
+
+class TestVentasLote:
+    def test_vende_todo_el_lote(self, tienda, silla, mesa):
+        resultado = tienda.realizar_ventas_lote([silla, tienda.obtener_sku(mesa)], "Luis")
+        assert resultado["cantidad"] == 2
+        assert resultado["valor_total"] == round(silla.calcular_precio() + mesa.calcular_precio(), 2)
+        assert [venta["mueble"] for venta in resultado["ventas"]] == [silla.nombre, mesa.nombre]
+        assert len(tienda._inventario) == 2
+
+    def test_todo_o_nada(self, tienda, silla, mesa):
+        antes = tienda.obtener_estadisticas()
+        resultado = tienda.realizar_ventas_lote([silla, mesa, 999])
+        assert "error" in resultado
+        assert tienda.obtener_estadisticas() == antes
+
+    def test_item_repetido_sin_existencias(self, tienda, silla):
+        resultado = tienda.realizar_ventas_lote([silla, silla])
+        assert "no hay suficientes unidades" in resultado["error"]
+        assert silla in tienda._inventario
+
+    def test_ventas_comparten_marca_de_tiempo(self, tienda, silla, mesa):
+        ventas = tienda.realizar_ventas_lote([silla, mesa])["ventas"]
+        assert ventas[0]["fecha"] == ventas[1]["fecha"]
+
+
+class TestExistencias:
+    def test_unidades_identicas_comparten_sku(self, silla):
+        tienda = TiendaMuebles()
+        assert "12 unidades" in tienda.agregar_mueble(silla, cantidad=12)
+        sku = tienda.obtener_sku(silla)
+        assert tienda.obtener_existencias(sku) == 12
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["total_muebles"] == 12
+        assert estadisticas["total_productos"] == 1
+        assert estadisticas["valor_inventario"] == pytest.approx(
+            silla.calcular_precio() * 12
+        )
+
+    @pytest.mark.parametrize("cantidad", [0, -1, 1.5])
+    def test_cantidad_invalida(self, silla, cantidad):
+        tienda = TiendaMuebles()
+        assert tienda.agregar_mueble(silla, cantidad=cantidad).startswith("Error")
+        assert len(tienda._inventario) == 0
+
+    def test_mueble_repetido_se_repone(self, tienda, silla):
+        assert tienda.agregar_mueble(silla).startswith("Error")
+        sku = tienda.obtener_sku(silla)
+        assert "3 unidades" in tienda.reponer_existencias(sku, 2)
+        assert tienda.reponer_existencias(999, 1).startswith("Error")
+        assert tienda.reponer_existencias(sku, 0).startswith("Error")
+
+    def test_ventas_descuentan_existencias(self, tienda, mesa):
+        sku = tienda.obtener_sku(mesa)
+        tienda.reponer_existencias(sku, 2)
+        tienda.realizar_venta(mesa)
+        assert tienda.obtener_existencias(sku) == 2
+        assert tienda.obtener_mueble(sku) is mesa
+        resultado = tienda.realizar_ventas_lote([sku, sku])
+        assert resultado["cantidad"] == 2
+        assert tienda.obtener_existencias(sku) == 0
+        assert tienda.obtener_sku(mesa) is None
+
+    def test_lote_no_supera_existencias(self, tienda, mesa):
+        sku = tienda.obtener_sku(mesa)
+        tienda.reponer_existencias(sku, 1)
+        assert "error" in tienda.realizar_ventas_lote([sku, sku, sku])
+        assert tienda.obtener_existencias(sku) == 2
+
+    def test_comedores_del_ejemplo_no_comparten_sillas(self):
+        tienda = TiendaMuebles()
+        main.crear_comedores_ejemplo(tienda)
+        for comedor in tienda._comedores:
+            sillas = list(comedor.sillas)
+            assert len({id(silla) for silla in sillas}) == len(sillas)
+            assert len({silla.nombre for silla in sillas}) == len(sillas)
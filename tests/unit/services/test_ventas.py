@@ -0,0 +1,195 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.ventas import NS_DIA, NS_HORA, LibroVentas, formatear_fecha
+
+BASE = 1_700_000_000 * 10**9
+
+
+def _fila(i, marca=None, tipo="Silla", original=100.0, descuento=0.1):
+    final = round(original * (1 - descuento), 2)
+    return (
+        f"Mueble {i % 3}",
+        f"Cliente {i % 2}",
+        original,
+        descuento,
+        final,
+        BASE + i if marca is None else marca,
+        tipo,
+    )
+
+
+class TestLibroVentas:
+    def test_venta_como_diccionario(self):
+        libro = LibroVentas()
+        libro.agregar(_fila(0, original=250.0))
+        assert libro[0] == {
+            "mueble": "Mueble 0",
+            "cliente": "Cliente 0",
+            "precio_original": 250.0,
+            "descuento": pytest.approx(10.0),
+            "precio_final": 225.0,
+            "fecha": formatear_fecha(BASE),
+        }
+
+    def test_indices_negativos_y_rebanadas(self):
+        libro = LibroVentas()
+        for i in range(5):
+            libro.agregar(_fila(i))
+        assert len(libro) == 5
+        assert libro[-1]["mueble"] == "Mueble 1"
+        assert [venta["cliente"] for venta in libro[1:3]] == ["Cliente 1", "Cliente 0"]
+        assert len(list(libro)) == 5
+
+    def test_fila_conserva_la_tupla(self):
+        libro = LibroVentas()
+        libro.agregar(_fila(4, tipo="Mesa"))
+        assert libro.fila(0) == _fila(4, tipo="Mesa")
+
+    def test_marcas_no_decrecientes(self):
+        libro = LibroVentas()
+        libro.agregar(_fila(0, marca=BASE + 10))
+        libro.agregar(_fila(1, marca=BASE))
+        assert list(libro.columnas()["marcas"]) == [BASE + 10, BASE + 10]
+
+    def test_textos_internados(self):
+        libro = LibroVentas()
+        for i in range(6):
+            libro.agregar(_fila(i))
+        muebles, clientes, tipos = libro.vocabularios()
+        assert muebles == ["Mueble 0", "Mueble 1", "Mueble 2"]
+        assert clientes == ["Cliente 0", "Cliente 1"]
+        assert tipos == ["Silla"]
+
+    def test_valor_total_en_centavos(self):
+        libro = LibroVentas()
+        for i in range(10):
+            libro.agregar(_fila(i, original=0.1, descuento=0.0))
+        assert libro.valor_total() == 1.0
+
+    def test_desde_columnas(self):
+        libro = LibroVentas()
+        for i in range(4):
+            libro.agregar(_fila(i, tipo=["Silla", "Mesa"][i % 2]))
+        copia = LibroVentas.desde_columnas(
+            *libro.vocabularios()[:2], dict(libro.columnas()), libro.vocabularios()[2]
+        )
+        assert list(copia) == list(libro)
+        assert copia.valor_total() == libro.valor_total()
+        assert copia.resumen(BASE, BASE + 10) == libro.resumen(BASE, BASE + 10)
+
+    def test_desde_columnas_sin_tipos(self):
+        libro = LibroVentas()
+        libro.agregar(_fila(0))
+        columnas = dict(libro.columnas())
+        del columnas["tipos"]
+        copia = LibroVentas.desde_columnas(*libro.vocabularios()[:2], columnas)
+        assert copia.vocabularios()[2] == [""]
+        assert list(copia.resumen(BASE, BASE + 1)["por_tipo"]) == ["Desconocido"]
+
+    def test_agregar_venta_en_formato_de_diccionario(self):
+        libro = LibroVentas()
+        libro.agregar_venta(
+            {
+                "mueble": "Sofá",
+                "cliente": "Ana",
+                "precio_original": 500.0,
+                "descuento": 20.0,
+                "precio_final": 400.0,
+                "fecha": "2024-01-02 03:04:05",
+            }
+        )
+        venta = libro[0]
+        assert venta["descuento"] == pytest.approx(20.0)
+        assert venta["fecha"] == "2024-01-02 03:04:05"
+
+
+def _resumen_directo(libro, inicio, fin):
+    """Totales recorriendo todas las ventas, para comparar con los cubos."""
+    ventas = bruto = neto = 0
+    for i in range(len(libro)):
+        _, _, original, _, final, marca, _ = libro.fila(i)
+        if inicio <= marca < fin:
+            ventas += 1
+            bruto += round(original * 100)
+            neto += round(final * 100)
+    return ventas, bruto / 100, neto / 100
+
+
+class TestResumenes:
+    @pytest.fixture
+    def libro(self):
+        rnd = random.Random(3)
+        libro = LibroVentas()
+        marca = BASE
+        for i in range(400):
+            marca += rnd.randrange(NS_HORA // 2)
+            libro.agregar(
+                _fila(
+                    i,
+                    marca=marca,
+                    tipo=rnd.choice(["Silla", "Mesa", "Sofa"]),
+                    original=rnd.randrange(1000, 90000) / 100,
+                    descuento=rnd.choice([0.0, 0.1, 0.25]),
+                )
+            )
+        return libro
+
+    def test_igual_a_recorrer_las_ventas(self, libro):
+        rnd = random.Random(5)
+        marcas = libro.columnas()["marcas"]
+        for _ in range(200):
+            inicio, fin = sorted(
+                rnd.randrange(marcas[0] - NS_DIA, marcas[-1] + NS_DIA) for _ in range(2)
+            )
+            resumen = libro.resumen(inicio, fin)
+            ventas, bruto, neto = _resumen_directo(libro, inicio, fin)
+            assert resumen["ventas"] == ventas
+            assert resumen["bruto"] == pytest.approx(bruto)
+            assert resumen["neto"] == pytest.approx(neto)
+            assert resumen["descuentos"] == pytest.approx(bruto - neto)
+
+    def test_desglose_por_tipo(self, libro):
+        resumen = libro.resumen(0, 2**62)
+        assert resumen["ventas"] == len(libro)
+        assert sum(t["ventas"] for t in resumen["por_tipo"].values()) == len(libro)
+        assert sum(t["neto"] for t in resumen["por_tipo"].values()) == pytest.approx(
+            libro.valor_total()
+        )
+
+    def test_bordes_exclusivos(self, libro):
+        marca = libro.columnas()["marcas"][10]
+        assert libro.resumen(marca, marca)["ventas"] == 0
+        assert libro.resumen(marca, marca + 1)["ventas"] >= 1
+
+    def test_rango_sin_ventas(self):
+        assert LibroVentas().resumen(0, NS_DIA) == {
+            "ventas": 0,
+            "bruto": 0.0,
+            "descuentos": 0.0,
+            "neto": 0.0,
+            "por_tipo": {},
+        }
+
+
+class TestVentasDeLaTienda:
+    def test_realizar_venta_registra_en_el_libro(self, tienda, silla):
+        tienda.aplicar_descuento("silla", 10)
+        venta = tienda.realizar_venta(silla, cliente="Ana")
+        assert venta["cliente"] == "Ana"
+        assert venta["precio_final"] == round(silla.calcular_precio() * 0.9, 2)
+        assert tienda._ventas_realizadas[-1] == venta
+
+    def test_resumen_por_fechas(self, tienda, silla, mesa):
+        tienda.realizar_venta(silla)
+        tienda.realizar_venta(mesa)
+        ahora = datetime.now()
+        resumen = tienda.resumen_ventas(ahora - timedelta(hours=1))
+        assert resumen["ventas"] == 2
+        assert set(resumen["por_tipo"]) == {"Silla", "Mesa"}
+        assert tienda.resumen_ventas(ahora + timedelta(hours=1))["ventas"] == 0
+        assert tienda.resumen_ventas_recientes(24)["neto"] == pytest.approx(
+            silla.calcular_precio() + mesa.calcular_precio()
+        )
@@ -0,0 +1,200 @@
+import io
+import threading
+
+import pytest
+from rich.console import Console
+
+from models.concretos.silla import Silla
+from services.tienda import TiendaMuebles
+from ui.menu import MenuTienda
+
+
+@pytest.fixture
+def tienda_grande():
+    tienda = TiendaMuebles("Tienda Paginada")
+    for i in range(45):
+        tienda.agregar_mueble(Silla(f"Silla {i}", "Pino", "Azul", 50.0 + i))
+    yield tienda
+    tienda.cerrar()
+
+
+@pytest.fixture
+def menu(tienda_grande):
+    menu = MenuTienda(tienda_grande)
+    menu.console = Console(file=io.StringIO(), width=200)
+    yield menu
+    menu._tareas.cerrar()
+
+
+def _responder(monkeypatch, *respuestas):
+    pendientes = iter(respuestas)
+    monkeypatch.setattr("ui.menu.Prompt.ask", lambda *a, **k: next(pendientes))
+
+
+def _espiar_paginas(monkeypatch, menu):
+    paginas = []
+    tabla_pagina = menu._tabla_pagina
+
+    def espiar(muebles, pagina, *args):
+        paginas.append(pagina)
+        return tabla_pagina(muebles, pagina, *args)
+
+    monkeypatch.setattr(menu, "_tabla_pagina", espiar)
+    return paginas
+
+
+class TestTablaPagina:
+    def test_solo_formatea_la_pagina_visible(self, menu, tienda_grande, monkeypatch):
+        consultas = []
+        obtener_precio = tienda_grande.obtener_precio
+        monkeypatch.setattr(
+            tienda_grande,
+            "obtener_precio",
+            lambda mueble: consultas.append(mueble) or obtener_precio(mueble),
+        )
+        tabla = menu._tabla_pagina(tienda_grande._inventario, 1)
+        assert tabla.row_count == MenuTienda.TAM_PAGINA
+        assert len(consultas) == MenuTienda.TAM_PAGINA
+        assert tabla.caption == "Página 2 de 3 · 45 muebles"
+
+    def test_ultima_pagina_incompleta(self, menu, tienda_grande):
+        assert menu._tabla_pagina(tienda_grande._inventario, 2).row_count == 5
+
+    def test_columnas_opcionales(self, menu, tienda_grande):
+        sin_sku = menu._tabla_pagina(tienda_grande._inventario, 0, con_sku=False)
+        con_todo = menu._tabla_pagina(tienda_grande._inventario, 0, con_color=True)
+        assert [c.header for c in sin_sku.columns] == [
+            "Nombre",
+            "Tipo",
+            "Material",
+            "Precio",
+        ]
+        assert [c.header for c in con_todo.columns] == [
+            "SKU",
+            "Nombre",
+            "Tipo",
+            "Material",
+            "Color",
+            "Precio",
+            "Stock",
+        ]
+
+    def test_pagina_tras_snapshot_construye_solo_sus_filas(
+        self, menu, tienda_grande, tmp_path
+    ):
+        ruta = str(tmp_path / "tienda.snap")
+        tienda_grande.guardar_snapshot(ruta)
+        restaurada = TiendaMuebles.cargar_snapshot(ruta)
+        menu.tienda = restaurada
+        tabla = menu._tabla_pagina(restaurada._inventario, 1)
+        construidas = [m for m in restaurada._inventario._muebles if m is not None]
+        assert tabla.row_count == len(construidas) == menu.TAM_PAGINA
+        restaurada.cerrar()
+
+
+class TestPaginacion:
+    def test_navegacion(self, menu, tienda_grande, monkeypatch):
+        paginas = _espiar_paginas(monkeypatch, menu)
+        _responder(monkeypatch, "s", "s", "s", "a", "p 1", "p 99", "x", "q")
+        assert menu._paginar_muebles(tienda_grande._inventario) is None
+        assert paginas == [0, 1, 2, 2, 1, 0, 2, 2]
+
+    def test_una_pagina_no_pregunta(self, menu, monkeypatch):
+        _responder(monkeypatch)
+        menu._paginar_muebles([Silla("Única", "Pino", "Azul", 10.0)])
+
+    def test_elegir_por_sku(self, menu, tienda_grande, monkeypatch):
+        elegido = tienda_grande._inventario[30]
+        sku = tienda_grande.obtener_sku(elegido)
+        _responder(monkeypatch, "e 9999", f"e {sku}")
+        inventario = tienda_grande._inventario
+        assert menu._paginar_muebles(inventario, seleccionar=True) is elegido
+        assert "SKU 9999 inexistente" in menu.console.file.getvalue()
+
+
+class TestSegundoPlano:
+    def test_tarea_lenta_no_bloquea_el_menu(self, menu, monkeypatch):
+        monkeypatch.setattr(MenuTienda, "ESPERA_MAXIMA", 0.05)
+        liberar = threading.Event()
+        resultados = []
+        menu._ejecutar_en_segundo_plano(
+            "Lenta", lambda tarea: liberar.wait(5) and "listo", resultados.append
+        )
+        assert resultados == []
+        assert len(menu._pendientes) == 1
+        liberar.set()
+        menu._pendientes[0][0].resultado(timeout=5)
+        menu._atender_tareas()
+        assert resultados == ["listo"]
+        assert menu._pendientes == []
+
+    def test_tarea_rapida_se_muestra_de_inmediato(self, menu):
+        resultados = []
+        menu._ejecutar_en_segundo_plano("Rápida", lambda tarea: 42, resultados.append)
+        assert resultados == [42]
+        assert menu._pendientes == []
+
+    def test_cancelar_desde_el_menu(self, menu, monkeypatch):
+        monkeypatch.setattr(MenuTienda, "ESPERA_MAXIMA", 0.05)
+        resultados = []
+
+        def larga(tarea):
+            while True:
+                tarea.avanzar(1, 10)
+                threading.Event().wait(0.01)
+
+        menu._ejecutar_en_segundo_plano("Larga", larga, resultados.append)
+        _responder(monkeypatch, "1")
+        menu.gestionar_tareas()
+        assert menu._pendientes == []
+        assert "Larga cancelada" in menu.console.file.getvalue()
+        assert resultados == []
+
+    def test_reporte_informa_progreso(self, menu, tienda_grande, monkeypatch):
+        avances = []
+        escribir = tienda_grande.escribir_reporte_inventario
+
+        def espiar(destino, *args, progreso=None, **kwargs):
+            def registrar(hechas, total):
+                avances.append((hechas, total))
+                progreso(hechas, total)
+
+            return escribir(destino, *args, progreso=registrar, **kwargs)
+
+        monkeypatch.setattr(tienda_grande, "escribir_reporte_inventario", espiar)
+        monkeypatch.setattr("ui.menu.Confirm.ask", lambda *a, **k: False)
+        menu.generar_reporte_interactivo()
+        menu._tareas._cache["reporte"][1].resultado(timeout=5)
+        menu._atender_tareas()
+        tarea = menu._tareas._cache["reporte"][1]
+        assert avances
+        assert tarea.progreso[0] == avances[-1][0]
+        assert "REPORTE DE INVENTARIO" in menu.console.file.getvalue()
+
+    def test_reporte_usa_los_datos_del_momento_del_pedido(
+        self, menu, tienda_grande, monkeypatch
+    ):
+        monkeypatch.setattr(MenuTienda, "ESPERA_MAXIMA", 0.05)
+        monkeypatch.setattr("ui.menu.Confirm.ask", lambda *a, **k: False)
+        liberar = threading.Event()
+        escribir = tienda_grande.escribir_reporte_inventario
+
+        def esperar(*args, **kwargs):
+            liberar.wait(5)
+            return escribir(*args, **kwargs)
+
+        monkeypatch.setattr(tienda_grande, "escribir_reporte_inventario", esperar)
+        menu.generar_reporte_interactivo()
+        # El menú sigue modificando la tienda mientras la tarea espera
+        for i in range(5):
+            tienda_grande.agregar_mueble(Silla(f"Nueva {i}", "Pino", "Azul", 60.0))
+        tienda_grande.realizar_venta(tienda_grande._inventario[0])
+        liberar.set()
+        menu._tareas._cache["reporte"][1].resultado(timeout=5)
+        menu._atender_tareas()
+        assert "Total de muebles: 45 " in menu.console.file.getvalue()
+
+    def test_estadisticas_no_usan_otro_hilo(self, menu, monkeypatch):
+        monkeypatch.setattr(menu, "_ejecutar_en_segundo_plano", pytest.fail)
+        menu.mostrar_estadisticas()
+        assert "Total de muebles" in menu.console.file.getvalue()